@@ -136,6 +136,7 @@ setup(name='terkin',
       entry_points={
           'console_scripts': [
               'terkin = terkin_cpython.main:cli',
+              'terkin-flashlog = terkin_cpython.flashlog:cli',
           ],
       },
 )
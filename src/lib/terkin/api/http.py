@@ -184,9 +184,9 @@ class TerkinHttpApi:
         try:
             query_data = request.QueryParams
             name = query_data['name']
-            log.info('Getting configuration setting "{}"'.format(name))
+            log.info('Getting configuration setting "%s"', name)
             value = TerkinHttpApi.settings.get(name)
-            log.info('Configuration setting "{}" is "{}"'.format(name, value))
+            log.info('Configuration setting "%s" is "%s"', name, value)
             TerkinHttpApi.respond_json(request, value)
 
         except Exception as ex:
@@ -199,11 +199,11 @@ class TerkinHttpApi:
             query_data = request.QueryParams
             name = query_data['name']
             value = request.GetPostedJSONObject()
-            log.info('Setting configuration setting "{}" to "{}"'.format(name, value))
+            log.info('Setting configuration setting "%s" to "%s"', name, value)
             TerkinHttpApi.settings[name] = value
 
             value = TerkinHttpApi.settings.get(name)
-            log.info('Re-reading configuration setting "{}" as "{}"'.format(name, value))
+            log.info('Re-reading configuration setting "%s" as "%s"', name, value)
             TerkinHttpApi.respond_json(request, value)
 
         except Exception as ex:
@@ -222,6 +222,89 @@ class TerkinHttpApi:
 
         request.Response.ReturnNotFound()
 
+    @WebRoute(GET, '/api/v1/reading/last/rich')
+    def get_last_reading_rich(microWebSrv2, request: HttpRequest):
+        try:
+            application = TerkinHttpApi.device.application_info.application
+            dataframe = TerkinHttpApi.storage.last_dataframe
+            richdata = {}
+            if dataframe is not None:
+                richdata = application.get_richdata(dataframe)
+            TerkinHttpApi.respond_json(request, richdata)
+
+        except Exception as ex:
+            log.exc(ex, 'GET last reading request failed')
+            request.Response.ReturnInternalServerError()
+
+    @WebRoute(GET, '/api/v1/timeline')
+    def get_timeline(microWebSrv2, request: HttpRequest):
+        try:
+            application = TerkinHttpApi.device.application_info.application
+            payload = {
+                'current': application.timeline.to_dict(),
+                'history': TerkinHttpApi.device.state.scope('timeline').get('boots', []),
+            }
+            TerkinHttpApi.respond_json(request, payload)
+
+        except Exception as ex:
+            log.exc(ex, 'GET timeline request failed')
+            request.Response.ReturnInternalServerError()
+
+    @WebRoute(GET, '/api/v1/metrics')
+    def get_metrics(microWebSrv2, request: HttpRequest):
+        try:
+            TerkinHttpApi.respond_json(request, TerkinHttpApi.device.metrics.report())
+
+        except Exception as ex:
+            log.exc(ex, 'GET metrics request failed')
+            request.Response.ReturnInternalServerError()
+
+    @WebRoute(GET, '/api/v1/fields')
+    def get_fields(microWebSrv2, request: HttpRequest):
+        try:
+            application = TerkinHttpApi.device.application_info.application
+            TerkinHttpApi.respond_json(request, application.sensor_manager.schema.to_dict())
+
+        except Exception as ex:
+            log.exc(ex, 'GET fields request failed')
+            request.Response.ReturnInternalServerError()
+
+    @WebRoute(GET, '/api/v1/log')
+    def get_log(microWebSrv2, request: HttpRequest):
+        """
+        Fetch recent log records, e.g. ``/api/v1/log?since=42&limit=50``.
+
+        Pass the ``cursor`` of the response as ``since`` parameter with
+        the next request in order to fetch new records only. Use
+        ``format=text`` to get plain text lines.
+        """
+        try:
+            log_buffer = TerkinHttpApi.device.application_info.application.log_buffer
+            if log_buffer is None:
+                request.Response.ReturnNotFound()
+                return
+
+            query_data = request.QueryParams
+            since = int(query_data.get('since', 0))
+            limit = int(query_data.get('limit', 50))
+            records = log_buffer.records(since=since, limit=limit)
+
+            if query_data.get('format') == 'text':
+                lines = ['{:10.4f} {}'.format(record['tdelta'], record['message']) for record in records]
+                TerkinHttpApi.respond_text(request, '\n'.join(lines))
+                return
+
+            payload = {
+                'cursor': records[-1]['seq'] if records else max(since, log_buffer.first_sequence - 1),
+                'missed': max(0, log_buffer.first_sequence - since - 1) if since else 0,
+                'records': records,
+            }
+            TerkinHttpApi.respond_json(request, payload)
+
+        except Exception as ex:
+            log.exc(ex, 'GET log request failed')
+            request.Response.ReturnInternalServerError()
+
     def read_request(request: HttpRequest):
         # Observations show request payloads are capped at ~4308 bytes.
         # https://github.com/jczic/MicroWebSrv/issues/51
@@ -234,7 +317,7 @@ class TerkinHttpApi:
                 if not payload:
                     log.info('Reading finished')
                     raise StopIteration()
-                log.info('Writing {} bytes to buffer'.format(len(payload)))
+                log.info('Writing %s bytes to buffer', len(payload))
                 buffer.write(payload)
             except:
                 break
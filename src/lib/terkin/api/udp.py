@@ -32,20 +32,51 @@ class UdpServer:
     def stop(self):
         self.is_running = False
         log.info("Shutting down UdpServer")
-        self.server_socket.close()
+        if self.server_socket is not None:
+            self.server_socket.close()
 
-    def start_real(self):
+    def bind(self):
         """ """
         import socket
 
-        log.info("Starting UdpServer on {}:{}".format(self.ip, self.port))
+        log.info("Starting UdpServer on %s:%s", self.ip, self.port)
         try:
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.server_socket.bind((self.ip, self.port))
+            return True
 
         except Exception as ex:
-            log.exc(ex, "Failed starting UdpServer on {}:{}".format(self.ip, self.port))
+            log.exc(ex, "Failed starting UdpServer on %s:%s", self.ip, self.port)
+            return False
+
+    async def serve(self, poll_interval=0.25):
+        """
+        Serve requests as a cooperative task on the event loop.
+
+        :param poll_interval: Seconds to yield to other tasks while idle.
+        """
+        from terkin.eventloop import asyncio
+
+        if not self.bind():
+            return
+
+        self.server_socket.setblocking(False)
+        self.is_running = True
+        while self.is_running:
+            try:
+                data, addr = self.server_socket.recvfrom(1024)
+            except OSError:
+                await asyncio.sleep(poll_interval)
+                continue
+
+            self.receive_handler(data, addr)
+            self.server_socket.sendto(data, addr)
+
+    def start_real(self):
+        """ """
+
+        if not self.bind():
             return
 
         try:
@@ -66,6 +97,6 @@ class UdpServer:
         :param addr: 
 
         """
-        log.info('UdpServer received {} from {}'.format(data, addr))
+        log.info('UdpServer received %s from %s', data, addr)
         if callable(self.callback):
             self.callback(data, addr)
@@ -29,7 +29,7 @@ def backup_file(filename, backup_path, backup_count):
 
     # Sanity checks.
     if not file_exists(filename):
-        log.info('File {} does not exist, skipping backup'.format(filename))
+        log.info('File %s does not exist, skipping backup', filename)
         return
 
     #log.info('Preparing backup')
@@ -39,7 +39,7 @@ def backup_file(filename, backup_path, backup_count):
     filepath = os_path.join(backup_path, os_path.basename(filename))
     outfile = RotatingFile(filepath, backup_count)
 
-    log.info('Creating backup of {}'.format(filename))
+    log.info('Creating backup of %s', filename)
     with open(filename, "r") as f:
         outfile.write(f)
 
@@ -81,7 +81,7 @@ class RotatingFile:
             self.rename_file(self.filename, "{}.{}".format(self.filename, 1))
 
         # Write new most recent backup file.
-        log.info('Writing recent backup to {}'.format(self.filename))
+        log.info('Writing recent backup to %s', self.filename)
         with open(self.filename, "w") as outfile:
             #log.info('copyfileobj: {} => {}'.format(buffer, outfile))
             copyfileobj(buffer, outfile)
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import time
+
+from umal import GenericChronometer
+from terkin import logging
+
+log = logging.getLogger(__name__)
+
+
+class ConcurrentJob:
+    """
+    A unit of work to be run by the ``ConcurrentExecutor``.
+
+    The deadline of a job gets armed when a worker picks it up.
+    Long-running jobs consisting of multiple steps, like reading
+    all sensors attached to the same bus, may re-arm the deadline
+    for each step by invoking ``job.arm(timeout)``.
+    """
+
+    def __init__(self, name, target, args=(), timeout=None):
+        self.name = name
+        self.target = target
+        self.args = args
+        self.timeout = timeout
+
+        # Outcome.
+        self.result = None
+        self.error = None
+
+        # Status flags.
+        self.started = False
+        self.done = False
+        self.timed_out = False
+
+        # Deadline in seconds, relative to the executor chronometer.
+        self.deadline = None
+        self.chronometer = None
+
+    def arm(self, timeout=None):
+        """
+        (Re)start the deadline of this job.
+
+        :param timeout: Timeout in seconds. Default: The timeout of the job.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        if timeout is None or self.chronometer is None:
+            self.deadline = None
+        else:
+            self.deadline = self.chronometer.read() + timeout
+
+    def run(self):
+        """
+        Invoke the job target and capture its outcome.
+        """
+        self.started = True
+        self.arm()
+        try:
+            self.result = self.target(self, *self.args)
+        except Exception as ex:
+            self.error = ex
+        self.done = True
+
+    def expired(self, now):
+        """
+        Whether this job is still running beyond its deadline.
+
+        :param now: Current time in seconds, relative to the executor chronometer.
+        """
+        return self.started and not self.done and self.deadline is not None and now > self.deadline
+
+
+class ConcurrentBatch:
+    """
+    Jobs dispatched by the ``ConcurrentExecutor``, see ``dispatch()``.
+    """
+
+    def __init__(self, jobs, budget=None, queue=None):
+        self.jobs = jobs
+        self.pending = list(jobs)
+        self.budget = budget
+        self.queue = queue
+
+
+class ConcurrentExecutor:
+    """
+    Run a number of jobs concurrently and wait for them to finish.
+
+    On CPython, this uses a thread pool from ``concurrent.futures``.
+    On MicroPython, a number of worker threads will be spawned
+    using ``_thread`` for each invocation of ``run()``.
+
+    The calling thread will wait for all jobs to finish while
+    feeding the watchdog. Jobs exceeding their deadline will be
+    abandoned and flagged with ``timed_out``. As threads can not
+    be killed, a hanging job will keep its worker busy, so any
+    subsequent outcome of it will be discarded.
+    """
+
+    def __init__(self, name='worker', max_workers=4, poll_interval=0.025, watchdog=None):
+        self.name = name
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.watchdog = watchdog
+
+        self.chronometer = GenericChronometer()
+
+        # Thread pool on CPython.
+        self.pool = None
+        try:
+            from concurrent.futures import ThreadPoolExecutor
+            self.pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        except ImportError:
+            pass
+
+    def run(self, jobs):
+        """
+        Run all jobs concurrently and wait for their outcomes.
+
+        :param jobs: List of ``ConcurrentJob`` objects.
+        :return: The list of jobs, with outcomes.
+        """
+
+        if not jobs:
+            return jobs
+
+        batch = self.dispatch(jobs)
+        while not self.poll(batch):
+            time.sleep(self.poll_interval)
+
+        return jobs
+
+    def dispatch(self, jobs):
+        """
+        Dispatch jobs to worker threads without waiting for them.
+        Invoke ``poll()`` periodically until it signals completion.
+        This is used by the event loop runtime, see ``terkin.eventloop``.
+
+        :param jobs: List of ``ConcurrentJob`` objects.
+        :return: ``ConcurrentBatch`` object.
+        """
+
+        for job in jobs:
+            job.chronometer = self.chronometer
+
+        # Upper bound for waiting on all jobs, covering the worst case
+        # of all jobs being processed one after another.
+        budget = None
+        if all([job.timeout is not None for job in jobs]):
+            budget = self.chronometer.read() + sum([job.timeout for job in jobs])
+
+        # Dispatch jobs to worker threads.
+        if self.pool is not None:
+            for job in jobs:
+                self.pool.submit(job.run)
+            queue = None
+        else:
+            queue = self.spawn_workers(jobs)
+
+        return ConcurrentBatch(jobs, budget, queue)
+
+    def poll(self, batch):
+        """
+        Check for finished and expired jobs.
+
+        :param batch: ``ConcurrentBatch`` object returned by ``dispatch()``.
+        :return: Whether all jobs have finished or have been abandoned.
+        """
+
+        if self.watchdog is not None:
+            self.watchdog.feed()
+
+        pending = batch.pending
+        now = self.chronometer.read()
+        for job in pending[:]:
+            if job.done:
+                pending.remove(job)
+            elif job.expired(now):
+                log.warning('Job "%s" exceeded its deadline, abandoning it', job.name)
+                job.timed_out = True
+                pending.remove(job)
+
+        if pending and batch.budget is not None and now > batch.budget:
+            for job in pending:
+                log.warning('Job "%s" did not finish in time, abandoning it', job.name)
+                job.timed_out = True
+            del pending[:]
+
+        if pending:
+            return False
+
+        # Prevent workers from picking up jobs which have been abandoned.
+        if batch.queue is not None:
+            del batch.queue[:]
+
+        return True
+
+    def spawn_workers(self, jobs):
+        """
+        Spawn worker threads using ``_thread``.
+
+        :param jobs: List of ``ConcurrentJob`` objects.
+        """
+        import _thread
+        lock = _thread.allocate_lock()
+        queue = list(jobs)
+
+        def worker():
+            while True:
+                with lock:
+                    if not queue:
+                        return
+                    job = queue.pop(0)
+                job.run()
+
+        for _ in range(min(self.max_workers, len(jobs))):
+            _thread.start_new_thread(worker, ())
+
+        return queue
+
+    def shutdown(self):
+        """
+        Release all resources of this executor.
+        """
+        if self.pool is not None:
+            self.pool.shutdown(wait=False)
+            self.pool = None
@@ -50,15 +50,15 @@ class TerkinConfiguration:
 
         self.compute_paths()
 
-        log.info('Starting TerkinConfiguration on path "{}"'.format(self.CONFIG_PATH))
+        log.info('Starting TerkinConfiguration on path "%s"', self.CONFIG_PATH)
         #os.stat(self.CONFIG_PATH)
 
         if self.get('main.backup.enabled', False):
             try:
-                log.info('Ensuring existence of backup directory at "{}"'.format(self.BACKUP_PATH))
+                log.info('Ensuring existence of backup directory at "%s"', self.BACKUP_PATH)
                 ensure_directory(self.BACKUP_PATH)
             except Exception as ex:
-                log.exc(ex, 'Ensuring existence of backup directory at "{}" failed'.format(self.BACKUP_PATH))
+                log.exc(ex, 'Ensuring existence of backup directory at "%s" failed', self.BACKUP_PATH)
 
     def __getitem__(self, key, default=None):
         return self.get(key, default=default)
@@ -139,7 +139,7 @@ class TerkinConfiguration:
                 continue
             thing = deepcopy(value)
             self.purge_protected_settings(thing)
-            log.info('Section "{}": {}'.format(key, json.dumps(thing)))
+            log.info('Section "%s": %s', key, json.dumps(thing))
 
     def purge_protected_settings(self, thing):
         """
@@ -192,7 +192,7 @@ class TerkinConfiguration:
         except OSError:
             return
 
-        log.info('Reading configuration file {}'.format(filepath))
+        log.info('Reading configuration file %s', filepath)
         try:
             with open(filepath, "r") as instream:
                 payload = instream.read()
@@ -200,7 +200,7 @@ class TerkinConfiguration:
                 return data
 
         except Exception as ex:
-            log.exc(ex, 'Reading configuration from "{}" failed'.format(filepath))
+            log.exc(ex, 'Reading configuration from "%s" failed', filepath)
 
     def save(self, filename, instream):
         """Save configuration file, with rotating backup.
@@ -225,11 +225,11 @@ class TerkinConfiguration:
         backup_count = self.get('main.backup.file_count', 7)
 
         # Backup configuration file.
-        log.info('Backing up file {} to {}, keeping a history worth of {} files'.format(filepath, self.BACKUP_PATH, backup_count))
+        log.info('Backing up file %s to %s, keeping a history worth of %s files', filepath, self.BACKUP_PATH, backup_count)
         backup_file(filepath, self.BACKUP_PATH, backup_count)
 
         # Overwrite configuration file.
-        log.info('Saving configuration file {}'.format(filepath))
+        log.info('Saving configuration file %s', filepath)
         with open(filepath, "w") as outstream:
             if isinstance(instream, str):
                 outstream.write(instream)
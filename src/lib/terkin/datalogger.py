@@ -12,13 +12,16 @@ from umal import ApplicationInfo, PlatformInfo
 from terkin import __version__
 from terkin import logging
 from terkin.exception import SensorUnknownError
+from terkin.instrumentation import Timeline, MemoryMonitor
 from terkin.configuration import TerkinConfiguration
 from terkin.device import TerkinDevice
+from terkin.driver import resolve_driver, load_driver
 from terkin.network import SystemWiFiMetrics
 from terkin.sensor import SensorManager, AbstractSensor
+from terkin.sensor.scheduler import SensorScheduler
 from terkin.model import SensorReading, DataFrame
 from terkin.sensor.system import SystemMemoryFree, SystemTemperature, SystemVoltage, SystemUptime
-from terkin.util import gc_disabled
+from terkin.util import gc_disabled, format_exception
 
 log = logging.getLogger(__name__)
 
@@ -30,6 +33,7 @@ class TransientStorage:
 
     def __init__(self):
         self.last_reading = {}
+        self.last_dataframe = None
 
 
 # Maybe refactor to TerkinCore.
@@ -55,17 +59,37 @@ class TerkinDatalogger:
         # Signal startup with first available timestamp.
         log.info('Starting Terkin datalogger')
 
+        # Record durations of the phases from boot to the first transmission.
+        self.timeline = Timeline(offset=self.duty_chrono.read())
+
         # Obtain configuration settings.
         self.settings = TerkinConfiguration()
         self.settings.add(settings)
         self.settings.add_user_file()
 
+        # Select runtime for the main loop.
+        self.runtime = self.get_runtime()
+
+        # Measure heap consumption of the duty cycle phases.
+        self.memory = MemoryMonitor(budgets=self.settings.get('main.memory.budgets'))
+
         # Configure logging.
         logging_enabled = self.settings.get('main.logging.enabled', False)
         if not logging_enabled:
             log.info('Disabling logging to save bytes')
             logging.disable_logging()
 
+        # Persistent log on flash (optional).
+        self.flash_log = None
+        if logging_enabled and self.settings.get('main.logging.flash.enabled', False):
+            self.setup_flash_log()
+
+        # Recent log records in memory, served through the HTTP API (optional).
+        self.log_buffer = None
+        if logging_enabled and self.settings.get('main.logging.buffer.enabled', False):
+            self.log_buffer = logging.RingBufferHandler.from_settings(self.settings.get('main.logging.buffer'))
+            logging.add_handler(self.log_buffer)
+
         # Initialize ApplicationInfo object.
         self.application_info = ApplicationInfo(
             name=self.name, version=self.version, settings=self.settings,
@@ -74,6 +98,11 @@ class TerkinDatalogger:
         # Initialize transient storage.
         self.storage = TransientStorage()
 
+        # Containers for sensor readings, reused across duty cycles.
+        # Alternate between two of them, so the one published to the
+        # transient storage will not be reset while the HTTP API reads it.
+        self.dataframes = [DataFrame(), DataFrame()]
+
         # Initialize device.
         self.device = TerkinDevice(self.application_info)
 
@@ -83,13 +112,44 @@ class TerkinDatalogger:
         # Initialize sensor domain.
         self.sensor_manager = SensorManager(self.settings)
 
+        # Scheduler for reading sensors at individual intervals.
+        self.sensor_scheduler = SensorScheduler(self.device.state.scope('sensors'))
+
+        # Executor for reading sensors concurrently (optional).
+        self.sensor_executor = None
+
+        # Descriptions of sensors and their devices for prettified output, see ``index_descriptions``.
+        self.descriptions = {}
+
+    def setup_flash_log(self):
+        """
+        Write log records to a ring of segment files on flash, see ``terkin.flashlog``.
+        """
+        from terkin.flashlog import FlashLogHandler
+        try:
+            self.flash_log = FlashLogHandler.from_settings(
+                self.settings.get('main.logging.flash'), self.settings.CONFIG_PATH)
+            logging.add_handler(self.flash_log)
+            log.info('Logging to flash at "%s"', self.flash_log.path)
+        except Exception as ex:
+            log.warning('Setting up flash log failed: %s', format_exception(ex))
+
     def setup(self):
 
+        timeline = self.timeline
+
         # Report about wakeup reason and run wakeup tasks.
-        self.device.resume()
+        with timeline.span('resume'):
+            self.device.resume()
+
+        # Restore runtime state from previous duty cycles.
+        with timeline.span('load_state'):
+            self.device.state.load()
+            self.sensor_scheduler.state = self.device.state.scope('sensors')
 
         # Start the watchdog for sanity.
-        self.device.watchdog.start()
+        with timeline.span('watchdog'):
+            self.device.watchdog.start()
 
         # Configure RGB-LED according to settings.
         self.device.configure_rgb_led()
@@ -125,33 +185,92 @@ class TerkinDatalogger:
         # Start networking and telemetry subsystems.
 
         # Conditionally start network services and telemetry if networking is available.
-        try:
-            self.device.start_networking()
-        except Exception as ex:
-            log.exc(ex, 'Networking subsystem failed')
-            self.device.status.networking = False
+        with timeline.span('start_networking'):
+            try:
+                self.device.start_networking()
+            except Exception as ex:
+                log.exc(ex, 'Networking subsystem failed')
+                self.device.status.networking = False
 
-        self.device.start_telemetry()
+        with timeline.span('start_telemetry'):
+            self.device.start_telemetry()
 
         # Todo: Signal readyness by publishing information about the device (Microhomie).
         # e.g. ``self.device.publish_properties()``
 
-        self.setup_sensors()
+        with timeline.span('setup_sensors'):
+            self.setup_sensors()
 
     def setup_sensors(self):
 
+        timeline = self.timeline
+
         # Setup sensors.
         log.info('Setting up sensors')
         self.device.watchdog.feed()
+
+        # Restore field IDs of previous runs before sensors register their fields.
+        schema = self.sensor_manager.schema
+        schema.load(self.settings.CONFIG_PATH + '/' + schema.FILENAME)
+
         bus_settings = self.settings.get('sensors.buses', self.settings.get('sensors.busses', []))
-        self.sensor_manager.setup_buses(bus_settings)
-        self.register_sensors()
-        self.sensor_manager.start_sensors()
+        with timeline.span('setup_buses'):
+            self.sensor_manager.setup_buses(bus_settings)
+        with timeline.span('register_sensors'):
+            self.register_sensors()
+        with timeline.span('start_sensors'):
+            self.sensor_manager.start_sensors()
+        self.index_descriptions()
 
         log.info('Setup finished')
 
     def start(self):
-        self.start_mainloop()
+        if self.runtime == 'eventloop':
+            self.start_eventloop()
+        else:
+            self.start_mainloop()
+
+    def get_runtime(self):
+        """
+        Determine the effective runtime for the main loop.
+
+        - ``mainloop``: Run duty cycles one after another, blocking
+          through reading, transmitting and sleeping.
+        - ``eventloop``: Run sensor readings, telemetry and network
+          services as cooperative tasks on ``uasyncio`` or ``asyncio``.
+
+        The event loop will only be used when the device stays awake
+        between measurements, so it is not available in combination
+        with deep sleep, light sleep or shutoff.
+        """
+
+        runtime = self.settings.get('main.runtime', 'mainloop')
+        if runtime == 'eventloop':
+
+            sleep_modes = ['main.deepsleep', 'main.lightsleep', 'main.shutoff']
+            sleep_modes = [name for name in sleep_modes if self.settings.get(name, False)]
+
+            if sleep_modes:
+                log.warning('Event loop runtime not available in combination with %s, '
+                            'falling back to main loop', sleep_modes)
+                runtime = 'mainloop'
+
+            else:
+                try:
+                    from terkin.eventloop import asyncio
+                except ImportError as ex:
+                    log.exc(ex, 'Event loop runtime not available, falling back to main loop')
+                    runtime = 'mainloop'
+
+        return runtime
+
+    def start_eventloop(self):
+        """
+        Run sensor readings, telemetry and network services as cooperative tasks.
+        """
+        from terkin.eventloop import TerkinEventLoop
+        eventloop = TerkinEventLoop(self)
+        eventloop.run()
 
     def start_mainloop(self):
         """ """
@@ -191,16 +310,23 @@ class TerkinDatalogger:
         self.device.blink_led(0x00000b, count=2)
 
         # Read sensors.
-        readings = self.read_sensors()
+        with self.timeline.span('read_sensors'), self.memory.phase('read_sensors'):
+            self.dataframes.reverse()
+            readings = self.read_sensors(dataframe=self.dataframes[0])
 
         # Remember current reading
         self.storage.last_reading = readings.data_in
+        self.storage.last_dataframe = readings
 
         # Run the garbage collector.
         self.device.run_gc()
 
         # Transmit data.
-        transmission_success = self.transmit_readings(readings)
+        with self.timeline.span('transmit_readings'), self.memory.phase('transmit_readings'):
+            transmission_success = self.transmit_readings(readings)
+
+        # Conclude the timeline after the first transmission.
+        self.finish_timeline()
 
         # Signal transmission outcome.
         if transmission_success:
@@ -214,6 +340,16 @@ class TerkinDatalogger:
         # Give the system some breath.
         machine.idle()
 
+    def finish_timeline(self):
+        """
+        Conclude the boot timeline and add it to the persistent history.
+        """
+        if self.timeline.finished:
+            return
+        history = self.device.state.scope('timeline').setdefault('boots', [])
+        history_size = self.settings.get('main.timeline.history', 3)
+        self.timeline.finish(history=history, history_size=history_size)
+
     def sleep(self):
         """Sleep or shutoff until the next measurement cycle."""
 
@@ -228,20 +364,42 @@ class TerkinDatalogger:
             deepsleep = False
             shutoff = False
             log.info('Device is in maintenance mode. Skipping deep sleep and '
-                     'adjusting sleep time to {} seconds.'.format(interval))
+                     'adjusting sleep time to %s seconds.', interval)
 
         # Prepare device shutdown.
         try:
+            # Wait for telemetry transmissions still running in the background.
+            if (deepsleep or shutoff) and self.device.telemetry is not None:
+                self.device.telemetry.wait()
+
+            # Transmit readings queued for batch transmission, as they
+            # would be lost when cutting the power.
+            if shutoff and self.device.telemetry is not None:
+                self.device.telemetry.flush()
+
             # Shut down sensor peripherals.
             self.sensor_manager.power_off()
 
-            # Shut down networking.
+            # Shut down networking. Connections will not survive this, so wait
+            # for MQTT acknowledgements and close them orderly beforehand.
             if deepsleep or shutoff:
+                from terkin.telemetry.core import TelemetryTransportMQTT
+                TelemetryTransportMQTT.drain_all()
+                from terkin.network.http import HttpConnection
+                HttpConnection.close_all()
                 self.device.networking.stop()
 
         except Exception as ex:
             log.exc(ex, 'Power off failed')
 
+        # Keep runtime state across deep sleep cycles.
+        if deepsleep or shutoff:
+            self.device.state.save()
+
+        # Write buffered log records before going to sleep.
+        if self.flash_log is not None:
+            self.flash_log.flush()
+
         if shutoff:
             # shut off the MCU via DS3231
             self.shutoff()
@@ -254,7 +412,7 @@ class TerkinDatalogger:
             except Exception as ex:
                 log.exc(ex, 'Failed to hibernate, falling back to regular sleep')
                 # Todo: Emit error message here.
-                log.info('Sleeping for {} seconds'.format(interval))
+                log.info('Sleeping for %s seconds', interval)
                 time.sleep(interval)
 
     def get_sleep_time(self):
@@ -297,6 +455,12 @@ class TerkinDatalogger:
         if sleep_time <= 0:
             sleep_time = interval
 
+        # Wake up earlier when sensors with individual intervals will become due.
+        if self.device.status.maintenance is not True:
+            time_until_due = self.sensor_scheduler.get_time_until_due(self.sensor_manager.sensors)
+            if time_until_due is not None and time_until_due < sleep_time:
+                sleep_time = max(time_until_due, SensorScheduler.DUE_TOLERANCE)
+
         return sleep_time
 
     def register_sensors(self):
@@ -332,7 +496,7 @@ class TerkinDatalogger:
 
             # Skip sensor if disabled in configuration.
             if not sensor_info.get('enabled', False):
-                log.debug('Sensor with id={} and type={} is disabled, skipping registration'.format(sensor_id, sensor_type))
+                log.debug('Sensor with id=%s and type=%s is disabled, skipping registration', sensor_id, sensor_type)
                 continue
 
             # Skip WiFi sensor registration when WiFi is disabled.
@@ -363,8 +527,8 @@ class TerkinDatalogger:
 
             # Skip sensor if associated bus is disabled in configuration.
             if sensor_bus is None:
-                log.info('Bus {} for sensor with id={} and type={} is disabled, '
-                         'skipping registration'.format(sensor_info_bus, sensor_id, sensor_type))
+                log.info('Bus %s for sensor with id=%s and type=%s is disabled, '
+                         'skipping registration', sensor_info_bus, sensor_id, sensor_type)
                 return
             sensor_bus_name = sensor_bus.name
 
@@ -375,56 +539,46 @@ class TerkinDatalogger:
             sensor_address = None
 
         # Report sensor registration to user.
-        message = 'Setting up sensor with id={} and type={} on bus={} with address={}'.format(
-            sensor_id, sensor_type, sensor_bus_name, sensor_address)
         if description:
-            message += ' described as "{}"'.format(description)
-        log.info(message)
-
-        # Backward compat.
-        if sensor_type == 'ds18b20':
-            sensor_type = 'ds18x20'
+            log.info('Setting up sensor with id=%s and type=%s on bus=%s with address=%s described as "%s"',
+                     sensor_id, sensor_type, sensor_bus_name, sensor_address, description)
+        else:
+            log.info('Setting up sensor with id=%s and type=%s on bus=%s with address=%s',
+                     sensor_id, sensor_type, sensor_bus_name, sensor_address)
 
         # Registration NG
-        # Run self-registration procedure by invoking
-        # the "includeme()" function on each sensor module.
-        try:
+        # Resolve driver module from registry and run self-registration
+        # procedure by invoking its "includeme()" function.
+        fullname = resolve_driver(sensor_type)
+        if fullname is not None:
+            try:
 
-            # Load sensor module.
-            import terkin.driver
-            modulename = '{}_sensor'.format(sensor_type)
-            fullname = 'terkin.driver.{}'.format(modulename)
-            log.info('Importing module "{}"'.format(fullname))
-            __import__(fullname)
-            module = getattr(terkin.driver, modulename)
+                # Load sensor module.
+                log.info('Importing module "%s"', fullname)
+                includeme = load_driver(fullname)
 
-            # Acquire sensor object.
-            includeme = getattr(module, 'includeme')
-            sensor_object = includeme(self.sensor_manager, sensor_info)
+            except ImportError as ex:
+                log.error('Driver module "%s" could not be imported: %s', fullname, ex)
+                return
 
-            # Register sensor with sensor manager.
-            self.sensor_manager.register_sensor(sensor_object)
+            try:
 
-            return
+                # Acquire sensor object.
+                sensor_object = includeme(self.sensor_manager, sensor_info)
 
-        except ImportError as ex:
-            if not fullname.startswith('terkin.driver.system'):
-                log.error('Driver module "{}" not found'.format(fullname))
+                # Register sensor with sensor manager.
+                self.sensor_manager.register_sensor(sensor_object)
 
-        except AttributeError as ex:
-            if "has no attribute 'includeme'" in str(ex):
-                log.warning('Driver module "{}" is deprecated, "includeme" is missing'.format(fullname))
-            else:
-                log.exc(ex, 'Driver module "{}" failed'.format(fullname))
+            except Exception as ex:
+                log.exc(ex, 'Registering driver module "%s" failed', fullname)
 
-        except Exception as ex:
-            log.exc(ex, 'Registering driver module "{}" failed'.format(fullname))
+            return
 
         # Legacy registration
         try:
             self.register_sensor_legacy(sensor_info, sensor_bus)
         except Exception as ex:
-            log.exc(ex, 'Setting up sensor with id={} and type={} failed'.format(sensor_id, sensor_type))
+            log.exc(ex, 'Setting up sensor with id=%s and type=%s failed', sensor_id, sensor_type)
 
     def register_sensor_legacy(self, sensor_info, sensor_bus):
 
@@ -471,40 +625,81 @@ class TerkinDatalogger:
         # Register sensor object with sensor manager.
         self.sensor_manager.register_sensor(sensor_object)
 
-    def read_sensors(self) -> DataFrame:
+    def read_sensors(self, deadlines=None, dataframe: DataFrame = None) -> DataFrame:
         """
         Read measurements from all sensor objects that have been registered in the sensor_manager.
         Reading is done with the read() function of each respective sensor object.
-        """
 
-        # Power up sensor peripherals.
-        self.sensor_manager.power_on()
+        Sensors supporting the split-phase protocol will get their measurements
+        started up front, so their conversion times will overlap with each other
+        and with reading all other sensors.
 
-        # Collect observations.
-        data = {}
-        richdata = {}
-        readings = []
+        Sensors configured with an individual ``interval`` will only be read
+        when due, otherwise their last reading will be carried forward.
+
+        :param deadlines: Deadlines of measurements which have been started already,
+                          as returned by ``begin_measurements()``. When omitted,
+                          sensors will be scheduled, sensor peripherals will be
+                          powered up and measurements will be started right away.
+        :param dataframe: Container for the readings, which will be reset and reused.
+                          When omitted, a new one will be allocated.
+        """
 
         # Iterate all registered sensors.
         sensors = self.sensor_manager.sensors
-        log.info('Reading %s sensor ports', len(sensors))
+
+        if deadlines is None:
+
+            # Determine which sensors are due within this duty cycle.
+            self.schedule_sensors()
+
+            # Power up sensor peripherals.
+            self.sensor_manager.power_on()
+
+            # Start measurements on all sensors supporting the split-phase protocol.
+            deadlines = self.begin_measurements(self.get_due_sensors())
+
+        due_sensors = self.get_due_sensors()
+
+        # Collect observations.
+        if dataframe is None:
+            dataframe = DataFrame()
+        else:
+            dataframe.reset()
+
+        # Optionally, acquire readings from sensors on independent buses concurrently.
+        outcomes = None
+        if self.settings.get('sensors.concurrent.enabled', False):
+            log.info('Reading %s sensor ports concurrently', len(due_sensors))
+            outcomes = self.read_sensors_concurrently(due_sensors, deadlines)
+        else:
+            log.info('Reading %s sensor ports', len(due_sensors))
+
         for sensor in sensors:
 
-            # Signal sensor reading to user.
             sensorname = sensor.__class__.__name__
-            log.info('Reading sensor port "%s"', sensorname)
 
             # Read sensor port.
             try:
 
-                # Disable garbage collector to guarantee reasonable
-                # realtime behavior before invoking sensor reading.
-                with gc_disabled():
-                    sensor_outcome = sensor.read()
+                is_due = self.sensor_scheduler.is_due(sensor)
+
+                if not is_due:
+                    sensor_outcome = self.sensor_scheduler.get_last_data(sensor)
+                    if sensor_outcome is None:
+                        continue
+                    log.info('Carrying forward last reading of sensor "%s"', sensorname)
 
-                # Power off HX711 after reading
-                if "HX711Sensor" in sensorname:
-                   sensor.power_off()
+                elif outcomes is None:
+                    sensor_outcome = self.read_sensor(sensor, deadlines.get(id(sensor)))
+
+                else:
+                    if id(sensor) not in outcomes:
+                        log.warning('Reading sensor "%s" timed out', sensorname)
+                        continue
+                    sensor_outcome = outcomes[id(sensor)]
+                    if isinstance(sensor_outcome, Exception):
+                        raise sensor_outcome
 
                 # Backward compat.
                 if isinstance(sensor_outcome, SensorReading):
@@ -520,22 +715,22 @@ class TerkinDatalogger:
                 if sensor_data is None or sensor_data is AbstractSensor.SENSOR_NOT_INITIALIZED:
                     continue
 
-                # Round values according to sensor settings.
-                if sensor.settings.get('decimals') is not None:
-                    for key, value in sensor_data.items():
-                        sensor_data[key] = round(sensor_data[key], sensor.settings.get('decimals'))
+                # Apply calibration, unit conversion and rounding according to sensor settings.
+                # Readings carried forward have been processed already.
+                pipeline = getattr(sensor, 'pipeline', None)
+                if is_due and pipeline is not None:
+                    pipeline.apply(sensor_data)
 
-                # Add sensor reading to observations.
-                data.update(sensor_data)
-
-                # Record reading for prettified output.
-                self.record_reading(sensor, sensor_data, richdata)
+                # Remember reading for sensors with individual intervals.
+                if is_due:
+                    self.sensor_scheduler.record(sensor, sensor_data)
 
-                readings.append(sensor_reading)
+                # Add sensor reading to observations.
+                dataframe.add(sensor_reading)
 
             except Exception as ex:
-                # Because of the ``gc_disabled`` context manager used above,
-                # the propagation of exceptions has to be tweaked like that.
+                # Because of the ``gc_disabled`` context manager used within
+                # ``read_sensor``, the propagation of exceptions has to be tweaked like that.
                 log.exc(ex, 'Reading sensor "%s" failed', sensorname)
 
             # Feed the watchdog.
@@ -546,18 +741,204 @@ class TerkinDatalogger:
 
         # Debugging: Print sensor data before running telemetry.
         prettify_log = self.settings.get('sensors.prettify_log', False)
-        if prettify_log:
+        if prettify_log and logging.is_enabled():
             from terkin.util import ddformat
-            log.info('Sensor data:\n\n%s', ddformat(richdata, indent=11))
+            log.info('Sensor data:\n\n%s', ddformat(self.get_richdata(dataframe), indent=11))
         else:
-            log.info('Sensor data:  %s', data)
+            log.info('Sensor data:  %s', dataframe.data_in)
+
+        return dataframe
 
-        # Capture all sensor readings.
-        result = DataFrame()
-        result.readings = readings
-        result.data_in = data
+    def schedule_sensors(self):
+        """
+        Determine which sensors are due within this duty cycle.
+        In maintenance mode, all sensors will be read.
+        """
+        force = self.device.status.maintenance is True
+        return self.sensor_scheduler.schedule(self.sensor_manager.sensors, force=force)
+
+    def get_due_sensors(self):
+        """
+        Return the list of sensors due within this duty cycle.
+        """
+        return [sensor for sensor in self.sensor_manager.sensors if self.sensor_scheduler.is_due(sensor)]
 
-        return result
+    def begin_measurements(self, sensors):
+        """
+        Start measurements on all sensors supporting the split-phase protocol.
+
+        :param sensors: List of sensor objects.
+        :return: Dictionary of deadlines in seconds, relative to the duty cycle
+                 chronometer, keyed by ``id(sensor)``.
+        """
+        deadlines = {}
+        for sensor in sensors:
+            if not hasattr(sensor, 'begin_measurement'):
+                continue
+            sensorname = sensor.__class__.__name__
+            try:
+                delay = sensor.begin_measurement()
+            except Exception as ex:
+                log.exc(ex, 'Starting measurement on sensor "%s" failed', sensorname)
+                continue
+            if delay is not None:
+                log.info('Started measurement on sensor "%s", ready in %s ms', sensorname, delay)
+                deadlines[id(sensor)] = self.duty_chrono.read() + delay / 1000.0
+        return deadlines
+
+    def read_sensor(self, sensor, deadline=None, disable_gc=True):
+        """
+        Read a single sensor object.
+
+        :param sensor: The sensor object.
+        :param deadline: When the measurement has been started already,
+                         wait for this deadline before collecting the result.
+        :param disable_gc: Whether to disable the garbage collector while reading.
+                           Concurrent readers disable it once for all threads instead.
+        :return: The sensor outcome, either a dictionary or a ``SensorReading``.
+        """
+
+        # Signal sensor reading to user.
+        sensorname = sensor.__class__.__name__
+        log.info('Reading sensor port "%s"', sensorname)
+
+        # Wait for the measurement to become ready.
+        if deadline is not None:
+            remaining = deadline - self.duty_chrono.read()
+            if remaining > 0:
+                time.sleep_ms(int(remaining * 1000))
+
+        # Disable garbage collector to guarantee reasonable
+        # realtime behavior before invoking sensor reading.
+        success = False
+        start = time.ticks_ms()
+        try:
+            if disable_gc:
+                with gc_disabled():
+                    sensor_outcome = self.collect_sensor(sensor, deadline)
+            else:
+                sensor_outcome = self.collect_sensor(sensor, deadline)
+            success = sensor_outcome is not None and sensor_outcome is not AbstractSensor.SENSOR_NOT_INITIALIZED
+
+        finally:
+            # Record read latency and outcome.
+            duration = time.ticks_diff(time.ticks_ms(), start)
+            self.device.metrics.record('sensor', self.get_sensor_name(sensor), duration, success=success)
+
+        # Power off HX711 after reading
+        if "HX711Sensor" in sensorname:
+            sensor.power_off()
+
+        return sensor_outcome
+
+    @staticmethod
+    def collect_sensor(sensor, deadline):
+        if deadline is None:
+            return sensor.read()
+        return sensor.collect()
+
+    @staticmethod
+    def get_sensor_name(sensor):
+        """
+        Compute a human readable name for a sensor object.
+        """
+        settings = getattr(sensor, 'settings', None) or {}
+        return settings.get('id', settings.get('type', sensor.__class__.__name__))
+
+    def read_sensors_concurrently(self, sensors, deadlines=None):
+        """
+        Read sensors attached to independent buses concurrently.
+
+        Sensors sharing the same bus will be read one after another
+        within the same job, each one guarded by its own timeout.
+
+        :param sensors: List of sensor objects.
+        :param deadlines: Deadlines of measurements already started, keyed by ``id(sensor)``.
+        :return: Dictionary of sensor outcomes, keyed by ``id(sensor)``.
+                 Failed readings will be represented by their exception.
+                 Readings which timed out will be missing.
+        """
+
+        if self.sensor_executor is None:
+            from terkin.concurrency import ConcurrentExecutor
+            max_workers = self.settings.get('sensors.concurrent.workers', 4)
+            self.sensor_executor = ConcurrentExecutor(
+                name='sensors', max_workers=max_workers, watchdog=self.device.watchdog)
+
+        default_timeout = self.settings.get('sensors.concurrent.timeout', 10.0)
+        deadlines = deadlines or {}
+
+        def read_group(job, group):
+            outcomes = job.outcomes
+            for sensor in group:
+                if job.timed_out:
+                    break
+                job.arm(sensor.settings.get('timeout', default_timeout))
+                try:
+                    outcomes[id(sensor)] = self.read_sensor(sensor, deadlines.get(id(sensor)), disable_gc=False)
+                except Exception as ex:
+                    outcomes[id(sensor)] = ex
+            return outcomes
+
+        # Create one job per sensor group.
+        from terkin.concurrency import ConcurrentJob
+        jobs = []
+        for name, group in self.sensor_manager.get_sensor_groups(sensors).items():
+            timeout = sum([sensor.settings.get('timeout', default_timeout) for sensor in group])
+            job = ConcurrentJob(name, read_group, args=(group,), timeout=timeout)
+            job.outcomes = {}
+            jobs.append(job)
+
+        # Guarantee reasonable realtime behavior for all sensor readings.
+        # ``gc_disabled`` is not thread-safe, so it is only used here, and
+        # not within the worker threads. This also re-enables the garbage
+        # collector when abandoning jobs which are still running.
+        with gc_disabled():
+            self.sensor_executor.run(jobs)
+
+        # Merge outcomes of all jobs.
+        # Also use partial outcomes from jobs which have been abandoned.
+        outcomes = {}
+        for job in jobs:
+            outcomes.update(job.outcomes)
+            if job.error is not None:
+                log.exc(job.error, 'Reading sensor group "%s" failed', job.name)
+
+        return outcomes
+
+    def index_descriptions(self):
+        """
+        Precompute descriptions of all sensors and their devices once,
+        for propagating them to prettified output.
+        """
+        self.descriptions = {}
+        for sensor in self.sensor_manager.sensors:
+            settings = getattr(sensor, 'settings', None) or {}
+            if 'description' not in settings:
+                continue
+            devices = []
+            if hasattr(sensor, 'get_device_description'):
+                for device_settings in settings.get('devices', []):
+                    device_address = device_settings['address'].lower()
+                    try:
+                        device_description = sensor.get_device_description(device_address)
+                    except Exception as ex:
+                        log.warning('Resolving description of device "%s" failed: %s', device_address, ex)
+                        continue
+                    if device_description:
+                        devices.append((device_address, device_description))
+            self.descriptions[id(sensor)] = (settings['description'], devices)
+
+    def get_richdata(self, dataframe: DataFrame):
+        """
+        Materialize readings along with their descriptions, for prettified output.
+
+        :param dataframe: The readings.
+        """
+        richdata = {}
+        for reading in dataframe.readings:
+            self.record_reading(reading.sensor, reading.data, richdata)
+        return richdata
 
     def record_reading(self, sensor, reading, richdata):
         """
@@ -567,20 +948,17 @@ class TerkinDatalogger:
         :param richdata: 
 
         """
+        entry = self.descriptions.get(id(sensor))
         for key, value in reading.items():
             richdata[key] = {'value': value}
-            if hasattr(sensor, 'settings') and 'description' in sensor.settings:
-                richdata[key]['description'] = sensor.settings.get('description')
-                # Hack to propagate the correct detail-description to prettified output.
-                # TODO: Attach settings directly to its reading, while actually reading it.
-                if 'devices' in sensor.settings:
-                    for device_settings in sensor.settings['devices']:
-                        device_address = device_settings['address'].lower()
-                        if device_address in key:
-                            if hasattr(sensor, 'get_device_description'):
-                                device_description = sensor.get_device_description(device_address)
-                                if device_description:
-                                    richdata[key]['description'] = device_description
+            if entry is None:
+                continue
+            description, devices = entry
+            # Propagate the correct detail-description to prettified output.
+            for device_address, device_description in devices:
+                if device_address in key:
+                    description = device_description
+            richdata[key]['description'] = description
 
     def transmit_readings(self, dataframe: DataFrame):
         """
@@ -596,16 +974,26 @@ class TerkinDatalogger:
             return False
 
         telemetry_status = self.device.telemetry.transmit(dataframe)
+
+        return self.evaluate_telemetry_status(telemetry_status)
+
+    def evaluate_telemetry_status(self, telemetry_status):
+        """
+        Report about the outcome of transmitting readings to all telemetry targets.
+
+        :param telemetry_status: Dictionary of outcomes, keyed by channel URI.
+        """
+
         count_total = len(telemetry_status)
         success = all(telemetry_status.values())
 
         # Evaluate telemetry status outcome.
         if success:
-            log.info('Telemetry status: SUCCESS ({}/{})'.format(count_total, count_total))
+            log.info('Telemetry status: SUCCESS (%s/%s)', count_total, count_total)
         else:
             count_failed = len([item for item in telemetry_status.values() if item is not True])
-            log.warning('Telemetry status: FAILURE. {} out of {} targets failed. '
-                        'Status: {}'.format(count_failed, count_total, telemetry_status))
+            log.warning('Telemetry status: FAILURE. %s out of %s targets failed. '
+                        'Status: %s', count_failed, count_total, telemetry_status)
 
         return success
 
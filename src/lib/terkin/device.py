@@ -10,6 +10,8 @@ import machine
 
 from umal import ApplicationInfo
 from terkin import logging
+from terkin.instrumentation import Metrics
+from terkin.persistence import PersistentState
 from terkin.telemetry.core import TelemetryManager, TelemetryAdapter
 from terkin.util import get_device_id
 from terkin.watchdog import Watchdog
@@ -42,6 +44,13 @@ class TerkinDevice:
         self.status = DeviceStatus()
         self.watchdog = Watchdog(device=self, settings=self.settings)
 
+        # Runtime state surviving deep sleep cycles.
+        self.state = PersistentState(
+            self.settings.CONFIG_PATH, file_interval=self.settings.get('main.state.file_interval', 600))
+
+        # Latencies and outcomes of sensor readings and telemetry.
+        self.metrics = Metrics(self.state)
+
         # Conditionally enable terminal on UART0. Default: False.
         #try:
         #    self.terminal = Terminal(self.settings)
@@ -66,10 +75,13 @@ class TerkinDevice:
 
         self.networking = NetworkManager(device=self, settings=self.settings)
 
+        timeline = self.application_info.application.timeline
+
         if self.settings.get('networking.wifi.enabled'):
             # Start WiFi.
             try:
-                self.networking.start_wifi()
+                with timeline.span('wifi'):
+                    self.networking.start_wifi()
 
             except Exception as ex:
                 log.exc(ex, 'Starting WiFi networking failed')
@@ -78,7 +90,8 @@ class TerkinDevice:
 
             # Wait for network stack to come up.
             try:
-                self.networking.wait_for_ip_stack(timeout=5)
+                with timeline.span('ip_stack'):
+                    self.networking.wait_for_ip_stack(timeout=5)
                 self.status.networking = True
             except Exception as ex:
                 log.exc(ex, 'IP stack not available')
@@ -88,7 +101,8 @@ class TerkinDevice:
             log.info("[WiFi] Interface not enabled in settings.")
 
         try:
-            self.networking.start_services()
+            with timeline.span('services'):
+                self.networking.start_services()
         except Exception as ex:
             log.exc(ex, 'Starting network services failed')
 
@@ -100,7 +114,8 @@ class TerkinDevice:
             if is_pycom_lora or is_dragino:
                 if self.settings.get('networking.lora.antenna_attached'):
                     try:
-                        self.networking.start_lora()
+                        with timeline.span('lora'):
+                            self.networking.start_lora()
                         self.status.networking = True
                     except Exception as ex:
                         log.exc(ex, 'Unable to start LoRa subsystem')
@@ -116,7 +131,8 @@ class TerkinDevice:
         # Initialize LTE modem.
         if self.settings.get('networking.lte.enabled'):
             try:
-                self.networking.start_lte()
+                with timeline.span('lte'):
+                    self.networking.start_lte()
                 self.status.networking = True
             except Exception as ex:
                 log.exc(ex, 'Unable to start LTE modem')
@@ -127,7 +143,8 @@ class TerkinDevice:
         # Initialize GPRS modem.
         if self.settings.get('networking.gprs.enabled'):
             try:
-                self.networking.start_gprs()
+                with timeline.span('gprs'):
+                    self.networking.start_gprs()
                 self.status.networking = True
             except Exception as ex:
                 log.exc(ex, 'Unable to start GPRS modem')
@@ -139,7 +156,8 @@ class TerkinDevice:
         ntp_enabled = self.settings.get('networking.ntp.enabled')
         if self.status.networking and ntp_enabled:
             try:
-                self.start_rtc()
+                with timeline.span('ntp'):
+                    self.start_rtc()
             except Exception as ex:
                 log.exc(ex, 'Unable to start/synchronize RTC with NTP')
 
@@ -222,7 +240,8 @@ class TerkinDevice:
         """ """
         log.info('Starting telemetry')
 
-        self.telemetry = TelemetryManager()
+        self.telemetry = TelemetryManager(
+            metrics=self.metrics, concurrent=self.settings.get('telemetry.concurrent'), watchdog=self.watchdog)
 
         # Read all designated telemetry targets from configuration settings.
         telemetry_targets = self.settings.get('telemetry.targets', [])
@@ -427,7 +446,7 @@ class TerkinDevice:
             self.set_wakeup_mode()
 
             # Invoke deep sleep.
-            log.info('Entering deep sleep for {} seconds'.format(interval))
+            log.info('Entering deep sleep for %s seconds', interval)
             #self.terminal.stop()
             machine.deepsleep(int(interval * 1000))
 
@@ -446,12 +465,12 @@ class TerkinDevice:
             machine.idle()
 
             if lightsleep:
-                log.info('Entering light sleep for {} seconds'.format(interval))
+                log.info('Entering light sleep for %s seconds', interval)
                 machine.sleep(int(interval * 1000))
 
             else:
                 # Normal wait.
-                log.info('Waiting for {} seconds'.format(interval))
+                log.info('Waiting for %s seconds', interval)
                 time.sleep(interval)
 
     def resume(self):
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+"""
+Registry of sensor driver modules within ``terkin.driver``.
+
+Each driver module offers an ``includeme(sensor_manager, sensor_info)``
+function for creating the sensor object. Modules will only get imported
+when a sensor of the respective type is enabled in the configuration.
+
+When adding a new ``*_sensor.py`` module, please register it here.
+"""
+import sys
+
+# Map sensor types to driver module names.
+DRIVERS = {
+    'ads1x15': 'ads1x15_sensor',
+    'bme280': 'bme280_sensor',
+    'bmp280': 'bmp280_sensor',
+    'ds18x20': 'ds18x20_sensor',
+    'ds3231': 'ds3231_sensor',
+    'epsolar': 'epsolar_sensor',
+    'gpiozero': 'gpiozero_sensor',
+    'gpsd': 'gpsd_sensor',
+    'hx711': 'hx711_sensor',
+    'hx711_temp_compensated': 'hx711_temp_compensated_sensor',
+    'ina219': 'ina219_sensor',
+    'max17043': 'max17043_sensor',
+    'piusv': 'piusv_sensor',
+    'pytrack': 'pytrack_sensor',
+    'si7021': 'si7021_sensor',
+    'vedirect': 'vedirect_sensor',
+}
+
+# Backward compatibility for sensor types.
+ALIASES = {
+    'ds18b20': 'ds18x20',
+}
+
+
+def resolve_driver(sensor_type):
+    """
+    Resolve sensor type to the full name of its driver module.
+
+    :param sensor_type: Sensor type, in lower case.
+    :return: Full module name or ``None`` when there is no such driver.
+    """
+    sensor_type = ALIASES.get(sensor_type, sensor_type)
+    modulename = DRIVERS.get(sensor_type)
+    if modulename is None:
+        return None
+    return 'terkin.driver.' + modulename
+
+
+def load_driver(fullname):
+    """
+    Import driver module and return its ``includeme`` function.
+
+    :param fullname: Full module name as returned by ``resolve_driver``.
+    """
+    __import__(fullname)
+    return sys.modules[fullname].includeme
@@ -41,6 +41,9 @@ class BME280Sensor(AbstractSensor):
         # Can be overwritten by ``.set_address()``.
         self.address = self.settings.get('address', 0x76)
 
+        # Telemetry field names, computed by ``register_fields()``.
+        self.fieldnames = {}
+
     def start(self):
         """
         Setup the BME280 sensor driver.
@@ -79,6 +82,13 @@ class BME280Sensor(AbstractSensor):
             log.exc(ex, 'BME280 hardware driver failed')
             return False
 
+    def register_fields(self):
+        """
+        Compute telemetry field names once.
+        """
+        for name in ['temperature', 'humidity', 'pressure']:
+            self.fieldnames[name] = self.format_fieldname(name, hex(self.address))
+
     def read(self):
         """
         Read the BME280 sensor.
@@ -126,16 +136,17 @@ class BME280Sensor(AbstractSensor):
 
         # Build telemetry payload.
         # TODO: Push this further into the telemetry domain.
-        fieldnames = values.keys()
-        for name in fieldnames:
-            fieldname = self.format_fieldname(name, hex(self.address))
-            value = values[name]
+        fieldnames = self.fieldnames
+        for name, value in values.items():
+            fieldname = fieldnames.get(name)
+            if fieldname is None:
+                fieldname = self.format_fieldname(name, hex(self.address))
             data[fieldname] = value
 
         if not data:
-            log.warning("I2C device {} has no value: {}".format(self.address, data))
+            log.warning("I2C device %s has no value: %s", self.address, data)
 
-        log.debug("I2C data:     {}".format(data))
+        log.debug("I2C data:     %s", data)
 
         reading = SensorReading()
         reading.sensor = self
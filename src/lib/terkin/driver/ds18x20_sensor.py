@@ -32,6 +32,13 @@ class DS18x20Sensor(AbstractSensor):
     start() & read() are mandatory
     """
 
+    def __init__(self, settings=None):
+
+        super().__init__(settings=settings)
+
+        # Device-specific settings keyed by device address, see ``get_device_settings()``.
+        self.devices_settings = None
+
     def start(self):
         """
         Setup the DS18x20 sensor driver.
@@ -73,6 +80,9 @@ class DS18x20Sensor(AbstractSensor):
             log.exc(ex, 'DS18x20 hardware driver failed')
             return False
 
+    # Maximum conversion time at 12 bit resolution.
+    CONVERSION_TIME_MS = 750
+
     def read(self):
         """
         - Start conversion on all DS18x20 sensors.
@@ -80,31 +90,63 @@ class DS18x20Sensor(AbstractSensor):
         - Read all DS18x20 sensors.
         """
 
-        if self.bus is None or self.driver is None:
+        delay = self.begin_measurement()
+        if delay is None:
             return self.SENSOR_NOT_INITIALIZED
 
-        log.info('Acquire readings from all DS18x20 sensors attached to bus "{}"'.format(self.bus.name))
+        time.sleep_ms(delay)
+
+        return self.collect()
+
+    def begin_measurement(self):
+        """
+        Start conversion on all DS18x20 sensors.
+
+        :return: Milliseconds until conversion will be finished.
+        """
+
+        if self.bus is None or self.driver is None:
+            return None
+
+        log.info('Acquire readings from all DS18x20 sensors attached to bus "%s"', self.bus.name)
 
         # Start conversion on all DS18x20 sensors.
         self.driver.convert_temp()
-        time.sleep_ms(750)
+
+        return self.CONVERSION_TIME_MS
+
+    def collect(self):
+        """
+        Read all DS18x20 sensors after conversion has finished.
+        """
+
+        if self.bus is None or self.driver is None:
+            return self.SENSOR_NOT_INITIALIZED
 
         # Read scratch memory of each sensor.
         data = self.read_devices()
 
         if not data:
-            log.warning('No data from any DS18x20 devices on bus "{}"'.format(self.bus.name))
+            log.warning('No data from any DS18x20 devices on bus "%s"', self.bus.name)
 
-        log.debug('Data from 1-Wire bus "{}" is "{}"'.format(self.bus.name, data))
+        log.debug('Data from 1-Wire bus "%s" is "%s"', self.bus.name, data)
 
         return data
 
+    def register_fields(self):
+        """
+        Register telemetry field names of all DS18x20 devices found on the bus.
+        """
+        for device in self.get_effective_devices():
+            address = self.bus.device_address_ascii(device)
+            self.format_fieldname('temperature', address)
+
     def get_effective_devices(self):
         """
         Return list of all DS18x20 devices.
         """
 
-        log.info('Start conversion for DS18x20 devices on bus "{}"'.format(self.bus.name))
+        log.info('Start conversion for DS18x20 devices on bus "%s"', self.bus.name)
         effective_devices = []
         for device in self.bus.devices:
 
@@ -113,7 +155,7 @@ class DS18x20Sensor(AbstractSensor):
 
             enabled = device_settings.get('enabled')
             if enabled is False:
-                log.info('Skipping DS18x20 device "{}"'.format(address))
+                log.info('Skipping DS18x20 device "%s"', address)
                 continue
 
             effective_devices.append(device)
@@ -130,11 +172,11 @@ class DS18x20Sensor(AbstractSensor):
         for device in devices:
 
             address = self.bus.device_address_ascii(device)
-            log.info('Reading DS18x20 device "{}"'.format(address))
+            log.info('Reading DS18x20 device "%s"', address)
             try:
                 value = self.driver.read_temp(device)
             except Exception as ex:
-                log.exc(ex, "Reading DS18x20 device {} failed".format(address))
+                log.exc(ex, "Reading DS18x20 device %s failed", address)
                 continue
 
             # Evaluate device response.
@@ -152,18 +194,18 @@ class DS18x20Sensor(AbstractSensor):
                     # Apply value offset.
                     offset = self.get_setting(address, 'offset')
                     if offset is not None:
-                        log.info('Adding offset {} to value {} from device "{}"'.format(offset, value, address))
+                        log.info('Adding offset %s to value %s from device "%s"', offset, value, address)
                         value += offset
 
                     # Add value to telemetry message.
                     data[fieldname] = value
 
                 except Exception as ex:
-                    log.exc(ex, 'Processing data from DS18x20 device "{}" failed'.format(address))
+                    log.exc(ex, 'Processing data from DS18x20 device "%s" failed', address)
                     continue
 
             else:
-                log.warning('No response from DS18x20 device "{}"'.format(address))
+                log.warning('No response from DS18x20 device "%s"', address)
 
         return data
 
@@ -189,12 +231,13 @@ class DS18x20Sensor(AbstractSensor):
         # Compute ASCII representation of device address.
         address = self.bus.device_address_ascii(address)
 
-        # Get device-specific settings from configuration.
-        for device_settings in self.settings.get('devices', []):
-            if device_settings['address'].lower() == address:
-                return device_settings
+        # Index device-specific settings from configuration once.
+        if self.devices_settings is None:
+            self.devices_settings = {}
+            for device_settings in self.settings.get('devices', []):
+                self.devices_settings[device_settings['address'].lower()] = device_settings
 
-        return {}
+        return self.devices_settings.get(address, {})
 
     def get_device_description(self, address):
         """
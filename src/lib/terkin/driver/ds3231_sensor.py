@@ -82,9 +82,9 @@ class DS3231Sensor(AbstractSensor):
             data[fieldname] = value
 
         if not data:
-            log.warning("I2C device {} has no value: {}".format(self.address, data))
+            log.warning("I2C device %s has no value: %s", self.address, data)
 
-        log.debug("I2C data:     {}".format(data))
+        log.debug("I2C data:     %s", data)
 
         return data
 
@@ -95,7 +95,7 @@ class DS3231Sensor(AbstractSensor):
         [year,month,day,dotw,hour,minute,second] = self.driver.getDateTime() # get the date/time from the DS3231
         if year > 2019: # check valid data 
             rtc.init((year,month,day,dotw,hour,minute,second,0))    # set date/time
-            log.debug("Time set:     {}".format(rtc.datetime()))
+            log.debug("Time set:     %s", rtc.datetime())
         else:
             log.warning("DS3231 date/time not set, not setting RTC")
 
@@ -80,7 +80,7 @@ class HX711Sensor(AbstractSensor):
         else:
             raise ValueError('ERROR: Unknown HX711 hardware driver "{}"'.format(name))
 
-        log.info('Selected HX711 hardware driver "{}"'.format(name))
+        log.info('Selected HX711 hardware driver "%s"', name)
         self.driver_class = HX711
 
     def start(self):
@@ -95,12 +95,12 @@ class HX711Sensor(AbstractSensor):
 
         # Initialize the HX711 hardware driver.
         log.info('Initializing HX711 sensor with '
-                 'pin_dout={}, pin_pdsck={}, gain={}, scale={}, offset={}'.format(pin_dout, pin_pdsck, gain, scale, offset))
+                 'pin_dout=%s, pin_pdsck=%s, gain=%s, scale=%s, offset=%s', pin_dout, pin_pdsck, gain, scale, offset)
         if self.parameter['dualchannel']:
             scaleB = self.parameter['scaleB']
             offsetB = self.parameter['offsetB']
             log.info('Initializing HX711 sensor channel B with gain=32 '
-                    'scale={}, offset={}'.format(scaleB, offsetB))
+                    'scale=%s, offset=%s', scaleB, offsetB)
 
         try:
             self.loadcell = self.driver_class(pin_dout, pin_pdsck, gain)
@@ -114,7 +114,13 @@ class HX711Sensor(AbstractSensor):
             return True
 
         except Exception as ex:
-            log.exc(ex, 'HX711 hardware driver failed. Reason: {}'.format(ex))
+            log.exc(ex, 'HX711 hardware driver failed. Reason: %s', ex)
+
+    def register_fields(self):
+        """
+        Register telemetry field name of the main weight value.
+        """
+        self.get_fieldname('weight', self.address)
 
     def read(self):
         """ """
@@ -138,7 +144,7 @@ class HX711Sensor(AbstractSensor):
             self.loadcell.set_offset(self.parameter['offset'])
 
             # Propagate main kg value.
-            key = 'weight.{}'.format(address)
+            key = self.get_fieldname('weight', address)
             totalweight = readingA.kg + readingB.kg
             effective_data = {
                 key: totalweight
@@ -146,25 +152,25 @@ class HX711Sensor(AbstractSensor):
             # Propagate _all_ values from HX711 channel A (raw, scale, offset, whatever).
             data = readingA.get_data()
             for key, value in data.items():
-                effective_key = 'scaleA.{}.{}'.format(address, key)
+                effective_key = self.get_fieldname('scaleA', address, key)
                 effective_data[effective_key] = value
             # Propagate _all_ values from HX711 channel B (raw, scale, offset, whatever).
             data = readingB.get_data()
             for key, value in data.items():
-                effective_key = 'scaleB.{}.{}'.format(address, key)
+                effective_key = self.get_fieldname('scaleB', address, key)
                 effective_data[effective_key] = value
 
         else:
 
             # Propagate main kg value.
-            key = 'weight.{}'.format(address)
+            key = self.get_fieldname('weight', address)
             effective_data = {
                 key: readingA.kg
             }
             # Propagate _all_ values from HX711 (raw, scale, offset, whatever).
             data = readingA.get_data()
             for key, value in data.items():
-                effective_key = 'scale.{}.{}'.format(address, key)
+                effective_key = self.get_fieldname('scale', address, key)
                 effective_data[effective_key] = value
 
         return effective_data
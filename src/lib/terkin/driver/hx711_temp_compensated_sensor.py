@@ -76,13 +76,13 @@ class HX711TempCompensationSensor(AbstractSensor):
         compensationFactor = self.parameter['temp_compensation_factor']
 
         compensated_weight = weight + (temperature - tempOffset) * compensationFactor
-        log.info("weight compensation changed weight from '{}' to '{}'".format(weight, compensated_weight))
+        log.info("weight compensation changed weight from '%s' to '%s'", weight, compensated_weight)
         return compensated_weight
 
     def read_temperature(self):
         """ """
         temp_sensor_id = self.parameter['temperature_sensor_id']
-        log.info('reading temperature from {}'.format(temp_sensor_id))
+        log.info('reading temperature from %s', temp_sensor_id)
         temp_sensor = self.sensor_manager.get_sensor_by_id(temp_sensor_id)
         
         temp_sensor_reading = temp_sensor.read()
@@ -98,7 +98,7 @@ class HX711TempCompensationSensor(AbstractSensor):
                 temperature = value
                 break
 
-        log.info('read temperature is {}'.format(temperature))
+        log.info('read temperature is %s', temperature)
         if (temperature == None):
             raise Exception("no temperature available")
 
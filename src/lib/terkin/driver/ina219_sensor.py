@@ -152,9 +152,9 @@ class INA219Sensor(AbstractSensor):
             data[fieldname] = value
 
         if not data:
-            log.warning("I2C device {} has no value: {}".format(self.address, data))
+            log.warning("I2C device %s has no value: %s", self.address, data)
 
-        log.debug("I2C data:     {}".format(data))
+        log.debug("I2C data:     %s", data)
 
         reading = SensorReading()
         reading.sensor = self
@@ -79,9 +79,9 @@ class MAX17043Sensor(AbstractSensor):
             data[fieldname] = value
 
         if not data:
-            log.warning("I2C device {} has no value: {}".format(self.address, data))
+            log.warning("I2C device %s has no value: %s", self.address, data)
 
-        log.debug("I2C data:     {}".format(data))
+        log.debug("I2C data:     %s", data)
 
         return data
 
@@ -80,7 +80,7 @@ class PytrackSensor(AbstractSensor):
         lis2hh12_data = self.read_lis2hh12()
         data.update(lis2hh12_data)
 
-        log.info("Pytrack data: {}".format(data))
+        log.info("Pytrack data: %s", data)
 
         reading = SensorReading()
         reading.sensor = self
@@ -58,7 +58,7 @@ class VEDirectSensor(AbstractSensor):
         self.driver = None
 
     def start(self):
-        log.info('Initializing sensor "Victron Energy VE.Direct" on "{}"'.format(self.device))
+        log.info('Initializing sensor "Victron Energy VE.Direct" on "%s"', self.device)
 
         # Initialize the hardware driver.
         try:
@@ -76,9 +76,7 @@ class VEDirectSensor(AbstractSensor):
                 except Exception as e:
                     log.exc(
                         e,
-                        "Could not start VEDirect interface on device: {}".format(
-                            self.device
-                        ),
+                        "Could not start VEDirect interface on device: %s", self.device,
                     )
                     raise e
 
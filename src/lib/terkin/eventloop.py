@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import machine
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+from terkin import logging
+from terkin.model import DataFrame
+
+log = logging.getLogger(__name__)
+
+
+class TerkinEventLoop:
+    """
+    Cooperative runtime for the datalogger, based on
+    ``uasyncio`` on MicroPython and ``asyncio`` on CPython.
+
+    Instead of blocking through reading, transmitting and
+    sleeping within a single main loop, these run as
+    separate tasks:
+
+    - Sensor readings, waiting for split-phase measurements
+      without blocking other tasks.
+    - Telemetry, consuming readings from a queue, yielding
+      to other tasks between telemetry adapters.
+    - The WiFi connection monitor.
+    - The UDP mode server.
+
+    The HTTP API keeps running on the worker threads of MicroWebSrv2.
+    """
+
+    def __init__(self, datalogger):
+        self.datalogger = datalogger
+        self.settings = datalogger.settings
+        self.device = datalogger.device
+
+        self.running = False
+
+        # Readings pending transmission.
+        self.queue = []
+        self.queue_size = self.settings.get('main.eventloop.queue_size', 10)
+        self.queue_event = None
+
+    def run(self):
+        """
+        Run the event loop forever.
+        """
+        log.info('Starting event loop')
+        asyncio.run(self.main())
+
+    def stop(self):
+        """
+        Signal all tasks to stop.
+        """
+        log.info('Stopping event loop')
+        self.running = False
+        if self.queue_event is not None:
+            self.queue_event.set()
+
+    async def main(self):
+        """
+        Spawn all tasks and wait for them to finish.
+        """
+
+        self.running = True
+        self.queue_event = asyncio.Event()
+
+        tasks = [
+            self.measure_task(),
+            self.telemetry_task(),
+        ]
+
+        for target in self.settings.get('telemetry.targets', []):
+            if target.get('enabled', False) and target.get('endpoint', '').startswith('mqtt:'):
+                tasks.append(self.mqtt_keepalive_task())
+                break
+
+        networking = self.device.networking
+        if networking is not None:
+
+            if networking.wifi_manager is not None:
+                tasks.append(self.wifi_monitor_task(networking.wifi_manager))
+
+            if networking.mode_server is not None:
+                tasks.append(networking.mode_server.serve())
+
+        await asyncio.gather(*tasks)
+
+    async def measure_task(self):
+        """
+        Read all sensors periodically and enqueue readings for transmission.
+        """
+
+        datalogger = self.datalogger
+
+        while self.running:
+
+            # Feed the watchdog timer to keep the system alive.
+            self.device.watchdog.feed()
+
+            # Indicate activity.
+            log.info('--- cycle ---')
+
+            datalogger.duty_chrono.reset()
+            self.device.blink_led(0x00000b, count=2)
+
+            try:
+                with datalogger.memory.phase('read_sensors'):
+                    readings = await self.read_sensors()
+
+                # Remember current reading
+                datalogger.storage.last_reading = readings.data_in
+                datalogger.storage.last_dataframe = readings
+
+                self.enqueue(readings)
+
+            except Exception as ex:
+                log.exc(ex, 'Reading sensors failed')
+
+            # Shut down sensor peripherals.
+            try:
+                datalogger.sensor_manager.power_off()
+            except Exception as ex:
+                log.exc(ex, 'Power off failed')
+
+            # Run the garbage collector.
+            self.device.run_gc()
+
+            # Wait until the next measurement cycle.
+            interval = datalogger.get_sleep_time()
+            self.device.watchdog.adjust_for_interval(interval)
+            log.info('Next measurement in %s seconds', interval)
+            await asyncio.sleep(interval)
+
+    async def read_sensors(self) -> DataFrame:
+        """
+        Start all split-phase measurements and wait for them
+        cooperatively before collecting all readings.
+        """
+
+        datalogger = self.datalogger
+
+        # Determine which sensors are due within this measurement cycle.
+        sensors = datalogger.schedule_sensors()
+
+        # Power up sensor peripherals.
+        datalogger.sensor_manager.power_on()
+
+        # Start measurements on all sensors supporting the split-phase protocol.
+        deadlines = datalogger.begin_measurements(sensors)
+
+        # Yield to other tasks while measurements are in progress.
+        if deadlines:
+            remaining = max(deadlines.values()) - datalogger.duty_chrono.read()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+        return datalogger.read_sensors(deadlines=deadlines)
+
+    def enqueue(self, dataframe: DataFrame):
+        """
+        Submit readings for transmission, dropping
+        the oldest ones when the queue is full.
+
+        :param dataframe: The readings.
+        """
+        self.queue.append(dataframe)
+        while len(self.queue) > self.queue_size:
+            log.warning('Telemetry queue full, dropping oldest readings')
+            self.queue.pop(0)
+        self.queue_event.set()
+
+    async def telemetry_task(self):
+        """
+        Transmit readings from the queue.
+        """
+
+        while self.running:
+
+            await self.queue_event.wait()
+            self.queue_event.clear()
+
+            while self.running and self.queue:
+                dataframe = self.queue.pop(0)
+
+                try:
+                    with self.datalogger.memory.phase('transmit_readings'):
+                        success = await self.transmit_readings(dataframe)
+                except Exception as ex:
+                    log.exc(ex, 'Transmitting readings failed')
+                    success = False
+
+                # Conclude the timeline after the first transmission.
+                self.datalogger.finish_timeline()
+
+                # Signal transmission outcome.
+                if success:
+                    self.device.blink_led(0x00000b)
+                else:
+                    self.device.blink_led(0x0b0000)
+
+                # Run the garbage collector.
+                self.device.run_gc()
+
+                # Give the system some breath.
+                machine.idle()
+
+    async def transmit_readings(self, dataframe: DataFrame):
+        """
+        Transmit readings to all telemetry adapters, one after another.
+        With ``telemetry.concurrent``, transmit to all of them at once.
+
+        Transmissions run on worker threads, while polling for their
+        outcomes from within the event loop, so blocking network I/O
+        will not stall other tasks.
+
+        :param dataframe: The readings.
+        """
+
+        telemetry = self.device.telemetry
+        if telemetry is None:
+            log.warning('Telemetry disabled')
+            return False
+
+        # Without threading support, transmit from within the event
+        # loop, yielding to other tasks between adapters.
+        try:
+            import _thread
+        except ImportError:
+            telemetry_status = {}
+            for adapter in telemetry.adapters:
+                telemetry_status[adapter.channel_uri] = telemetry.transmit_adapter(adapter, dataframe)
+                await asyncio.sleep(0)
+            return self.datalogger.evaluate_telemetry_status(telemetry_status)
+
+        executor = telemetry.get_executor()
+        jobs = telemetry.create_jobs(dataframe)
+        if telemetry.concurrent.get('enabled', False):
+            batches = [jobs]
+        else:
+            batches = [[job] for job in jobs]
+
+        for jobs_batch in batches:
+            batch = executor.dispatch(jobs_batch)
+            while not executor.poll(batch):
+                await asyncio.sleep(executor.poll_interval)
+
+        return self.datalogger.evaluate_telemetry_status(telemetry.collect_outcomes(jobs))
+
+    async def mqtt_keepalive_task(self):
+        """
+        Process MQTT acknowledgements and send keepalive pings
+        between transmissions.
+        """
+
+        from terkin.telemetry.core import TelemetryTransportMQTT
+
+        interval = self.settings.get('main.eventloop.mqtt_poll_interval', 10)
+        while self.running:
+            await asyncio.sleep(interval)
+            try:
+                TelemetryTransportMQTT.poll_all()
+            except Exception as ex:
+                log.exc(ex, 'Polling MQTT connections failed')
+
+    async def wifi_monitor_task(self, wifi_manager):
+        """
+        Monitor WiFi connection and reconnect if required.
+
+        :param wifi_manager: The ``WiFiManager`` instance.
+        """
+
+        log.info('Starting WiFi connection monitor')
+
+        # Prepare information about known WiFi networks.
+        networks_known = wifi_manager.get_configured_stations()
+
+        attempt = 0
+        wifi_manager.is_running = True
+        while self.running and wifi_manager.is_running:
+            attempt, delay = wifi_manager.ensure_connected(networks_known, attempt)
+            await asyncio.sleep(delay)
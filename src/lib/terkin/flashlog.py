@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+"""
+Persistent log on flash, using compact binary records.
+
+Log records are written to a fixed-size ring of segment files. Message
+templates and logger names are kept within a string table and only
+written once per segment, records refer to them by ID. Arguments are
+stored in binary form, formatting takes place when decoding the log,
+see ``FlashLogReader`` and ``terkin-flashlog``.
+
+Segment layout, all numbers little-endian::
+
+    header:  b'TLOG', version (B), sequence number (I)
+    boot:    0x01, epoch seconds (I)
+    define:  0x02, string ID (H), length (H), UTF-8 bytes
+    record:  0x03, milliseconds since boot (I), level (B),
+             name ID (H), template ID (H), number of arguments (B),
+             arguments
+
+Each argument is a tag byte followed by its payload: ``i`` for
+integers (i), ``f`` for floats (f), ``s`` for strings (B length,
+UTF-8 bytes), ``n`` for ``None``, ``t`` and ``F`` for booleans.
+Other values will be stored as strings.
+"""
+import os
+import time
+import struct
+import logging
+
+from terkin.util import ensure_directory, allocate_lock
+
+MAGIC = b'TLOG'
+VERSION = 1
+
+HEADER = '<4sBI'
+HEADER_SIZE = struct.calcsize(HEADER)
+
+BOOT = 0x01
+DEFINE = 0x02
+RECORD = 0x03
+
+# String ID for messages exceeding the string table.
+LITERAL = 0xFFFF
+
+LEVELS = {
+    logging.DEBUG: 'DEBUG',
+    logging.INFO: 'INFO',
+    logging.WARNING: 'WARNING',
+    logging.ERROR: 'ERROR',
+    logging.CRITICAL: 'CRITICAL',
+}
+
+
+def segment_filename(path, index):
+    return '{}/log-{}.bin'.format(path, index)
+
+
+def read_header(filename):
+    """
+    Read segment header.
+
+    :return: Sequence number or ``None`` when the segment is missing or invalid.
+    """
+    try:
+        with open(filename, 'rb') as f:
+            data = f.read(HEADER_SIZE)
+    except OSError:
+        return None
+    if len(data) != HEADER_SIZE:
+        return None
+    magic, version, sequence = struct.unpack(HEADER, data)
+    if magic != MAGIC or version != VERSION:
+        return None
+    return sequence
+
+
+def encode_string(value, limit=255):
+    data = value.encode()
+    if len(data) > limit:
+        data = data[:limit]
+    return data
+
+
+class FlashLogHandler(logging.Handler):
+    """
+    Log handler writing binary records to a ring of segment files on flash.
+
+    Records are buffered in memory and appended to the current segment
+    when the buffer exceeds ``buffer_size``, on records of level ``ERROR``
+    and above and when invoking ``flush()``, e.g. before going to sleep.
+    Each flush runs ``uos.sync()`` once. When a segment is full, writing
+    continues with the next one, overwriting its previous content.
+    Records may be emitted from multiple threads, so encoding and
+    writing them is serialized using a lock. Settings::
+
+        'logging': {
+            'flash': {
+                'enabled': True,
+                'level': 'info',
+                'segments': 4,
+                'segment_size': 16384,
+                'buffer_size': 1024,
+            },
+        },
+    """
+
+    def __init__(self, path, segments=4, segment_size=16384, buffer_size=1024, level=logging.INFO, max_strings=512):
+        super().__init__()
+        self.level = level
+        self.path = path
+        self.segments = segments
+        self.segment_size = segment_size
+        self.buffer_size = buffer_size
+        self.max_strings = max_strings
+
+        # Map strings to their IDs.
+        self.strings = {}
+
+        # IDs of strings already defined within the current segment.
+        self.defined = set()
+
+        self.buffer = bytearray()
+        self.index = 0
+        self.sequence = 0
+        self.position = 0
+
+        # Number of failed writes.
+        self.errors = 0
+
+        # Not named ``lock``, as this is taken by ``logging.Handler`` on CPython.
+        self.mutex = allocate_lock()
+
+        self.open()
+
+    @classmethod
+    def from_settings(cls, settings, path):
+        """
+        Create handler from ``main.logging.flash`` settings.
+
+        :param settings: Flash log settings.
+        :param path: Base path for the ``log`` directory.
+        """
+        level = settings.get('level', 'info').upper()
+        return cls(
+            path=settings.get('path', path + '/log'),
+            segments=settings.get('segments', 4),
+            segment_size=settings.get('segment_size', 16384),
+            buffer_size=settings.get('buffer_size', 1024),
+            level=getattr(logging, level, logging.INFO))
+
+    def open(self):
+        """
+        Continue writing to the most recent segment or start with the first one.
+        """
+        ensure_directory(self.path)
+
+        sequence = None
+        for index in range(self.segments):
+            candidate = read_header(segment_filename(self.path, index))
+            if candidate is not None and (sequence is None or candidate > sequence):
+                sequence = candidate
+                self.index = index
+
+        if sequence is None:
+            self.start_segment(0, 1)
+        else:
+            self.sequence = sequence
+            self.position = os.stat(segment_filename(self.path, self.index))[6]
+            if self.position >= self.segment_size:
+                self.rotate()
+
+        self.buffer.extend(struct.pack('<BI', BOOT, int(time.time())))
+        self.position += 5
+
+    def start_segment(self, index, sequence):
+        """
+        Truncate segment and write its header.
+        """
+        self.index = index
+        self.sequence = sequence
+        self.defined = set()
+        with open(segment_filename(self.path, index), 'wb') as f:
+            f.write(struct.pack(HEADER, MAGIC, VERSION, sequence))
+        self.position = HEADER_SIZE
+
+    def rotate(self):
+        """
+        Continue writing with the next segment.
+        """
+        self.start_segment((self.index + 1) % self.segments, self.sequence + 1)
+
+    def intern(self, value, chunk):
+        """
+        Resolve string to its ID, adding its definition to ``chunk`` on first use within the segment.
+        """
+        string_id = self.strings.get(value)
+        if string_id is None:
+            if len(self.strings) >= self.max_strings:
+                return None
+            string_id = self.strings[value] = len(self.strings)
+        if string_id not in self.defined:
+            data = encode_string(value, 0xFFFF)
+            chunk.extend(struct.pack('<BHH', DEFINE, string_id, len(data)))
+            chunk.extend(data)
+            self.defined.add(string_id)
+        return string_id
+
+    def encode(self, record):
+        """
+        Encode log record, including definitions of new strings.
+        """
+        chunk = bytearray()
+        args = record.args
+        if isinstance(args, dict) or not isinstance(args, tuple):
+            args = (args,) if args else ()
+
+        name_id = self.intern(record.name, chunk)
+        template_id = self.intern(record.msg, chunk) if isinstance(record.msg, str) else None
+        if template_id is None:
+            try:
+                message = record.msg % args if args else record.msg
+            except Exception:
+                message = record.msg
+            template_id = LITERAL
+            args = (str(message),)
+        if name_id is None:
+            name_id = LITERAL
+
+        tdelta = getattr(record, 'tdelta', None)
+        if tdelta is None:
+            tdelta = record.relativeCreated / 1000.0
+
+        chunk.extend(struct.pack(
+            '<BIBHHB', RECORD, int(tdelta * 1000) & 0xFFFFFFFF, record.levelno,
+            name_id, template_id, min(len(args), 255)))
+
+        for arg in args[:255]:
+            if arg is True or arg is False:
+                chunk.extend(b't' if arg else b'F')
+            elif arg is None:
+                chunk.extend(b'n')
+            elif isinstance(arg, int) and -0x80000000 <= arg <= 0x7FFFFFFF:
+                chunk.extend(struct.pack('<ci', b'i', arg))
+            elif isinstance(arg, float):
+                chunk.extend(struct.pack('<cf', b'f', arg))
+            else:
+                data = encode_string(str(arg))
+                chunk.extend(struct.pack('<cB', b's', len(data)))
+                chunk.extend(data)
+
+        return chunk
+
+    def emit(self, record):
+        if record.levelno < self.level:
+            return
+        with self.mutex:
+            try:
+                chunk = self.encode(record)
+                if self.position + len(chunk) > self.segment_size and self.position > HEADER_SIZE:
+                    self.write()
+                    self.rotate()
+                    chunk = self.encode(record)
+                self.buffer.extend(chunk)
+                self.position += len(chunk)
+
+                if len(self.buffer) >= self.buffer_size or record.levelno >= logging.ERROR:
+                    if self.write():
+                        self.sync()
+            except Exception:
+                self.errors += 1
+
+    def write(self):
+        """
+        Append buffered records to the current segment, without syncing.
+        """
+        if not self.buffer:
+            return False
+        try:
+            with open(segment_filename(self.path, self.index), 'ab') as f:
+                f.write(self.buffer)
+        except Exception:
+            self.errors += 1
+
+            # Definitions of strings within the buffer got lost,
+            # so they have to be written again on their next use.
+            self.defined = set()
+
+        self.buffer = bytearray()
+        return True
+
+    def sync(self):
+        try:
+            import uos
+        except ImportError:
+            import os as uos
+        if hasattr(uos, 'sync'):
+            uos.sync()
+
+    def flush(self):
+        """
+        Write buffered records and sync the filesystem.
+        """
+        with self.mutex:
+            if self.write():
+                self.sync()
+
+    def close(self):
+        self.flush()
+
+
+class FlashLogReader:
+    """
+    Decode log records written by ``FlashLogHandler``.
+    """
+
+    def __init__(self, path, segments=None):
+        self.path = path
+        self.segments = segments
+
+    def get_segments(self):
+        """
+        Return filenames of valid segments, oldest first.
+        """
+        candidates = []
+        if self.segments is None:
+            filenames = sorted(
+                self.path + '/' + name for name in os.listdir(self.path)
+                if name.startswith('log-') and name.endswith('.bin'))
+        else:
+            filenames = [segment_filename(self.path, index) for index in range(self.segments)]
+        for filename in filenames:
+            sequence = read_header(filename)
+            if sequence is not None:
+                candidates.append((sequence, filename))
+        return [filename for sequence, filename in sorted(candidates)]
+
+    def read(self):
+        """
+        Decode all segments, yielding dictionaries for boots and log records.
+        """
+        for filename in self.get_segments():
+            with open(filename, 'rb') as f:
+                data = f.read()
+            for entry in self.decode(data):
+                entry['segment'] = filename
+                yield entry
+
+    def decode(self, data):
+        """
+        Decode a single segment. Truncated records at its end will be skipped.
+        """
+        strings = {}
+        offset = HEADER_SIZE
+        size = len(data)
+        try:
+            while offset < size:
+                kind = data[offset]
+                if kind == BOOT:
+                    timestamp, = struct.unpack_from('<I', data, offset + 1)
+                    offset += 5
+                    strings = {}
+                    yield {'type': 'boot', 'time': timestamp}
+
+                elif kind == DEFINE:
+                    string_id, length = struct.unpack_from('<HH', data, offset + 1)
+                    offset += 5
+                    strings[string_id] = bytes(data[offset:offset + length]).decode()
+                    offset += length
+
+                elif kind == RECORD:
+                    tdelta, level, name_id, template_id, count = struct.unpack_from('<IBHHB', data, offset + 1)
+                    offset += 11
+                    args = []
+                    for _ in range(count):
+                        tag = data[offset:offset + 1]
+                        offset += 1
+                        if tag == b'i':
+                            args.append(struct.unpack_from('<i', data, offset)[0])
+                            offset += 4
+                        elif tag == b'f':
+                            args.append(struct.unpack_from('<f', data, offset)[0])
+                            offset += 4
+                        elif tag == b's':
+                            length = data[offset]
+                            args.append(bytes(data[offset + 1:offset + 1 + length]).decode())
+                            offset += 1 + length
+                        elif tag == b'n':
+                            args.append(None)
+                        elif tag in (b't', b'F'):
+                            args.append(tag == b't')
+                        else:
+                            raise ValueError('Unknown argument tag {}'.format(tag))
+                    if offset > size:
+                        break
+                    yield {
+                        'type': 'record',
+                        'tdelta': tdelta / 1000.0,
+                        'level': level,
+                        'levelname': LEVELS.get(level, str(level)),
+                        'name': strings.get(name_id, '?'),
+                        'template': strings.get(template_id) if template_id != LITERAL else None,
+                        'args': args,
+                        'message': self.format_message(strings.get(template_id), args),
+                    }
+
+                else:
+                    raise ValueError('Unknown record type {}'.format(kind))
+
+        except Exception:
+            return
+
+    @staticmethod
+    def format_message(template, args):
+        if template is None:
+            return ' '.join(str(arg) for arg in args)
+        if not args:
+            return template
+        try:
+            return template % tuple(args)
+        except Exception:
+            return '{} {}'.format(template, args)
+
+    @staticmethod
+    def format_entry(entry):
+        """
+        Format entry like the console log output.
+        """
+        if entry['type'] == 'boot':
+            return '---------- boot at {} ----------'.format(entry['time'])
+        return '{:10.4f} [{:<28}] {:<7}: {}'.format(
+            entry['tdelta'], entry['name'], entry['levelname'], entry['message'])
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import gc
+import sys
+
+from umal import GenericChronometer
+from terkin import logging
+from terkin.util import allocate_lock
+
+log = logging.getLogger(__name__)
+
+
+class TimelineSpan:
+    """
+    Context manager for timing a single phase on the timeline.
+    """
+
+    def __init__(self, timeline, name):
+        self.timeline = timeline
+        self.name = name
+        self.entry = None
+
+    def __enter__(self):
+        self.entry = self.timeline.begin(self.name)
+        return self
+
+    def __exit__(self, *exc_details):
+        self.timeline.end(self.entry)
+
+
+class Timeline:
+    """
+    Record durations of the phases from boot to the first transmission.
+
+    Spans can be nested, their names will be joined by dots,
+    e.g. ``start_networking.wifi``. All times are in milliseconds,
+    relative to the start of the bootloader.
+
+    Usage::
+
+        with timeline.span('start_networking'):
+            ...
+    """
+
+    def __init__(self, offset=0.0):
+
+        # Seconds elapsed before the timeline has been started.
+        self.offset = offset
+
+        self.chronometer = GenericChronometer()
+
+        # List of spans, each one being a list of ``[name, start, duration]``.
+        self.spans = []
+        self.stack = []
+
+        self.finished = False
+        self.total = None
+
+    def now(self):
+        """
+        Return milliseconds elapsed since boot.
+        """
+        return int((self.offset + self.chronometer.read()) * 1000)
+
+    def span(self, name):
+        """
+        Create a context manager for timing a phase.
+
+        :param name: Name of the phase.
+        """
+        return TimelineSpan(self, name)
+
+    def begin(self, name):
+        """
+        Start timing a phase.
+
+        :param name: Name of the phase.
+        """
+        self.stack.append(name)
+        entry = ['.'.join(self.stack), self.now(), None]
+        if not self.finished:
+            self.spans.append(entry)
+        return entry
+
+    def end(self, entry):
+        """
+        Stop timing a phase.
+
+        :param entry: The span entry returned by ``begin()``.
+        """
+        entry[2] = self.now() - entry[1]
+        if self.stack:
+            self.stack.pop()
+
+    def finish(self, history=None, history_size=3):
+        """
+        Stop recording and add the timeline to the history of previous boots.
+
+        :param history: List of timelines from previous boots, e.g. from the persistent state.
+        :param history_size: How many timelines to keep around.
+        """
+        if self.finished:
+            return
+        self.finished = True
+        self.total = self.now()
+
+        log.info('Boot timeline:\n%s', self.format_summary())
+
+        if history is not None:
+            history.append(self.to_dict())
+            while len(history) > history_size:
+                history.pop(0)
+
+    def to_dict(self):
+        """ """
+        return {
+            'total': self.total,
+            'spans': [list(entry) for entry in self.spans],
+        }
+
+    def format_summary(self):
+        """
+        Format the timeline as a table for log output.
+        """
+        lines = []
+        for name, start, duration in self.spans:
+            if duration is None:
+                duration = '-'
+            lines.append('{:>8} ms {:>8} ms  {}'.format(start, duration, name))
+        lines.append('{:>8} ms {:>8}     {}'.format(self.total, '', 'total'))
+        return '\n'.join(lines)
+
+
+class Metrics:
+    """
+    Record latencies and outcomes of operations within the duty cycle,
+    e.g. reading sensors and transmitting telemetry data, into compact
+    histograms with fixed buckets.
+
+    The histograms are kept within the ``metrics`` namespace of the
+    persistent state, in order to survive deep sleep cycles when it is
+    stored within RTC memory. Each one is a dictionary of these items:
+
+    - ``b``: Counts per bucket, see ``BUCKETS``.
+    - ``n``: Number of operations.
+    - ``f``: Number of failed operations.
+    - ``t``: Total duration in milliseconds.
+    - ``m``: Maximum duration in milliseconds.
+    - ``s``: Total size in bytes, if applicable.
+    """
+
+    # Upper bounds of histogram buckets in milliseconds.
+    # The last bucket will take all slower operations.
+    BUCKETS = [10, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+    def __init__(self, state):
+        """
+        :param state: The ``PersistentState`` instance.
+        """
+        self.state = state
+
+        # Operations may be recorded from concurrent worker threads.
+        self.lock = allocate_lock()
+
+    def get_histograms(self, kind):
+        """
+        Return histograms for the designated kind of operation.
+
+        :param kind: Kind of operation, e.g. "sensor" or "telemetry".
+        """
+        return self.state.scope('metrics').setdefault(kind, {})
+
+    def record(self, kind, name, duration, success=True, size=None):
+        """
+        Record a single operation.
+
+        :param kind: Kind of operation, e.g. "sensor" or "telemetry".
+        :param name: Name of the sensor or telemetry channel.
+        :param duration: Duration in milliseconds.
+        :param success: Whether the operation succeeded.
+        :param size: Size of the payload in bytes, if applicable.
+        """
+        index = 0
+        for bound in self.BUCKETS:
+            if duration <= bound:
+                break
+            index += 1
+
+        with self.lock:
+            histograms = self.get_histograms(kind)
+            histogram = histograms.get(name)
+            if histogram is None:
+                histogram = {'b': [0] * (len(self.BUCKETS) + 1), 'n': 0, 'f': 0, 't': 0, 'm': 0, 's': 0}
+                histograms[name] = histogram
+
+            histogram['b'][index] += 1
+            histogram['n'] += 1
+            histogram['t'] += duration
+            if duration > histogram['m']:
+                histogram['m'] = duration
+            if not success:
+                histogram['f'] += 1
+            if size is not None:
+                histogram['s'] += size
+
+    def report(self):
+        """
+        Return a structured report about all histograms.
+        """
+        labels = ['<={}ms'.format(bound) for bound in self.BUCKETS]
+        labels.append('>{}ms'.format(self.BUCKETS[-1]))
+
+        report = {}
+        with self.lock:
+            for kind in ['sensor', 'telemetry']:
+                entries = {}
+                for name, histogram in self.get_histograms(kind).items():
+                    count = histogram['n']
+                    entry = {
+                        'count': count,
+                        'failures': histogram['f'],
+                        'latency_avg': histogram['t'] / count if count else None,
+                        'latency_max': histogram['m'],
+                        'histogram': dict(zip(labels, histogram['b'])),
+                    }
+                    if kind == 'telemetry':
+                        entry['bytes_total'] = histogram['s']
+                    entries[name] = entry
+                report[kind] = entries
+
+        return report
+
+
+class MemoryPhase:
+    """
+    Context manager for measuring the heap consumption of a single phase.
+    """
+
+    def __init__(self, monitor, name):
+        self.monitor = monitor
+        self.name = name
+        self.token = None
+
+    def __enter__(self):
+        self.token = self.monitor.begin()
+        return self
+
+    def __exit__(self, *exc_details):
+        self.monitor.end(self.name, self.token)
+
+
+class MemoryMonitor:
+    """
+    Measure heap consumption of the phases within the duty cycle
+    and warn when exceeding the configured budgets.
+
+    On MicroPython, this records the decrease of ``gc.mem_free()``
+    in bytes. As the garbage collector might kick in while running
+    a phase, this is only an approximation of the allocated memory.
+    On CPython, the monitor is disabled. The testsuite uses a variant
+    based on ``tracemalloc`` instead.
+
+    Usage::
+
+        with memory.phase('read_sensors'):
+            ...
+    """
+
+    def __init__(self, budgets=None):
+        """
+        :param budgets: Dictionary of phase names to budgets in bytes.
+        """
+        self.budgets = budgets or {}
+        self.enabled = sys.implementation.name == 'micropython' and hasattr(gc, 'mem_free')
+
+        # Bytes allocated per phase, from the last run.
+        self.deltas = {}
+
+        # Phases which exceeded their budgets, from the last run.
+        self.exceeded = {}
+
+    def phase(self, name):
+        """
+        Create a context manager for measuring a phase.
+
+        :param name: Name of the phase.
+        """
+        return MemoryPhase(self, name)
+
+    def begin(self):
+        """
+        Start measuring a phase.
+        """
+        if not self.enabled:
+            return None
+        return gc.mem_free()
+
+    def end(self, name, token):
+        """
+        Stop measuring a phase.
+
+        :param name: Name of the phase.
+        :param token: The value returned by ``begin()``.
+        """
+        if token is None:
+            return
+        self.record(name, token - gc.mem_free())
+
+    def record(self, name, delta):
+        """
+        Record the memory allocated by a phase and check it against its budget.
+
+        :param name: Name of the phase.
+        :param delta: Allocated memory in bytes.
+        """
+        self.deltas[name] = delta
+        self.exceeded.pop(name, None)
+        budget = self.budgets.get(name)
+        if budget is not None and delta > budget:
+            self.exceeded[name] = delta
+            log.warning('Memory budget exceeded in phase "%s": Allocated %s bytes, budget is %s bytes',
+                        name, delta, budget)
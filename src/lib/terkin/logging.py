@@ -2,16 +2,20 @@
 # (c) 2019 Richard Pobering <richard@hiveeyes.org>
 # (c) 2019 Andreas Motl <andreas@hiveeyes.org>
 # License: GNU General Public License, Version 3
+import struct
 import logging
 from logging import Logger, StreamHandler, Formatter
 from logging import DEBUG, INFO, WARNING, ERROR, CRITICAL
-from terkin.util import PycomChronometer, get_platform_info
+from terkin.util import PycomChronometer, get_platform_info, allocate_lock
 from umal import GenericChronometer
 
 
 # Keep track of time since boot.
 _chrono = None
 
+# Handlers added to all loggers, see ``add_handler``.
+_handlers = []
+
 
 def get_chronometer():
     """
@@ -50,6 +54,161 @@ class TimedLogRecord(logging.LogRecord):
             self.tdelta = 0
 
 
+class RingBufferHandler(logging.Handler):
+    """
+    Keep the most recent log records within a fixed amount of memory.
+
+    Records are stored as formatted messages within a preallocated
+    ``bytearray`` of ``size`` bytes, the oldest ones get dropped to make
+    room for new ones. Each record gets a sequence number, so clients
+    can fetch records incrementally, see ``records()`` and the
+    ``/api/v1/log`` endpoint of ``terkin.api.http``. Records may be
+    written and fetched from different threads, so access to the
+    buffer is serialized using a lock. Settings::
+
+        'logging': {
+            'buffer': {
+                'enabled': True,
+                'level': 'info',
+                'size': 4096,
+            },
+        },
+    """
+
+    # Message length (H), sequence number (I), level (B), milliseconds since boot (I).
+    HEADER = '<HIBI'
+    HEADER_SIZE = 11
+
+    def __init__(self, size=4096, level=logging.INFO, max_length=200):
+        """
+        :param size: Size of the buffer in bytes.
+        :param level: Minimum level of records.
+        :param max_length: Truncate messages to this number of characters.
+        """
+        super().__init__()
+        self.level = level
+        self.size = size
+        self.max_length = max_length
+
+        self.buffer = bytearray(size)
+        self.header = bytearray(self.HEADER_SIZE)
+
+        # Offsets of the oldest record and of the next record to write.
+        self.head = 0
+        self.tail = 0
+
+        # Number of bytes and records stored.
+        self.used = 0
+        self.count = 0
+
+        # Sequence number of the next record.
+        self.sequence = 1
+
+        # Not named ``lock``, as this is taken by ``logging.Handler`` on CPython.
+        self.mutex = allocate_lock()
+
+    @classmethod
+    def from_settings(cls, settings):
+        level = settings.get('level', 'info').upper()
+        return cls(
+            size=settings.get('size', 4096),
+            level=getattr(logging, level, logging.INFO))
+
+    @property
+    def first_sequence(self):
+        """Sequence number of the oldest record."""
+        return self.sequence - self.count
+
+    def emit(self, record):
+        if record.levelno < self.level:
+            return
+        try:
+            message = record.msg
+            if record.args:
+                message = message % record.args
+        except Exception:
+            message = record.msg
+        data = str(message)[:self.max_length].encode()
+
+        length = self.HEADER_SIZE + len(data)
+        if length > self.size:
+            return
+
+        tdelta = getattr(record, 'tdelta', 0) or 0
+        with self.mutex:
+
+            # Drop the oldest records until there is enough room.
+            while self.size - self.used < length:
+                self.drop()
+
+            struct.pack_into(
+                self.HEADER, self.header, 0,
+                len(data), self.sequence, record.levelno, int(tdelta * 1000) & 0xFFFFFFFF)
+            self.write(self.header)
+            self.write(data)
+
+            self.used += length
+            self.count += 1
+            self.sequence += 1
+
+    def write(self, data):
+        """Copy data to the buffer at its tail, wrapping around at its end."""
+        buffer = self.buffer
+        size = self.size
+        tail = self.tail
+        length = len(data)
+        first = min(length, size - tail)
+        if first == length:
+            buffer[tail:tail + length] = data
+        else:
+            view = memoryview(data)
+            buffer[tail:size] = view[:first]
+            buffer[0:length - first] = view[first:]
+        self.tail = (tail + length) % size
+
+    def read(self, offset, length):
+        """Copy data from the buffer, wrapping around at its end."""
+        end = offset + length
+        if end <= self.size:
+            return self.buffer[offset:end]
+        return self.buffer[offset:] + self.buffer[:end - self.size]
+
+    def drop(self):
+        """Drop the oldest record."""
+        size = self.size
+        head = self.head
+        length = self.HEADER_SIZE + (self.buffer[head] | (self.buffer[(head + 1) % size] << 8))
+        self.head = (head + length) % size
+        self.used -= length
+        self.count -= 1
+
+    def records(self, since=0, limit=None):
+        """
+        Return records with sequence numbers greater than ``since``, oldest first.
+
+        :param since: Sequence number of the last record already fetched.
+        :param limit: Maximum number of records.
+        """
+        results = []
+        with self.mutex:
+            offset = self.head
+            for _ in range(self.count):
+                length, sequence, level, tdelta = struct.unpack(
+                    self.HEADER, self.read(offset, self.HEADER_SIZE))
+                if sequence > since:
+                    if limit is not None and len(results) >= limit:
+                        break
+                    message = self.read((offset + self.HEADER_SIZE) % self.size, length)
+                    results.append({
+                        'seq': sequence,
+                        'level': level,
+                        'tdelta': tdelta / 1000.0,
+                        'message': bytes(message).decode(),
+                    })
+                offset = (offset + self.HEADER_SIZE + length) % self.size
+        return results
+
+
 class ExtendedLogger(Logger):
     """ """
 
@@ -101,10 +260,31 @@ def getLogger(name=None, level=logging.INFO):
         sh.setFormatter(Formatter(log_format, style='%'))
 
         l.addHandler(sh)
+
+        for handler in _handlers:
+            l.addHandler(handler)
+
     _loggers[name] = l
     return l
 
 
+def add_handler(handler):
+    """
+    Add log handler to all existing and future loggers.
+
+    :param handler: Log handler, e.g. ``terkin.flashlog.FlashLogHandler``.
+    """
+    _handlers.append(handler)
+    try:
+        from logging import _loggers
+    except ImportError:
+        logging.getLogger().addHandler(handler)
+        return
+
+    for logger in _loggers.values():
+        logger.addHandler(handler)
+
+
 def noop(*args, **kwargs):
     """
 
@@ -120,11 +300,29 @@ loggers_backup = {
     'ExtendedLogger': ExtendedLogger.log,
 }
 
+# Whether logging is enabled.
+_enabled = True
+
+
+def is_enabled():
+    """
+    Whether logging is enabled.
+
+    Use this to skip computing expensive log arguments. Otherwise, pass
+    arguments to the log call instead of formatting the message upfront,
+    so formatting only happens when the message will be emitted::
+
+        log.info('Reading sensor "%s"', name)
+    """
+    return _enabled
+
 
 def disable_logging():
     """ 
     Disabe logging.
     """
+    global _enabled
+    _enabled = False
     Logger.log = noop
     ExtendedLogger.log = noop
 
@@ -133,5 +331,7 @@ def enable_logging():
     """ 
     Enable logging.
     """
+    global _enabled
+    _enabled = True
     Logger.log = loggers_backup['Logger']
     ExtendedLogger.log = loggers_backup['ExtendedLogger']
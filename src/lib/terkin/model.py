@@ -5,11 +5,40 @@
 # License: GNU General Public License, Version 3
 import time
 
+# Canonical instances of field names, see ``intern_field``.
+FIELDS = {}
+
+# Upper limit for the number of interned field names.
+FIELDS_MAX = 256
+
+
+def intern_field(name):
+    """
+    Return the canonical instance of a field name.
+
+    Sensors usually compute field names like ``temperature.0x77.i2c:0``
+    on each reading. Storing the canonical instance instead will let the
+    garbage collector reclaim the fresh string right away, instead of
+    keeping one copy per duty cycle alive within the data frame.
+
+    :param name: Field name.
+    """
+    field = FIELDS.get(name)
+    if field is None:
+        if len(FIELDS) >= FIELDS_MAX:
+            return name
+        FIELDS[name] = name
+        field = name
+    return field
+
 
 class SensorReading:
     """
     Object for holding a sensor reading.
     """
+
+    __slots__ = ('sensor', 'data', 'timestamp')
+
     def __init__(self):
 
         # Reference to the sensor object.
@@ -25,7 +54,13 @@ class SensorReading:
 class DataFrame:
     """
     A collection of sensor readings to be send from device.
+
+    In order to reduce heap churn, the main loop allocates a single
+    instance and calls ``reset()`` at the beginning of each duty cycle.
     """
+
+    __slots__ = ('readings', 'data_in', 'data_out', 'payload_out')
+
     def __init__(self):
 
         # List of SensorReading objects.
@@ -39,3 +74,23 @@ class DataFrame:
 
         # Serialized telemetry payload for all sensor values.
         self.payload_out = None
+
+    def add(self, reading):
+        """
+        Add sensor reading and merge its values into ``data_in``.
+
+        :param reading: The ``SensorReading`` instance.
+        """
+        self.readings.append(reading)
+        data_in = self.data_in
+        for key, value in reading.data.items():
+            data_in[intern_field(key)] = value
+
+    def reset(self):
+        """
+        Clear all readings and values, reusing the containers.
+        """
+        self.readings.clear()
+        self.data_in.clear()
+        self.data_out.clear()
+        self.payload_out = None
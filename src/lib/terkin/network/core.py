@@ -161,9 +161,16 @@ class NetworkManager:
         ip = '0.0.0.0'
         port = self.settings.get('services.api.modeserver.port', 666)
 
-        log.info('Starting mode server on {}:{}'.format(ip, port))
+        log.info('Starting mode server on %s:%s', ip, port)
         from terkin.api.udp import UdpServer
         self.mode_server = UdpServer(ip, port)
+
+        # When running on the event loop, the mode server
+        # will be started as a cooperative task.
+        if self.device.application_info.application.runtime == 'eventloop':
+            self.mode_server.callback = self.handle_modeserver
+            return
+
         self.mode_server.start(self.handle_modeserver)
 
     def stop_modeserver(self):
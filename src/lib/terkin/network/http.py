@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import usocket
+
+from terkin import logging
+from terkin.util import allocate_lock
+
+log = logging.getLogger(__name__)
+
+
+class HttpResponse:
+    """ """
+
+    def __init__(self, status_code, reason, headers, content):
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return str(self.content, 'utf-8')
+
+
+class HttpConnection:
+    """
+    HTTP/1.1 client keeping its connection open across requests.
+
+    Request heads are assembled within a preallocated buffer and written
+    at once. Before reusing an idle connection, it will be checked whether
+    the server closed it in the meanwhile. When sending a request fails
+    nevertheless, it will be retried once using a new connection, but only
+    when it has not been written completely. Otherwise, the server might
+    have processed it already.
+
+    Use ``HttpConnection.get(url)`` to obtain a pooled connection per host.
+    Pooled connections may be shared between telemetry targets transmitting
+    concurrently, so requests are serialized using a lock.
+    """
+
+    # Pooled connections, keyed by scheme, host and port.
+    pool = {}
+
+    def __init__(self, scheme, host, port, timeout=10.0, buffer_size=512):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+        self.socket = None
+        self.stream = None
+
+        # Number of requests sent through the current connection.
+        self.requests = 0
+
+        # Whether the current request has been written completely.
+        self.written = False
+
+        self.lock = allocate_lock()
+
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.position = 0
+
+        self.host_header = host.encode() if port in (80, 443) else '{}:{}'.format(host, port).encode()
+
+    @classmethod
+    def get(cls, url, timeout=10.0):
+        """
+        Return pooled connection for the designated URL.
+
+        :param url: URL like ``http://daq.example.org/api``.
+        :return: Tuple of ``HttpConnection`` and request path.
+        """
+        scheme, host, port, path = split_url(url)
+        key = (scheme, host, port)
+        connection = cls.pool.get(key)
+        if connection is None:
+            connection = cls.pool[key] = cls(scheme, host, port, timeout=timeout)
+        return connection, path
+
+    @classmethod
+    def close_all(cls):
+        """
+        Close all pooled connections, e.g. before going to deep sleep.
+        """
+        for connection in cls.pool.values():
+            connection.close()
+
+    @property
+    def connected(self):
+        return self.socket is not None
+
+    def connect(self):
+        log.info('Connecting to %s:%s', self.host, self.port)
+        address = usocket.getaddrinfo(self.host, self.port, 0, usocket.SOCK_STREAM)[0]
+        sock = usocket.socket(address[0], address[1], address[2])
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(address[-1])
+            if self.scheme == 'https':
+                sock = wrap_tls(sock, self.host)
+        except Exception:
+            sock.close()
+            raise
+
+        self.socket = sock
+        try:
+            self.stream = sock.makefile('rwb', 0)
+        except ValueError:
+            # Pycom's "socket.makefile" doesn't accept the "r" mode.
+            self.stream = sock.makefile('wb', 0)
+        self.requests = 0
+
+    def close(self):
+        if self.socket is not None:
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+        self.socket = None
+        self.stream = None
+
+    def request(self, method, path, body=None, headers=None):
+        """
+        Send request and read response.
+
+        :param method: HTTP method.
+        :param path: Request path.
+        :param body: Request body as ``str`` or ``bytes``.
+        :param headers: Dictionary of request headers.
+        :return: ``HttpResponse`` object.
+        """
+        with self.lock:
+            if self.connected and self.dropped():
+                log.info('Connection to %s was closed by server, reconnecting', self.host)
+                self.close()
+
+            # A connection failing within a request is out of sync with
+            # the server, e.g. after receiving a malformed response.
+            reused = self.connected
+            try:
+                return self.send(method, path, body, headers)
+            except OSError as ex:
+                self.close()
+                if not reused or self.written:
+                    raise
+                log.info('Connection to %s was closed (%s), reconnecting', self.host, ex)
+            except Exception:
+                self.close()
+                raise
+
+            try:
+                return self.send(method, path, body, headers)
+            except Exception:
+                self.close()
+                raise
+
+    def dropped(self):
+        """
+        Whether the server closed the idle connection.
+
+        An idle connection becoming readable means the server closed it,
+        or it is out of sync with the server. However, with TLS 1.3,
+        servers send session tickets after the handshake, which make the
+        socket readable without carrying any application data. So, read
+        without blocking in order to tell them apart.
+        """
+        try:
+            import uselect as select
+        except ImportError:
+            import select
+        poller = select.poll()
+        poller.register(self.socket, select.POLLIN)
+        if not poller.poll(0):
+            return False
+
+        self.socket.settimeout(0)
+        try:
+            data = self.stream.read(1)
+        except OSError as ex:
+            return not would_block(ex)
+        finally:
+            self.socket.settimeout(self.timeout)
+
+        # ``None`` means there is no application data, ``b''`` signals EOF.
+        return data is not None
+
+    def send(self, method, path, body, headers):
+        self.written = False
+        if not self.connected:
+            self.connect()
+
+        # Avoid copying string payloads on MicroPython.
+        if isinstance(body, str):
+            try:
+                body = memoryview(body)
+            except TypeError:
+                body = body.encode()
+
+        self.position = 0
+        self.put(method.encode())
+        self.put(b' ')
+        self.put(path.encode())
+        self.put(b' HTTP/1.1\r\nHost: ')
+        self.put(self.host_header)
+        self.put(b'\r\nConnection: keep-alive\r\n')
+        if headers:
+            for key in headers:
+                self.put(key.encode())
+                self.put(b': ')
+                self.put(headers[key].encode())
+                self.put(b'\r\n')
+        self.put(b'Content-Length: ')
+        self.put(str(len(body) if body is not None else 0).encode())
+        self.put(b'\r\n\r\n')
+        self.flush()
+        if body:
+            self.stream.write(body)
+        self.written = True
+
+        self.requests += 1
+        return self.read_response()
+
+    def put(self, data):
+        """
+        Append data to the header buffer, writing it to the socket when full.
+        """
+        length = len(data)
+        if self.position + length > len(self.buffer):
+            self.flush()
+            if length > len(self.buffer):
+                self.stream.write(data)
+                return
+        self.buffer[self.position:self.position + length] = data
+        self.position += length
+
+    def flush(self):
+        if self.position:
+            self.stream.write(self.view[:self.position])
+            self.position = 0
+
+    def read_response(self):
+        stream = self.stream
+
+        line = stream.readline()
+        if not line:
+            raise OSError('Connection closed by server')
+        parts = line.split(None, 2)
+        version = parts[0]
+        status_code = int(parts[1])
+        reason = parts[2].rstrip().decode() if len(parts) > 2 else ''
+
+        headers = {}
+        while True:
+            line = stream.readline()
+            if not line or line == b'\r\n':
+                break
+            key, value = line.decode().split(':', 1)
+            headers[key.strip().lower()] = value.strip()
+
+        keepalive = version == b'HTTP/1.1'
+        connection = headers.get('connection', '').lower()
+        if connection == 'close':
+            keepalive = False
+        elif connection == 'keep-alive':
+            keepalive = True
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            content = self.read_chunked()
+        elif 'content-length' in headers:
+            content = self.read_exactly(int(headers['content-length']))
+        else:
+            content = stream.read()
+            keepalive = False
+
+        if not keepalive:
+            self.close()
+
+        return HttpResponse(status_code, reason, headers, content)
+
+    def read_exactly(self, length):
+        content = bytearray(length)
+        view = memoryview(content)
+        position = 0
+        while position < length:
+            count = self.stream.readinto(view[position:])
+            if not count:
+                raise OSError('Connection closed by server')
+            position += count
+        return bytes(content)
+
+    def read_chunked(self):
+        chunks = []
+        while True:
+            line = self.stream.readline()
+            size = int(line.split(b';')[0].strip(), 16)
+            if size == 0:
+                # Skip trailers.
+                while True:
+                    line = self.stream.readline()
+                    if not line or line == b'\r\n':
+                        break
+                break
+            chunks.append(self.read_exactly(size))
+            self.stream.readline()
+        return b''.join(chunks)
+
+
+def split_url(url):
+    """
+    Split URL into scheme, host, port and path.
+    """
+    scheme, _, rest = url.partition('://')
+    host, slash, path = rest.partition('/')
+    path = '/' + path
+    if scheme == 'http':
+        port = 80
+    elif scheme == 'https':
+        port = 443
+    else:
+        raise ValueError('Unsupported protocol: {}'.format(scheme))
+    if ':' in host:
+        host, port = host.split(':', 1)
+        port = int(port)
+    return scheme, host, port, path
+
+
+def would_block(ex):
+    """
+    Whether reading from a non-blocking socket failed because no data is available.
+    """
+    try:
+        import uerrno as errno
+    except ImportError:
+        import errno
+    if ex.args and ex.args[0] == errno.EAGAIN:
+        return True
+    try:
+        import ssl
+        return isinstance(ex, ssl.SSLWantReadError)
+    except (ImportError, AttributeError):
+        return False
+
+
+def wrap_tls(sock, host):
+    import ussl
+    if hasattr(ussl, 'create_default_context'):
+        return ussl.create_default_context().wrap_socket(sock, server_hostname=host)
+    return ussl.wrap_socket(sock, server_hostname=host)
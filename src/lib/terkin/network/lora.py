@@ -193,7 +193,7 @@ class LoRaDriverPycom:
             log.info('[LoRa] No packet received within receive window')
 
         if rx:
-            log.info('[LoRa] Received: {} on port: {}'.format(rx, port))
+            log.info('[LoRa] Received: %s on port: %s', rx, port)
 
         return rx, port
 
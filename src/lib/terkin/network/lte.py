@@ -55,7 +55,7 @@ class SequansLTE:
         self.chrono.reset()
         while True:
 
-            log.info('Signal strength: {}'.format(self.get_signal_strength()))
+            log.info('Signal strength: %s', self.get_signal_strength())
 
             if self.lte.isattached():
                 break
@@ -91,7 +91,7 @@ class SequansLTE:
         Get infos from Modem.
         """
 
-        log.info('Signal strength: {}'.format(self.get_signal_strength()))
+        log.info('Signal strength: %s', self.get_signal_strength())
 
         self.at('RRC:setDbgPerm full')
         self.at('RRC:showcaps')
@@ -128,9 +128,9 @@ class SequansLTE:
         :param command:
 
         """
-        log.info('Sending: {}'.format(command))
+        log.info('Sending: %s', command)
         answer = self.lte.send_at_cmd(command)
-        log.info('Answer:  {}'.format(answer))
+        log.info('Answer:  %s', answer)
         return answer
 
     def firmware_info(self):
@@ -66,6 +66,11 @@ class WiFiManager:
             #self.print_short_status()
             self.print_address_status()
 
+        # When running on the event loop, the connection
+        # monitor will be started as a cooperative task.
+        if self.manager.device.application_info.application.runtime == 'eventloop':
+            return
+
         # Start thread to monitor WiFi connection and reconnect if required.
         try:
             import _thread
@@ -178,7 +183,7 @@ class WiFiManager:
             self.connect_stations(networks_known)
 
         except Exception as ex:
-            log.exc(ex, 'WiFi STA: Connecting to configured networks "{}" failed'.format(list(networks_known)))
+            log.exc(ex, 'WiFi STA: Connecting to configured networks "%s" failed', list(networks_known))
 
     def stay_connected_invoke(self):
         try:
@@ -197,30 +202,41 @@ class WiFiManager:
         # Attempt to connect to known/configured networks.
         attempt = 0
         while self.is_running:
+            attempt, delay = self.ensure_connected(networks_known, attempt)
+            machine.idle()
+            time.sleep(delay)
 
-            delay = 1
+    def ensure_connected(self, networks_known, attempt):
+        """
+        Check WiFi connectivity once and reconnect if required.
 
-            if self.is_connected():
-                attempt = 0
+        :param networks_known: List of configured network names.
+        :param attempt: Number of the current reconnect attempt.
+        :return: Tuple of next attempt number and delay in seconds until the next check.
+        """
 
-            else:
-                log.info("WiFi STA: Connecting to configured networks: %s. "
-                         "Attempt: #%s", list(networks_known), attempt + 1)
-                try:
-                    self.connect_stations(networks_known)
+        delay = 1
 
-                except KeyboardInterrupt:
-                    raise
+        if self.is_connected():
+            attempt = 0
 
-                except Exception as ex:
-                    log.exc(ex, 'WiFi STA: Connecting to configured networks "{}" failed'.format(list(networks_known)))
-                    delay = backoff_time(attempt, minimum=1, maximum=600)
-                    log.info('WiFi STA: Retrying in {} seconds'.format(delay))
+        else:
+            log.info("WiFi STA: Connecting to configured networks: %s. "
+                     "Attempt: #%s", list(networks_known), attempt + 1)
+            try:
+                self.connect_stations(networks_known)
 
-                attempt += 1
+            except KeyboardInterrupt:
+                raise
 
-            machine.idle()
-            time.sleep(delay)
+            except Exception as ex:
+                log.exc(ex, 'WiFi STA: Connecting to configured networks "%s" failed', list(networks_known))
+                delay = backoff_time(attempt, minimum=1, maximum=600)
+                log.info('WiFi STA: Retrying in %s seconds', delay)
+
+            attempt += 1
+
+        return attempt, delay
 
     def is_connected(self):
         """
@@ -290,7 +306,7 @@ class WiFiManager:
                     break
 
             except Exception as ex:
-                log.exc(ex, 'WiFi STA: Connecting to "{}" failed'.format(network_name))
+                log.exc(ex, 'WiFi STA: Connecting to "%s" failed', network_name)
 
         if not self.is_connected():
 
@@ -299,9 +315,10 @@ class WiFiManager:
             message = 'WiFi STA: Connecting to any network candidate failed'
             description = 'Please check your WiFi configuration for one of the ' \
                           '{} station candidates.'.format(len(network_names))
-            log.error('{}. {}'.format(message, description))
-            log.warning('Todo: We might want to buffer telemetry data to '
-                        'flash memory to be scheduled for transmission later.')
+            log.error('%s. %s', message, description)
+            if not self.settings.get('telemetry.journal.enabled', False):
+                log.warning('Readings will not be transmitted. Enable "telemetry.journal" '
+                            'to keep them on flash and forward them later.')
 
             raise WiFiException(message)
 
@@ -314,14 +331,14 @@ class WiFiManager:
 
         network_name = network['ssid']
 
-        log.info('WiFi STA: Preparing connection to network "{}"'.format(network_name))
+        log.info('WiFi STA: Preparing connection to network "%s"', network_name)
 
         auth_mode = None
         if self.platform_info.vendor == self.platform_info.MICROPYTHON.Pycom:
             log.info('WiFi STA: Getting auth mode')
             try:
                 auth_mode = self.get_auth_mode(network_name)
-                log.info('WiFi STA: Auth mode is "{}"'.format(auth_mode))
+                log.info('WiFi STA: Auth mode is "%s"', auth_mode)
             except WiFiException as _:
                 log.error('Failed to get auth mode, will attempt fresh')
                 auth_mode = None
@@ -341,7 +358,7 @@ class WiFiManager:
 
         # Optionally, configure static IP address.
         if 'ifconfig' in network:
-            log.info('WiFi STA: Using static network configuration "{}"'.format(network_name))
+            log.info('WiFi STA: Using static network configuration "%s"', network_name)
             self.station.ifconfig(config=network['ifconfig'])
 
         # Obtain timeout value.
@@ -349,8 +366,8 @@ class WiFiManager:
         network_timeout = network.get('timeout', 15.0)
 
         # Connect to WiFi station.
-        log.info('WiFi STA: Starting connection to "{}" '
-                 'with timeout of {} seconds'.format(network_name, network_timeout))
+        log.info('WiFi STA: Starting connection to "%s" '
+                 'with timeout of %s seconds', network_name, network_timeout)
         self._connect(network_name, password, auth_mode=auth_mode, timeout=network_timeout)
 
         # After reset, WiFi regularly does not connect.
@@ -406,7 +423,7 @@ class WiFiManager:
             # Report about the progress each 3 seconds.
             if int(delta) % 3 == 0:
                 if do_report:
-                    log.info('WiFi STA: Waiting for network to come up within {} seconds'.format(eta))
+                    log.info('WiFi STA: Waiting for network to come up within %s seconds', eta)
                     do_report = False
             else:
                 do_report = True
@@ -551,7 +568,7 @@ class WiFiManager:
         :param network_name: 
 
         """
-        log.info('WiFi STA: Forgetting NVRAM data for network "{}"'.format(network_name))
+        log.info('WiFi STA: Forgetting NVRAM data for network "%s"', network_name)
         auth_mode_nvs_key = self.auth_mode_nvs_key(network_name)
         try:
             import pycom
@@ -561,7 +578,7 @@ class WiFiManager:
 
     def print_short_status(self):
         """ """
-        log.info('WiFi STA: Connected to "{}" with IP address "{}"'.format(self.get_ssid(), self.get_ip_address()))
+        log.info('WiFi STA: Connected to "%s" with IP address "%s"', self.get_ssid(), self.get_ip_address())
 
     def print_address_status(self):
         """ """
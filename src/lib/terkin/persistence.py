@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import json
+import time
+try:
+    import os_path
+except ImportError:
+    import os.path as os_path
+
+from terkin import logging
+from terkin.util import get_platform_info, format_exception, file_remove
+
+log = logging.getLogger(__name__)
+
+
+class PersistentState:
+    """
+    Keep a small amount of runtime state across deep sleep cycles.
+
+    The state is a dictionary of namespaces, each one owned by a
+    different subsystem, which will be loaded once at startup and
+    saved once before entering deep sleep or shutoff.
+
+    On Vanilla MicroPython, the state is stored within the RTC memory.
+    Otherwise, it will be stored as a JSON file next to the settings.
+
+    In order to not rewrite the file on flash on each deep sleep cycle,
+    changes to namespaces listed in ``DEFERRED`` will be written at most
+    each ``file_interval`` seconds. Changes in between will be lost when
+    going to deep sleep. Changes to other namespaces will be written
+    right away, including the deferred ones. Namespaces listed in
+    ``VOLATILE`` will only be kept within RTC memory.
+    """
+
+    FILENAME = 'terkin-state.json'
+
+    VOLATILE = ['timeline']
+    DEFERRED = ['metrics', 'sensors']
+
+    def __init__(self, path, file_interval=600):
+        """
+        :param path: Directory for the state file.
+        :param file_interval: Minimum time between writing changes of
+                              deferred namespaces to the file, in seconds.
+        """
+        self.filepath = os_path.join(path, self.FILENAME)
+        self.file_interval = file_interval
+        self.data = {}
+
+        # Last payload loaded or saved, in order to skip redundant writes.
+        self.payload = '{}'
+
+        # Last payload of namespaces written right away and time of the last file write.
+        self.essential = '{}'
+        self.saved_at = 0
+
+        # Reference to platform information.
+        self.platform_info = get_platform_info()
+
+    def scope(self, name):
+        """
+        Return the namespace for the designated subsystem.
+
+        :param name: Name of the namespace.
+        :return: Dictionary holding the state of the subsystem.
+        """
+        return self.data.setdefault(name, {})
+
+    def get_rtc(self):
+        """
+        Return the RTC object when it offers user memory, otherwise ``None``.
+        """
+        if self.platform_info.vendor != self.platform_info.MICROPYTHON.Vanilla:
+            return None
+        try:
+            import machine
+            rtc = machine.RTC()
+            if hasattr(rtc, 'memory'):
+                return rtc
+        except Exception:
+            pass
+
+    def load(self):
+        """
+        Load state from RTC memory or from filesystem.
+        """
+        payload = None
+        try:
+            rtc = self.get_rtc()
+            if rtc is not None:
+                payload = rtc.memory()
+                if isinstance(payload, (bytes, bytearray)):
+                    payload = payload.decode()
+                else:
+                    payload = None
+
+            if payload:
+                self.data = json.loads(payload)
+                self.payload = payload
+
+            elif self.file_exists():
+                with open(self.filepath, 'r') as instream:
+                    self.data = json.loads(instream.read())
+                self.saved_at = self.data.pop('_time', 0)
+                self.payload = self.serialize(exclude=self.VOLATILE)
+                self.essential = self.serialize(exclude=self.VOLATILE + self.DEFERRED)
+
+            if self.data:
+                log.info('Loaded persistent state for %s', list(self.data.keys()))
+
+        except Exception as ex:
+            # Persistent state is not essential, so don't bail out.
+            log.warning('Loading persistent state failed: %s', format_exception(ex))
+            self.data = {}
+
+        return self.data
+
+    def save(self):
+        """
+        Save state to RTC memory or to filesystem.
+        """
+        try:
+            # RTC memory is limited to a few kilobytes,
+            # so fall back to the filesystem when exceeding it.
+            rtc = self.get_rtc()
+            if rtc is not None:
+                payload = self.serialize()
+                if payload == self.payload:
+                    return True
+                try:
+                    rtc.memory(payload.encode())
+                    self.payload = payload
+
+                    # Don't restore an outdated state from the filesystem after power loss.
+                    file_remove(self.filepath)
+
+                    return True
+                except Exception as ex:
+                    log.warning('Saving persistent state to RTC memory failed: %s', format_exception(ex))
+
+                    # Clear RTC memory, as it would take precedence over the file when loading.
+                    try:
+                        rtc.memory(b'')
+                    except Exception:
+                        pass
+                    self.payload = None
+                    self.essential = None
+
+            payload = self.serialize(exclude=self.VOLATILE)
+            if payload == self.payload:
+                return True
+
+            # Defer writing when only deferred namespaces changed.
+            now = time.time()
+            essential = self.serialize(exclude=self.VOLATILE + self.DEFERRED)
+            if essential == self.essential and self.saved_at <= now < self.saved_at + self.file_interval:
+                log.info('Deferring to save persistent state for %s seconds',
+                         int(self.saved_at + self.file_interval - now))
+                return True
+
+            log.info('Saving persistent state to %s', self.filepath)
+            with open(self.filepath, 'w') as outstream:
+                outstream.write(self.serialize(exclude=self.VOLATILE, extra={'_time': int(now)}))
+
+            import uos
+            uos.sync()
+
+            self.payload = payload
+            self.essential = essential
+            self.saved_at = now
+            return True
+
+        except Exception as ex:
+            log.warning('Saving persistent state failed: %s', format_exception(ex))
+            return False
+
+    def serialize(self, exclude=None, extra=None):
+        """
+        Serialize all non-empty namespaces to JSON.
+
+        :param exclude: List of namespaces to skip.
+        :param extra: Dictionary of additional top-level items.
+        """
+        exclude = exclude or []
+        data = dict([
+            (name, scope) for name, scope in self.data.items()
+            if scope and name not in exclude])
+        if extra:
+            data.update(extra)
+        return json.dumps(data)
+
+    def file_exists(self):
+        import os
+        try:
+            os.stat(self.filepath)
+            return True
+        except OSError:
+            return False
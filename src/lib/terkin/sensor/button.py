@@ -59,7 +59,7 @@ class ButtonManager:
             log.info('Setting up %s', button)
             self.buttons.append(button)
         except Exception as ex:
-            log.exc(ex, 'Setting up button on pin {} failed'.format(pin))
+            log.exc(ex, 'Setting up button on pin %s failed', pin)
 
     def check(self, alarm):
         """
@@ -72,8 +72,8 @@ class ButtonManager:
                 continue
             try:
                 if button.adapter.is_pressed() and not button.adapter.just_pressed():
-                    log.info('{} pressed'.format(button))
+                    log.info('%s pressed', button)
                     button.adapter.set_press()
             except Exception as ex:
                 button.enabled = False
-                log.exc(ex, 'Checking {} failed'.format(button))
+                log.exc(ex, 'Checking %s failed', button)
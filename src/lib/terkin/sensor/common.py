@@ -30,6 +30,12 @@ class AbstractSensor:
         self.parameter = {}
         self.pins = {}
 
+        # Registry of field names, assigned by the sensor manager.
+        self.schema = None
+
+        # Post-processing of sensor values, compiled by the sensor manager.
+        self.pipeline = None
+
     def start(self):
         """ """
         raise NotImplementedError("Must be implemented in sensor driver")
@@ -71,8 +77,8 @@ class AbstractSensor:
             sensor_type = self.settings.get('type', 'unknown').lower()
             sensor_id = self.settings.get('id', self.settings.get('key', sensor_type))
             sensor_bus = self.settings.get('bus')
-            log.warning('Bus {} for sensor with id={} and type={} is disabled, '
-                        'skipping registration'.format(sensor_bus, sensor_id, sensor_type))
+            log.warning('Bus %s for sensor with id=%s and type=%s is disabled, '
+                        'skipping registration', sensor_bus, sensor_id, sensor_type)
 
         self.bus = bus
 
@@ -84,6 +90,42 @@ class AbstractSensor:
         """ """
         raise NotImplementedError()
 
+    def begin_measurement(self):
+        """
+        Start a measurement without waiting for its result (optional).
+
+        Sensors implementing the split-phase protocol return the number
+        of milliseconds until the result can be picked up by ``collect()``.
+        Returning ``None`` signals the measurement has not been started,
+        so ``read()`` will be used instead.
+        """
+        return None
+
+    def collect(self):
+        """
+        Collect the result of a measurement started by ``begin_measurement()``.
+        """
+        return self.read()
+
+    def register_fields(self):
+        """
+        Register the field names of this sensor with the field schema (optional).
+
+        Invoked after starting the sensor, in order to compute
+        field names once instead of on each reading.
+        """
+        pass
+
+    def get_fieldname(self, *parts):
+        """
+        Return field name joined from its parts, using the field schema when available.
+
+        :param parts: Name parts. Parts which are ``None`` will be skipped.
+        """
+        if self.schema is not None:
+            return self.schema.get_fieldname(parts)
+        return '.'.join([str(part) for part in parts if part is not None])
+
     def format_fieldname(self, name, address=None, channel=None):
         """
 
@@ -91,10 +133,7 @@ class AbstractSensor:
         :param address:
 
         """
-        parts = [name, channel, address, self.bus.name]
-        parts = [part for part in parts if part is not None]
-        fieldname = '.'.join(parts)
-        return fieldname
+        return self.get_fieldname(name, channel, address, self.bus.name)
 
     def serialize(self):
         """ """
@@ -8,6 +8,8 @@ from machine import Pin
 
 from terkin import logging
 from terkin.sensor.common import AbstractBus
+from terkin.sensor.pipeline import SensorPipeline
+from terkin.sensor.schema import FieldSchema
 
 log = logging.getLogger(__name__)
 #log.setLevel(logging.DEBUG)
@@ -28,12 +30,21 @@ class SensorManager:
         self.buses = {}
         self.settings = settings
 
+        # Registry of telemetry field names.
+        self.schema = FieldSchema()
+
     def register_sensor(self, sensor):
         """
 
         :param sensor: 
 
         """
+        if hasattr(sensor, 'schema'):
+            sensor.schema = self.schema
+
+        # Compile post-processing of sensor values.
+        sensor.pipeline = SensorPipeline.from_settings(getattr(sensor, 'settings', None) or {})
+
         self.sensors.append(sensor)
 
     def register_bus(self,  bus):
@@ -53,7 +64,7 @@ class SensorManager:
 
         """
         if name is None:
-            log.error('Bus "{}" does not exist'.format(name))
+            log.error('Bus "%s" does not exist', name)
             return
 
         log.debug('Trying to find bus by name "%s"', name)
@@ -86,9 +97,9 @@ class SensorManager:
         for sensor in self.sensors:
             log.debug('checking sensor with settings "%s"', sensor.settings)
             if hasattr(sensor, 'settings') and sensor.settings.get('id') == id:
-                log.debug('sensor with id {} found'.format(id))
+                log.debug('sensor with id %s found', id)
                 return sensor
-        log.info('sensor with id {} NOT found'.format(id))
+        log.info('sensor with id %s NOT found', id)
 
     def get_sensor_by_type(self, type):
         """
@@ -106,6 +117,34 @@ class SensorManager:
             if hasattr(sensor, 'family') and sensor.family == family:
                 yield sensor
 
+    def get_sensor_groups(self, sensors=None):
+        """
+        Group sensors by the bus they are attached to.
+
+        Sensors without a bus, e.g. system sensors or sensors
+        attached to GPIO pins directly, will get a group of
+        their own. The group can also be defined explicitly
+        by using the ``group`` setting on each sensor.
+
+        :param sensors: List of sensor objects. Default: All registered sensors.
+        :return: Dictionary of sensor lists, keyed by group name.
+        """
+        if sensors is None:
+            sensors = self.sensors
+        groups = {}
+        for index, sensor in enumerate(sensors):
+            settings = getattr(sensor, 'settings', None) or {}
+            bus = getattr(sensor, 'bus', None)
+            if 'group' in settings:
+                group_name = settings['group']
+            elif bus is not None:
+                group_name = bus.name
+            else:
+                group_name = '{}:{}'.format(sensor.__class__.__name__, index)
+            groups.setdefault(group_name, [])
+            groups[group_name].append(sensor)
+        return groups
+
     def setup_buses(self, buses_settings):
         """Register configured I2C, OneWire and SPI buses.
 
@@ -127,7 +166,7 @@ class SensorManager:
             try:
                 self.setup_bus(bus_settings)
             except Exception as ex:
-                log.exc(ex, 'Registering bus failed. settings={}'.format(bus_settings))
+                log.exc(ex, 'Registering bus failed. settings=%s', bus_settings)
 
     def setup_bus(self, bus_settings):
         """
@@ -179,11 +218,11 @@ class SensorManager:
         for sensor in self.sensors:
             sensorname = sensor.__class__.__name__
             if hasattr(sensor, action):
-                log.info('Sending {} to sensor {}'.format(action, sensorname))
+                log.info('Sending %s to sensor %s', action, sensorname)
                 try:
                     getattr(sensor, action)()
                 except Exception as ex:
-                    log.exc(ex, 'Sending {} to sensor {} failed'.format(action, sensorname))
+                    log.exc(ex, 'Sending %s to sensor %s failed', action, sensorname)
 
     def power_toggle_buses(self, action):
         """
@@ -193,20 +232,21 @@ class SensorManager:
         """
         for busname, bus in self.buses.items():
             if hasattr(bus, action):
-                log.info('Sending {} to bus {}'.format(action, busname))
+                log.info('Sending %s to bus %s', action, busname)
                 try:
                     getattr(bus, action)()
                 except Exception as ex:
-                    log.exc(ex, 'Sending {} to sensor {} failed'.format(action, busname))
+                    log.exc(ex, 'Sending %s to sensor %s failed', action, busname)
 
     def start_sensors(self):
         log.info("Starting all sensors")
         for sensor in self.sensors:
             if hasattr(sensor, 'start'):
                 try:
-                    sensor.start()
+                    if sensor.start() is not False and hasattr(sensor, 'register_fields'):
+                        sensor.register_fields()
                 except Exception as ex:
-                    log.exc(ex, 'Starting sensor "{}" failed. Reason: {}.'.format(sensor.type, ex))
+                    log.exc(ex, 'Starting sensor "%s" failed. Reason: %s.', sensor.type, ex)
 
 
 class OneWireBus(AbstractBus):
@@ -267,7 +307,7 @@ class OneWireBus(AbstractBus):
         # Scan for 1-Wire devices and remember them.
         # TODO: Refactor things specific to DS18x20 devices elsewhere.
         self.devices = [rom for rom in self.adapter.scan() if rom[0] == 0x10 or rom[0] == 0x28]
-        log.info("Found {} 1-Wire (DS18x20) devices: {}".format(len(self.devices), self.get_devices_ascii()))
+        log.info("Found %s 1-Wire (DS18x20) devices: %s", len(self.devices), self.get_devices_ascii())
 
     def get_devices_ascii(self):
         """  """
@@ -370,7 +410,7 @@ class I2CBus(AbstractBus):
 
                 self.devices = self.scan_devices_smbus2()
                 log.info("Scan I2C bus via smbus2 for devices...")
-                log.info("Found {} I2C devices: {}.".format(len(self.devices), self.devices))
+                log.info("Found %s I2C devices: %s.", len(self.devices), self.devices)
 
             self.ready = True
 
@@ -379,10 +419,10 @@ class I2CBus(AbstractBus):
             raise
 
     def scan_devices(self):
-        log.info('Scan I2C with id={} bus for devices...'.format(self.number))
+        log.info('Scan I2C with id=%s bus for devices...', self.number)
         self.devices = self.adapter.scan()
         # i2c.readfrom(0x76, 5)
-        log.info("Found {} I2C devices: {}".format(len(self.devices), self.devices))
+        log.info("Found %s I2C devices: %s", len(self.devices), self.devices)
 
     def scan_devices_smbus2(self, start=0x03, end=0x78):
         try:
@@ -433,6 +473,6 @@ class I2CBus(AbstractBus):
 
         https://docs.pycom.io/firmwareapi/pycom/machine/i2c.html
         """
-        log.info('Turning off I2C bus {}'.format(self.name))
+        log.info('Turning off I2C bus %s', self.name)
         if self.platform_info.vendor == self.platform_info.MICROPYTHON.Pycom:
             self.adapter.deinit()
@@ -17,7 +17,7 @@ class LinuxSysfsOneWireBus:
     def __init__(self, sysfs):
         self.sysfs = sysfs
         self.roms = []
-        log.info('Starting LinuxSysfsOneWireBus on {}'.format(self.sysfs))
+        log.info('Starting LinuxSysfsOneWireBus on %s', self.sysfs)
 
     def scan(self):
         with open(os.path.join(self.sysfs, 'w1_master_slaves'), 'r') as f:
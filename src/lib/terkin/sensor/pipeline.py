@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+
+# Unit conversions as polynomial coefficients, see ``SensorPipeline``.
+UNITS = {
+    'fahrenheit': (32.0, 1.8),
+    'kelvin': (273.15, 1.0),
+    'pascal': (0.0, 100.0),
+    'gram': (0.0, 1000.0),
+    'pound': (0.0, 2.20462),
+}
+
+
+class SensorPipeline:
+    """
+    Post-processing of sensor values, compiled once from the sensor settings.
+
+    Values are transformed by a sequence of polynomials and rounded
+    afterwards. Polynomials are given by their coefficients in ascending
+    order, so ``[offset, factor]`` is a linear calibration. Settings::
+
+        {
+            'type': 'BME280',
+
+            # Calibrate values, keyed by quantity or by full field name.
+            'calibration': {
+                'temperature': [-0.5, 1.02],
+                'humidity': [1.2, 0.98, -0.0001],
+            },
+
+            # Convert values to other units, see ``UNITS``.
+            'units': {
+                'temperature': 'fahrenheit',
+            },
+
+            # Round all values.
+            'decimals': 2,
+        }
+
+    The steps for each field are resolved on its first reading
+    and cached, so applying the pipeline does not need to look
+    up any settings.
+    """
+
+    def __init__(self, calibration=None, units=None, decimals=None):
+        self.calibration = calibration or {}
+        self.units = units or {}
+        self.decimals = decimals
+
+        # Map field names to their steps, ``None`` for no transformation.
+        self.steps = {}
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        Compile pipeline from sensor settings.
+
+        :param settings: Sensor settings.
+        :return: ``SensorPipeline`` instance or ``None`` when there is nothing to do.
+        """
+        calibration = settings.get('calibration')
+        units = settings.get('units')
+        decimals = settings.get('decimals')
+        if not calibration and not units and decimals is None:
+            return None
+
+        for unit in (units or {}).values():
+            if unit not in UNITS:
+                raise ValueError('Unknown unit "{}"'.format(unit))
+
+        return cls(calibration=calibration, units=units, decimals=decimals)
+
+    def resolve(self, fieldname):
+        """
+        Resolve the polynomials for a field.
+
+        :param fieldname: Field name like ``temperature.0x77.i2c:0``.
+        """
+        quantity = fieldname.split('.')[0]
+        polynomials = []
+
+        coefficients = self.calibration.get(fieldname, self.calibration.get(quantity))
+        if coefficients:
+            polynomials.append(tuple(coefficients))
+
+        unit = self.units.get(fieldname, self.units.get(quantity))
+        if unit:
+            polynomials.append(UNITS[unit])
+
+        if not polynomials and self.decimals is None:
+            return None
+
+        return tuple(polynomials)
+
+    def apply(self, data):
+        """
+        Transform values in place.
+
+        :param data: Dictionary of sensor values.
+        """
+        steps = self.steps
+        decimals = self.decimals
+        for key, value in data.items():
+            try:
+                polynomials = steps[key]
+            except KeyError:
+                polynomials = steps[key] = self.resolve(key)
+            if polynomials is None:
+                continue
+            for coefficients in polynomials:
+                result = 0.0
+                for coefficient in reversed(coefficients):
+                    result = result * value + coefficient
+                value = result
+            if decimals is not None:
+                value = round(value, decimals)
+            data[key] = value
+        return data
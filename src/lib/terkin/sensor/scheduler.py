@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import time
+
+from terkin import logging
+
+log = logging.getLogger(__name__)
+
+
+class SensorScheduler:
+    """
+    Read sensors at individual sampling intervals.
+
+    Sensors can be configured with an ``interval`` setting in seconds.
+    They will only be read when due, otherwise their last reading
+    will be carried forward. Sensors without an ``interval`` setting
+    will be read on each duty cycle.
+
+    The scheduling state is kept within the ``sensors`` namespace of
+    the persistent state, in order to survive deep sleep cycles. When
+    it is stored on the filesystem, it will only be written each
+    ``main.state.file_interval`` seconds. So, sensors with shorter
+    intervals might be read more often than configured.
+    """
+
+    # Tolerance in seconds for considering a sensor to be due,
+    # accounting for jitter of wakeup times.
+    DUE_TOLERANCE = 1.0
+
+    def __init__(self, state=None):
+
+        # Scheduling state per sensor, keyed by sensor key.
+        # Each item is a dictionary with ``time`` and ``data``.
+        if state is None:
+            state = {}
+        self.state = state
+
+        # Sensor keys and due status for the current duty cycle, keyed by ``id(sensor)``.
+        self.keys = {}
+        self.due = {}
+        self.now = None
+
+    @staticmethod
+    def get_interval(sensor):
+        """
+        Return the sampling interval of a sensor in seconds, or ``None``.
+        """
+        settings = getattr(sensor, 'settings', None) or {}
+        return settings.get('interval')
+
+    @staticmethod
+    def get_key(sensor, index):
+        """
+        Compute a key for identifying a sensor across reboots.
+        """
+        settings = getattr(sensor, 'settings', None) or {}
+        sensor_id = settings.get('id')
+        if sensor_id is None:
+            sensor_id = '{}:{}'.format(settings.get('type', sensor.__class__.__name__), index)
+        return str(sensor_id)
+
+    def schedule(self, sensors, force=False):
+        """
+        Determine which sensors are due for the current duty cycle.
+
+        :param sensors: List of all sensor objects.
+        :param force: Whether to consider all sensors to be due.
+        :return: List of sensor objects due for reading.
+        """
+        self.now = time.time()
+        self.keys = {}
+        self.due = {}
+
+        due_sensors = []
+        for index, sensor in enumerate(sensors):
+            key = self.get_key(sensor, index)
+            self.keys[id(sensor)] = key
+            due = force or self.is_due_at(sensor, key, self.now)
+            self.due[id(sensor)] = due
+            if due:
+                due_sensors.append(sensor)
+
+        return due_sensors
+
+    def is_due_at(self, sensor, key, now):
+        interval = self.get_interval(sensor)
+        if interval is None:
+            return True
+
+        item = self.state.get(key)
+        if item is None:
+            return True
+
+        # The clock went backwards, e.g. after losing RTC power.
+        if item['time'] > now:
+            return True
+
+        return now + self.DUE_TOLERANCE >= item['time'] + interval
+
+    def is_due(self, sensor):
+        """
+        Whether the sensor is due within the current duty cycle.
+        """
+        return self.due.get(id(sensor), True)
+
+    def get_last_data(self, sensor):
+        """
+        Return the last reading of a sensor which is not due, or ``None``.
+        """
+        key = self.keys.get(id(sensor))
+        item = self.state.get(key)
+        if item is not None:
+            return item['data']
+
+    def record(self, sensor, data):
+        """
+        Remember reading of a sensor configured with an individual interval.
+
+        :param sensor: The sensor object.
+        :param data: The sensor data dictionary.
+        """
+        if self.get_interval(sensor) is None:
+            return
+        key = self.keys.get(id(sensor))
+        if key is None:
+            return
+        self.state[key] = {'time': self.now, 'data': data}
+
+    def get_time_until_due(self, sensors):
+        """
+        Return the number of seconds until the next sensor
+        with an individual interval will become due, or ``None``.
+
+        :param sensors: List of all sensor objects.
+        """
+        now = time.time()
+        sleep_time = None
+        for index, sensor in enumerate(sensors):
+            interval = self.get_interval(sensor)
+            if interval is None:
+                continue
+
+            item = self.state.get(self.keys.get(id(sensor), self.get_key(sensor, index)))
+            if item is None or item['time'] > now:
+                remaining = interval
+            else:
+                remaining = item['time'] + interval - now
+
+            if sleep_time is None or remaining < sleep_time:
+                sleep_time = remaining
+
+        return sleep_time
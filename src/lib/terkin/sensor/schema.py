@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import json
+
+from terkin import logging
+from terkin.util import allocate_lock, format_exception
+
+log = logging.getLogger(__name__)
+
+
+class FieldSchema:
+    """
+    Registry of telemetry field names.
+
+    Field names like ``temperature.28ff641d8fdf18c1.onewire:0`` are
+    computed once from their parts, e.g. quantity, channel, address
+    and bus name, and looked up afterwards. Each field also gets a
+    small integer ID, which encoders can use instead of the name.
+
+    Sensors register their fields when starting, see
+    ``AbstractSensor.register_fields``. Fields showing up later will
+    be registered on demand, so the order of registration may vary
+    between restarts. In order to keep IDs stable, the schema will be
+    loaded from ``FILENAME`` when starting and saved there when sending
+    IDs for fields which have not been saved yet, see ``to_ids``.
+    """
+
+    FILENAME = 'terkin-fields.json'
+
+    def __init__(self):
+
+        # Map tuples of name parts to field names.
+        self.fields = {}
+
+        # Map field IDs to field names and vice versa.
+        self.names = []
+        self.ids = {}
+
+        # Fields may be registered from concurrent worker threads.
+        self.lock = allocate_lock()
+
+        # Path to the file keeping the schema and whether it is outdated.
+        self.filepath = None
+        self.dirty = False
+
+    def get_fieldname(self, parts):
+        """
+        Return field name for the designated parts, registering it on demand.
+
+        :param parts: Tuple of name parts. Parts which are ``None`` will be skipped.
+        """
+        fieldname = self.fields.get(parts)
+        if fieldname is None:
+            fieldname = '.'.join([str(part) for part in parts if part is not None])
+            self.fields[parts] = fieldname
+            self.add(fieldname)
+        return fieldname
+
+    def add(self, fieldname):
+        """
+        Register field name and return its ID.
+
+        :param fieldname: Field name.
+        """
+        field_id = self.ids.get(fieldname)
+        if field_id is None:
+            with self.lock:
+                field_id = self.ids.get(fieldname)
+                if field_id is None:
+                    field_id = len(self.names)
+                    self.names.append(fieldname)
+                    self.ids[fieldname] = field_id
+                    self.dirty = True
+        return field_id
+
+    def get_id(self, fieldname):
+        """
+        Return ID of field or ``None`` when not registered.
+
+        :param fieldname: Field name.
+        """
+        return self.ids.get(fieldname)
+
+    def get_name(self, field_id):
+        """
+        Return name of field or ``None`` when not registered.
+
+        :param field_id: Field ID.
+        """
+        if 0 <= field_id < len(self.names):
+            return self.names[field_id]
+
+    def to_ids(self, data):
+        """
+        Return copy of the dictionary, keyed by field IDs instead of names.
+        Fields not registered yet will be registered on demand, and the
+        schema will be saved before their IDs are used.
+
+        :param data: Dictionary keyed by field names.
+        """
+        add = self.add
+        result = dict([(add(fieldname), value) for fieldname, value in data.items()])
+        if self.dirty:
+            self.save()
+        return result
+
+    def load(self, filepath):
+        """
+        Load field names saved by a previous run, keeping their IDs.
+
+        :param filepath: Path to the file keeping the schema.
+        """
+        self.filepath = filepath
+        try:
+            with open(filepath, 'r') as instream:
+                names = json.loads(instream.read())
+        except OSError:
+            return
+        except Exception as ex:
+            log.warning('Loading field schema failed: %s', format_exception(ex))
+            return
+        with self.lock:
+            for fieldname in names:
+                if fieldname not in self.ids:
+                    self.ids[fieldname] = len(self.names)
+                    self.names.append(fieldname)
+        log.info('Loaded %s fields from %s', len(names), filepath)
+
+    def save(self):
+        """
+        Save field names in order of their IDs, when the schema changed.
+        """
+        if self.filepath is None:
+            return False
+        with self.lock:
+            if not self.dirty:
+                return True
+            try:
+                log.info('Saving field schema to %s', self.filepath)
+                with open(self.filepath, 'w') as outstream:
+                    outstream.write(json.dumps(self.names))
+                self.dirty = False
+                return True
+            except Exception as ex:
+                log.warning('Saving field schema failed: %s', format_exception(ex))
+                return False
+
+    def to_dict(self):
+        """ """
+        return dict(self.ids)
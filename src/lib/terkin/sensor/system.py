@@ -176,7 +176,7 @@ class SystemVoltage(AbstractSystemSensor):
         adc_samples = [0.0] * self.adc_sample_count
         adc_mean = 0.0
         i = 0
-        log.debug('Reading voltage level on pin {} with voltage divider {}/{}'.format(self.pin, self.resistor_r1, self.resistor_r2))
+        log.debug('Reading voltage level on pin %s with voltage divider %s/%s', self.pin, self.resistor_r1, self.resistor_r2)
 
         # read samples
         if self.platform_info.vendor == self.platform_info.MICROPYTHON.Vanilla:
@@ -221,10 +221,10 @@ class SystemVoltage(AbstractSystemSensor):
         mean_variance = (adc_variance * 10 ** 6) // (adc_mean ** 2)
 
         # log.debug("ADC readings. count=%u:\n%s" %(self.adc_sample_count, str(adc_samples)))
-        log.debug("SystemVoltage: Mean of ADC readings (0-4095) = %15.13f" % adc_mean)
-        log.debug("SystemVoltage: Mean of ADC voltage readings (0-%dmV) = %15.13f" % (raw_voltage, mean_voltage))
-        log.debug("SystemVoltage: Variance of ADC readings = %15.13f" % adc_variance)
-        log.debug("SystemVoltage: 10**6*Variance/(Mean**2) of ADC readings = %15.13f" % mean_variance)
+        log.debug("SystemVoltage: Mean of ADC readings (0-4095) = %15.13f", adc_mean)
+        log.debug("SystemVoltage: Mean of ADC voltage readings (0-%dmV) = %15.13f", raw_voltage, mean_voltage)
+        log.debug("SystemVoltage: Variance of ADC readings = %15.13f", adc_variance)
+        log.debug("SystemVoltage: 10**6*Variance/(Mean**2) of ADC readings = %15.13f", mean_variance)
 
         resistor_sum = self.resistor_r1 + self.resistor_r2
         if self.platform_info.vendor == self.platform_info.MICROPYTHON.Pycom:
@@ -238,7 +238,7 @@ class SystemVoltage(AbstractSystemSensor):
         if self.platform_info.vendor == self.platform_info.MICROPYTHON.Pycom:
             adc_channel.deinit()
 
-        log.debug('Voltage level: {}'.format(voltage_volt))
+        log.debug('Voltage level: %s', voltage_volt)
 
         reading = {self.reading_key: voltage_volt}
         return reading
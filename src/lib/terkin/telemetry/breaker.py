@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import time
+
+from terkin import logging
+from terkin.util import backoff_time
+
+log = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single telemetry target.
+
+    - closed: Transmissions will be attempted. After ``threshold``
+      consecutive failures, the breaker opens.
+    - open: Transmissions will be skipped until the backoff time elapsed.
+    - half-open: A single transmission will be attempted. On success, the
+      breaker closes again, otherwise it reopens with a longer backoff time.
+
+    The state is kept within the designated dictionary, which should be
+    part of the persistent device state in order to survive deep sleep.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, name, state, threshold=3, backoff_min=30, backoff_max=3600):
+        """
+        :param name: Name of the telemetry target, used for logging.
+        :param state: Dictionary for keeping the state.
+        :param threshold: Number of consecutive failures which open the breaker.
+        :param backoff_min: Minimum backoff time in seconds.
+        :param backoff_max: Maximum backoff time in seconds.
+        """
+        self.name = name
+        self.threshold = threshold
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+
+        # Use short keys to save space within RTC memory.
+        # f: Consecutive failures, n: Number of times opened, u: Open until.
+        self.state = state
+        self.state.setdefault('f', 0)
+        self.state.setdefault('n', 0)
+        self.state.setdefault('u', 0)
+
+    @property
+    def failures(self):
+        return self.state['f']
+
+    @property
+    def status(self):
+        if self.state['f'] < self.threshold:
+            return self.CLOSED
+        if time.time() < self.state['u']:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    @property
+    def remaining(self):
+        """Seconds until the breaker will be half-open."""
+        return max(self.state['u'] - time.time(), 0)
+
+    def allow(self):
+        """Whether a transmission should be attempted."""
+        return self.status != self.OPEN
+
+    def record_failure(self):
+        state = self.state
+        state['f'] += 1
+        if state['f'] >= self.threshold:
+            delay = backoff_time(state['n'], minimum=self.backoff_min, maximum=self.backoff_max)
+            state['n'] += 1
+            state['u'] = int(time.time() + delay)
+            log.warning('Circuit breaker for %s opened after %s failures, retrying in %s seconds',
+                        self.name, state['f'], int(delay))
+
+    def record_success(self):
+        state = self.state
+        if state['f'] >= self.threshold:
+            log.info('Circuit breaker for %s closed', self.name)
+        state['f'] = 0
+        state['n'] = 0
+        state['u'] = 0
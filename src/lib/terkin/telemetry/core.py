@@ -2,7 +2,7 @@
 # (c) 2017-2019 Andreas Motl <andreas@terkin.org>
 # (c) 2019 Richard Pobering <richard@hiveeyes.org>
 # License: GNU General Public License, Version 3
-import json
+import time
 from copy import copy
 from urllib.parse import urlsplit, urlencode
 from terkin import logging
@@ -17,11 +17,22 @@ log = logging.getLogger(__name__)
 class TelemetryManager:
     """Manage a number of telemetry adapters."""
 
-    def __init__(self):
+    def __init__(self, metrics=None, concurrent=None, watchdog=None):
         self.adapters = []
         self.errors_seen = {}
         self.failure_count = {}
 
+        # Optionally record transmission latencies and outcomes.
+        self.metrics = metrics
+
+        # Optionally transmit to all adapters concurrently, see ``transmit_concurrent``.
+        self.concurrent = concurrent or {}
+        self.watchdog = watchdog
+        self.executor = None
+
+        # Jobs which exceeded their deadline, but are still running.
+        self.inflight = []
+
     def add_adapter(self, adapter):
         """
 
@@ -36,11 +47,14 @@ class TelemetryManager:
         :param data:
 
         """
+        if self.concurrent.get('enabled', False) and len(self.adapters) > 1:
+            return self.transmit_concurrent(dataframe)
+
         outcomes = {}
         for adapter in self.adapters:
 
             # Dispatch transmission to telemetry adapter.
-            outcome = adapter.transmit(dataframe)
+            outcome = self.transmit_adapter(adapter, dataframe)
 
             # Todo: Propagate last error message into outcome and obtain here.
             channel = adapter.channel_uri
@@ -48,13 +62,156 @@ class TelemetryManager:
 
         return outcomes
 
+    def transmit_concurrent(self, dataframe: DataFrame):
+        """
+        Transmit readings to all adapters concurrently, so the total time
+        will be the one of the slowest target instead of the sum of all.
+        Settings::
+
+            'concurrent': {
+                'enabled': True,
+                'timeout': 15.0,
+                'workers': 4,
+            },
+
+        Use the ``timeout`` setting of telemetry targets to override the
+        deadline per adapter. Adapters exceeding it count as failed.
+        As their transmission can not be cancelled, they will be skipped
+        until it finished, see ``create_jobs``.
+
+        :param dataframe: The readings.
+        """
+        executor = self.get_executor()
+        jobs = self.create_jobs(dataframe)
+        executor.run(jobs)
+        return self.collect_outcomes(jobs)
+
+    def get_executor(self):
+        if self.executor is None:
+            from terkin.concurrency import ConcurrentExecutor
+            self.executor = ConcurrentExecutor(
+                name='telemetry', max_workers=self.concurrent.get('workers', 4), watchdog=self.watchdog)
+        return self.executor
+
+    def create_jobs(self, dataframe: DataFrame):
+        """
+        Create one job per adapter. Each one gets its own copy of the data
+        frame, as adapters amend it while transforming and serializing.
+
+        Adapters still busy with a transmission from a previous cycle
+        will be skipped, so they never run on two threads at once.
+
+        :param dataframe: The readings.
+        """
+        from terkin.concurrency import ConcurrentJob
+
+        def transmit_job(job, adapter, frame):
+            return self.transmit_adapter(adapter, frame)
+
+        self.inflight = [job for job in self.inflight if not job.done]
+        busy = [job.name for job in self.inflight]
+
+        default_timeout = self.concurrent.get('timeout', 15.0)
+        jobs = []
+        for adapter in self.adapters:
+            if adapter.channel_uri in busy:
+                log.warning('Telemetry to %s is still in progress, skipping it', adapter.channel_uri)
+                continue
+            frame = DataFrame()
+            frame.readings.extend(dataframe.readings)
+            frame.data_in.update(dataframe.data_in)
+            timeout = adapter.target.get('timeout', default_timeout) if hasattr(adapter, 'target') else default_timeout
+            jobs.append(ConcurrentJob(adapter.channel_uri, transmit_job, args=(adapter, frame), timeout=timeout))
+        return jobs
+
+    def collect_outcomes(self, jobs):
+        """
+        Aggregate outcomes of all jobs, keyed by channel URI.
+        Adapters which have been skipped count as failed.
+
+        :param jobs: List of finished or abandoned ``ConcurrentJob`` objects.
+        """
+        outcomes = {}
+        for job in jobs:
+            if job.timed_out:
+                log.warning('Telemetry to %s exceeded its deadline', job.name)
+                outcomes[job.name] = False
+                if not job.done:
+                    self.inflight.append(job)
+            elif job.error is not None:
+                log.warning('Telemetry to %s failed: %s', job.name, format_exception(job.error))
+                outcomes[job.name] = False
+            else:
+                outcomes[job.name] = job.result
+        for job in self.inflight:
+            if job.name not in outcomes:
+                outcomes[job.name] = False
+        return outcomes
+
+    def wait(self, timeout=None):
+        """
+        Wait for transmissions which exceeded their deadline to finish,
+        e.g. before shutting down networking.
+
+        :param timeout: Timeout in seconds. Default: The ``timeout`` setting.
+        :return: Whether all of them finished.
+        """
+        if timeout is None:
+            timeout = self.concurrent.get('timeout', 15.0)
+
+        start = time.ticks_ms()
+        while True:
+            self.inflight = [job for job in self.inflight if not job.done]
+            if not self.inflight:
+                return True
+            if time.ticks_diff(time.ticks_ms(), start) > timeout * 1000:
+                log.warning('Telemetry to %s did not finish in time',
+                            ', '.join([job.name for job in self.inflight]))
+                return False
+            if self.watchdog is not None:
+                self.watchdog.feed()
+            time.sleep(0.05)
+
+    def transmit_adapter(self, adapter, dataframe: DataFrame):
+        """
+        Dispatch transmission to a single telemetry adapter.
+
+        :param adapter: The telemetry adapter.
+        :param dataframe: The readings.
+        """
+
+        if self.metrics is None:
+            return adapter.transmit(dataframe)
+
+        dataframe.payload_out = None
+        start = time.ticks_ms()
+        outcome = adapter.transmit(dataframe)
+        duration = time.ticks_diff(time.ticks_ms(), start)
+
+        size = None
+        if dataframe.payload_out is not None:
+            size = len(dataframe.payload_out)
+        self.metrics.record('telemetry', adapter.channel_uri, duration, success=outcome is True, size=size)
+
+        return outcome
+
+    def flush(self):
+        """
+        Transmit readings queued for batch transmission, e.g. before shutting down.
+        """
+        outcomes = {}
+        for adapter in self.adapters:
+            if getattr(adapter, 'batch', None):
+                outcomes[adapter.channel_uri] = adapter.flush()
+        return outcomes
+
 
 class TelemetryAdapter:
     """
     Telemetry node client: Network participant API
-    Todo: Implement exponential backoff instead of MAX_FAILURES.
     """
 
+    # Consecutive failures opening the circuit breaker by default.
     MAX_FAILURES = 3
 
     def __init__(self, device=None, target=None):
@@ -79,7 +236,17 @@ class TelemetryAdapter:
         self.topology = None
 
         self.offline = False
-        self.failure_count = 0
+
+        # Circuit breaker skipping transmissions while the target is unreachable.
+        self.breaker = None
+
+        # Store-and-forward journal for readings which could not be transmitted (optional).
+        self.journal = None
+        self.journal_settings = {}
+
+        # Readings queued for batch transmission, as lists of ``[timestamp, data]`` (optional).
+        self.batch = None
+        self.batch_settings = self.target.get('batch') or {}
 
     def setup(self):
         """ """
@@ -95,15 +262,81 @@ class TelemetryAdapter:
         # Resolve designated telemetry client.
         self.client = self.client_factory()
 
+        # Stop trying unreachable targets for a while.
+        breaker_settings = self.device.settings.get('telemetry.breaker') or {}
+        if breaker_settings.get('enabled', False) and self.target.get('breaker', True):
+            self.breaker = self.breaker_factory(breaker_settings)
+
+        # Keep readings on flash while the target is unreachable.
+        self.journal_settings = self.device.settings.get('telemetry.journal') or {}
+        if self.journal_settings.get('enabled', False) and self.target.get('journal', True):
+            self.journal = self.journal_factory()
+
+        # Queue readings within the persistent state, so batches survive deep sleep.
+        if self.batch_settings:
+            self.batch = self.device.state.scope('telemetry_batch').setdefault(self.channel_uri, [])
+
+    def journal_factory(self):
+        """
+        Create journal within ``<CONFIG_PATH>/journal/<name>``. The name defaults
+        to the checksum of the channel URI, so each target gets its own journal.
+
+        With ``backend = 'sqlite'``, all targets share the SQLite database
+        ``<CONFIG_PATH>/journal/journal.sqlite``, see ``terkin_cpython.journal``.
+        """
+        import binascii
+        from terkin.util import ensure_directory
+        path = self.device.settings.CONFIG_PATH + '/journal'
+        ensure_directory(path)
+        name = self.target.get('name') or '{:08x}'.format(binascii.crc32(self.channel_uri.encode()) & 0xFFFFFFFF)
+
+        backend = self.journal_settings.get('backend', 'flash')
+        if backend == 'sqlite':
+            from terkin_cpython.journal import SQLiteTelemetryJournal
+            journal = SQLiteTelemetryJournal.from_settings(self.journal_settings, path + '/journal.sqlite', name)
+        elif backend == 'flash':
+            from terkin.telemetry.journal import TelemetryJournal
+            journal = TelemetryJournal.from_settings(self.journal_settings, path + '/' + name)
+        else:
+            raise ValueError('Unknown telemetry journal backend "{}"'.format(backend))
+
+        if journal.pending:
+            log.info('Telemetry journal for %s has %s pending readings', self.channel_uri, journal.pending)
+        return journal
+
+    def breaker_factory(self, settings):
+        """
+        Create circuit breaker, keeping its state within the persistent
+        device state, so it survives deep sleep cycles.
+
+        :param settings: ``telemetry.breaker`` settings.
+        """
+        from terkin.telemetry.breaker import CircuitBreaker
+        state = getattr(self.device, 'state', None)
+        if state is not None:
+            breaker_state = state.scope('telemetry_breaker').setdefault(self.channel_uri, {})
+        else:
+            breaker_state = {}
+        return CircuitBreaker(
+            self.channel_uri, breaker_state,
+            threshold=settings.get('failures', self.MAX_FAILURES),
+            backoff_min=settings.get('backoff_min', 30),
+            backoff_max=settings.get('backoff_max', 3600))
+
     def client_factory(self):
         """ """
+        settings = self.target.get('settings') or {}
+        schema = None
+        if settings.get('field_ids', False):
+            schema = self.device.application_info.application.sensor_manager.schema
         client = TelemetryClient(interface=self.interface,
                                  uri=self.channel_uri,
                                  format=self.format,
                                  content_encoding=self.content_encoding,
                                  uri_suffixes=self.topology.uri_suffixes,
-                                 settings=self.target.get('settings'),
-                                 networking=self.device.networking)
+                                 settings=settings,
+                                 networking=self.device.networking,
+                                 schema=schema)
         return client
 
     def topology_factory(self):
@@ -122,17 +355,192 @@ class TelemetryAdapter:
 
     def transmit(self, dataframe: DataFrame):
         """
+        Transmit readings. When a journal is configured, keep them
+        on failure and forward pending readings on success.
+
+        :param dataframe:
+
+        """
+
+        if self.batch is not None:
+            return self.enqueue(dataframe)
+
+        outcome = self.transmit_dataframe(dataframe)
+
+        if self.journal is not None:
+            try:
+                if outcome is True:
+                    self.drain_journal()
+                else:
+                    self.journal.append(dataframe.data_in, timestamp=self.get_timestamp(dataframe))
+                    log.info('Stored readings in telemetry journal, %s pending', self.journal.pending)
+            except Exception as ex:
+                log.warning('Telemetry journal for %s failed: %s', self.channel_uri, format_exception(ex))
+
+        return outcome
+
+    def get_timestamp(self, dataframe: DataFrame):
+        """
+        Return time of the readings within the dataframe.
+        """
+        if dataframe.readings:
+            return int(dataframe.readings[0].timestamp)
+        return int(time.time())
+
+    def enqueue(self, dataframe: DataFrame):
+        """
+        Queue readings for batch transmission and transmit the batch when
+        it has reached ``batch.size`` readings or its oldest reading is
+        older than ``batch.age`` seconds. Settings::
+
+            'batch': {
+                'size': 10,
+                'age': 3600,
+                'limit': 100,
+                'timestamp_field': 'time',
+            },
 
         :param dataframe:
+        """
+
+        self.batch.append([self.get_timestamp(dataframe), dict(dataframe.data_in)])
+
+        # Drop the oldest readings when transmissions keep failing.
+        limit = self.batch_settings.get('limit', 100)
+        if len(self.batch) > limit:
+            log.warning('Batch for %s exceeds %s readings, dropping the oldest ones', self.channel_uri, limit)
+            del self.batch[:len(self.batch) - limit]
+
+        if not self.batch_due():
+            log.info('Queued readings for batch transmission to %s (%s/%s)',
+                     self.channel_uri, len(self.batch), self.batch_settings.get('size', 10))
+            return True
+
+        return self.flush()
 
+    def batch_due(self):
+        """
+        Whether the batch should be transmitted.
+        """
+        if len(self.batch) >= self.batch_settings.get('size', 10):
+            return True
+        age = self.batch_settings.get('age')
+        return age is not None and time.time() - self.batch[0][0] >= age
+
+    def flush(self):
+        """
+        Transmit all queued readings within a single request. When this
+        fails, keep them within the journal if configured, otherwise
+        keep them queued for the next attempt.
+        """
+        if not self.batch:
+            return True
+
+        count = len(self.batch)
+        log.info('Transmitting batch of %s readings to %s', count, self.channel_uri)
+        outcome = self.transmit_rows(self.batch[:count])
+
+        if outcome is True:
+            del self.batch[:count]
+            if self.journal is not None:
+                self.drain_journal()
+
+        elif self.journal is not None:
+            try:
+                self.journal.append_many(self.batch[:count])
+                del self.batch[:count]
+                log.info('Stored batch in telemetry journal, %s pending', self.journal.pending)
+            except Exception as ex:
+                log.warning('Telemetry journal for %s failed: %s', self.channel_uri, format_exception(ex))
+
+        return outcome
+
+    def transmit_rows(self, rows):
+        """
+        Transform readings and transmit them within a single request.
+
+        :param rows: List of ``(timestamp, data)`` items.
         """
 
         self.device.watchdog.feed()
 
         if not self.is_online():
-            # Todo: Suppress this message after a while or reduce interval.
-            message = 'Adapter is offline, skipping telemetry to {}'.format(self.channel_uri)
-            log.warning(message)
+            log.warning('Adapter is offline, skipping batch telemetry to %s for %s seconds',
+                        self.channel_uri, int(self.breaker.remaining))
+            return False
+
+        try:
+            dataframe = DataFrame()
+            items = []
+            for timestamp, data in rows:
+                dataframe.reset()
+                dataframe.data_in.update(data)
+                self.transform(dataframe)
+                items.append((timestamp, dict(dataframe.data_out)))
+        except Exception as ex:
+            log.exc(ex, 'Transmission transform for topology "%s" failed', self.topology_name)
+            return False
+
+        try:
+            outcome = self.client.transmit_batch(items, timestamp_field=self.batch_settings.get('timestamp_field', 'time'))
+            if outcome is True:
+                self.reset_errors()
+            return outcome
+
+        except Exception as ex:
+            self.record_error()
+            log.warning('Batch telemetry to %s failed: %s', self.channel_uri, format_exception(ex))
+
+        return False
+
+    def drain_journal(self):
+        """
+        Forward one batch of pending readings from the journal. In batch mode,
+        they will be transmitted within a single request, otherwise one after
+        another, stopping at the first failure.
+
+        Forwarded readings carry the time they have been taken within the
+        ``timestamp_field`` journal setting, ``time`` by default. Set it to
+        ``None`` to forward them as they are.
+        """
+        batch = self.journal.read(limit=self.journal_settings.get('batch_size', 10))
+        if not batch:
+            return
+
+        log.info('Forwarding %s of %s pending readings to %s', len(batch), self.journal.pending, self.channel_uri)
+
+        if self.batch is not None:
+            if self.transmit_rows([(timestamp, data) for sequence, timestamp, data in batch]) is True:
+                self.journal.commit(batch[-1][0])
+            return
+
+        timestamp_field = self.journal_settings.get('timestamp_field', 'time')
+        dataframe = DataFrame()
+        acknowledged = None
+        for sequence, timestamp, data in batch:
+            dataframe.reset()
+            dataframe.data_in.update(data)
+            if timestamp_field:
+                dataframe.data_in[timestamp_field] = timestamp
+            if self.transmit_dataframe(dataframe) is not True:
+                break
+            acknowledged = sequence
+
+        if acknowledged is not None:
+            self.journal.commit(acknowledged)
+
+    def transmit_dataframe(self, dataframe: DataFrame):
+        """
+
+        :param dataframe:
+
+        """
+
+        self.device.watchdog.feed()
+
+        if not self.is_online():
+            log.warning('Adapter is offline, skipping telemetry to %s for %s seconds',
+                        self.channel_uri, int(self.breaker.remaining))
             return False
 
         # Transform into egress telemetry payload
@@ -145,16 +553,16 @@ class TelemetryAdapter:
 
         try:
             outcome = self.client.transmit(dataframe)
-            self.reset_errors()
+            if outcome is True:
+                self.reset_errors()
             return outcome
 
         except Exception as ex:
             self.record_error()
-            message = 'Telemetry to {} failed'.format(self.channel_uri)
             if self.offline:
-                log.warning(message)
+                log.warning('Telemetry to %s failed: %s', self.channel_uri, format_exception(ex))
             else:
-                log.exc(ex, message)
+                log.exc(ex, 'Telemetry to %s failed', self.channel_uri)
 
         return False
 
@@ -173,21 +581,32 @@ class TelemetryAdapter:
                 encoder(dataframe)
 
     def is_online(self):
-        """ """
-
-        # Short-cut online/offline state.
-        return True
+        """
+        Whether transmissions should be attempted, i.e. the
+        circuit breaker is closed or half-open.
+        """
+        if self.breaker is None:
+            return True
+        return self.breaker.allow()
 
-        # Todo: Re-enable online/offline state.
-        #return self.failure_count < self.MAX_FAILURES
+    @property
+    def failure_count(self):
+        """Number of consecutive failures."""
+        if self.breaker is None:
+            return 0
+        return self.breaker.failures
 
     def record_error(self):
         """ """
-        self.failure_count += 1
+        if self.breaker is not None:
+            self.breaker.record_failure()
+            self.offline = self.breaker.status == self.breaker.OPEN
 
     def reset_errors(self):
         """ """
-        self.failure_count = 0
+        if self.breaker is not None:
+            self.breaker.record_success()
+        self.offline = False
 
 
 class CSVTelemetryAdapter(TelemetryAdapter):
@@ -227,6 +646,9 @@ class TelemetryClient:
     FORMAT_URLENCODED = 'urlencoded'
     FORMAT_JSON = 'json'
     FORMAT_CSV = 'csv'
+    FORMAT_LINEPROTOCOL = 'lineprotocol'
+    FORMAT_CBOR = 'cbor'
+    FORMAT_MSGPACK = 'msgpack'
 
     FORMAT_CAYENNELPP_HIVEEYES = 'lpp-hiveeyes'
     FORMAT_CAYENNELPP_RATRACK = 'lpp-ratrack'
@@ -234,7 +656,8 @@ class TelemetryClient:
     CONTENT_ENCODING_IDENTITY = 'identity'
     CONTENT_ENCODING_BASE64 = 'base64'
 
-    def __init__(self, interface, uri, format, content_encoding=None, uri_suffixes=None, settings=None, networking=None):
+    def __init__(self, interface, uri, format, content_encoding=None, uri_suffixes=None, settings=None, networking=None,
+                 schema=None):
 
         log.info('Starting Terkin TelemetryClient')
         self.interface = interface
@@ -250,6 +673,12 @@ class TelemetryClient:
 
         self.networking = networking
 
+        # Field schema for sending field IDs instead of names, see ``get_fields``.
+        self.schema = schema
+
+        # Serializer keeping a template for the field names.
+        self.json_encoder = None
+
         self.scheme, self.netloc, self.path, self.query, self.fragment = urlsplit(self.uri)
 
         if self.scheme in ['http', 'https']:
@@ -275,7 +704,7 @@ class TelemetryClient:
             payload = urlencode(dataframe.data_out)
 
         elif self.format == TelemetryClient.FORMAT_JSON:
-            payload = json.dumps(dataframe.data_out)
+            payload = self.get_json_encoder().encode(dataframe.data_out)
 
         elif self.format == TelemetryClient.FORMAT_CAYENNELPP_HIVEEYES:
             from terkin.telemetry.formatter import to_cayenne_lpp_hiveeyes
@@ -289,17 +718,99 @@ class TelemetryClient:
             from terkin.telemetry.formatter import to_csv
             payload = to_csv(dataframe)
 
+        elif self.format == TelemetryClient.FORMAT_LINEPROTOCOL:
+            from terkin.telemetry.formatter import to_lineprotocol
+            payload = to_lineprotocol([(None, dataframe.data_out)], self.settings.get('measurement', 'terkin'))
+
+        elif self.format == TelemetryClient.FORMAT_CBOR:
+            from terkin.telemetry.formatter import to_cbor
+            payload = to_cbor(self.get_fields(dataframe.data_out), float32=self.settings.get('float32', False))
+
+        elif self.format == TelemetryClient.FORMAT_MSGPACK:
+            from terkin.telemetry.formatter import to_msgpack
+            payload = to_msgpack(self.get_fields(dataframe.data_out), float32=self.settings.get('float32', False))
+
         else:
             raise ValueError('Unknown serialization format "{}"'.format(self.format))
 
-        # Apply content encoding.
+        dataframe.payload_out = self.encode_content(payload)
+
+    def get_fields(self, data):
+        """
+        For the binary formats, optionally key readings by the small integer
+        IDs of the field schema instead of field names, using the ``field_ids``
+        setting. Receivers can obtain the mapping through ``/api/v1/fields``.
+
+        :param data: Dictionary keyed by field names.
+        """
+        if self.schema is not None and self.settings.get('field_ids', False):
+            return self.schema.to_ids(data)
+        return data
+
+    def serialize_batch(self, rows, timestamp_field='time'):
+        """
+        Serialize multiple readings into a single payload.
+
+        - JSON, CBOR, MessagePack: Array of objects, each carrying its timestamp within ``timestamp_field``.
+        - CSV: One row per reading.
+        - Line protocol: One line per reading.
+
+        :param rows: List of ``(timestamp, data)`` tuples.
+        :param timestamp_field: Name of the timestamp field for JSON.
+        """
+
+        if self.format == TelemetryClient.FORMAT_JSON:
+            encoder = self.get_json_encoder()
+            items = []
+            for timestamp, data in rows:
+                item = dict(data)
+                item[timestamp_field] = timestamp
+                items.append(encoder.encode(item))
+            payload = '[' + ', '.join(items) + ']'
+
+        elif self.format == TelemetryClient.FORMAT_CSV:
+            from terkin.telemetry.formatter import to_csv_rows
+            payload = to_csv_rows(rows)
+
+        elif self.format == TelemetryClient.FORMAT_LINEPROTOCOL:
+            from terkin.telemetry.formatter import to_lineprotocol
+            payload = to_lineprotocol(rows, self.settings.get('measurement', 'terkin'))
+
+        elif self.format in (TelemetryClient.FORMAT_CBOR, TelemetryClient.FORMAT_MSGPACK):
+            from terkin.telemetry.formatter import to_cbor, to_msgpack
+            encoder = to_cbor if self.format == TelemetryClient.FORMAT_CBOR else to_msgpack
+            items = []
+            for timestamp, data in rows:
+                item = dict(data)
+                item[timestamp_field] = timestamp
+                items.append(self.get_fields(item))
+            payload = encoder(items, float32=self.settings.get('float32', False))
+
+        else:
+            raise ValueError('Batch serialization not supported for format "{}"'.format(self.format))
+
+        return self.encode_content(payload)
+
+    def get_json_encoder(self):
+        """ """
+        if self.json_encoder is None:
+            from terkin.telemetry.formatter import CompiledJSONEncoder
+            self.json_encoder = CompiledJSONEncoder()
+        return self.json_encoder
+
+    def encode_content(self, payload):
+        """
+        Apply content encoding.
+
+        :param payload: Serialized payload.
+        """
         if self.content_encoding in (None, self.CONTENT_ENCODING_IDENTITY):
             pass
 
         elif self.content_encoding == self.CONTENT_ENCODING_BASE64:
             payload = to_base64(payload)
 
-        dataframe.payload_out = payload
+        return payload
 
     def transmit(self, dataframe: DataFrame, uri=None, serialize=True):
         """
@@ -331,6 +842,20 @@ class TelemetryClient:
         # Submit dataframe to handler.
         return handler.send(dataframe)
 
+    def transmit_batch(self, rows, timestamp_field='time'):
+        """
+        Submit multiple readings within a single request.
+
+        :param rows: List of ``(timestamp, data)`` tuples.
+        :param timestamp_field: Name of the timestamp field for JSON.
+        """
+        suffix = self.uri_suffixes.get(self.transport, '').format(**self.__dict__)
+        handler = self.get_handler(self.uri + suffix)
+
+        dataframe = DataFrame()
+        dataframe.payload_out = self.serialize_batch(rows, timestamp_field=timestamp_field)
+        return handler.send(dataframe)
+
     def get_handler(self, uri):
         """
         :param uri:
@@ -343,10 +868,10 @@ class TelemetryClient:
             handler = TelemetryTransportHTTPOverGPRS(self.networking.gprs_manager, uri, self.format)
 
         elif self.transport == TelemetryClient.TRANSPORT_HTTP:
-            handler = TelemetryTransportHTTP(uri, self.format)
+            handler = TelemetryTransportHTTP(uri, self.format, settings=self.settings)
 
         elif self.transport == TelemetryClient.TRANSPORT_MQTT:
-            handler = TelemetryTransportMQTT(uri, self.format)
+            handler = TelemetryTransportMQTT(uri, self.format, settings=self.settings)
 
         elif self.transport == TelemetryClient.TRANSPORT_LORA:
             handler = TelemetryTransportLORA(self.networking.lora_manager, self.settings)
@@ -362,10 +887,11 @@ class TelemetryClient:
 class TelemetryTransportHTTP:
     """ """
 
-    def __init__(self, uri, format):
+    def __init__(self, uri, format, settings=None):
 
         self.uri = uri
         self.format = format
+        self.settings = settings or {}
 
         self.scheme, self.netloc, self.path, self.query, self.fragment = urlsplit(self.uri)
 
@@ -384,6 +910,15 @@ class TelemetryTransportHTTP:
         elif self.format == TelemetryClient.FORMAT_CSV:
             self.content_type = 'text/csv'
 
+        elif self.format == TelemetryClient.FORMAT_LINEPROTOCOL:
+            self.content_type = 'text/plain; charset=utf-8'
+
+        elif self.format == TelemetryClient.FORMAT_CBOR:
+            self.content_type = 'application/cbor'
+
+        elif self.format == TelemetryClient.FORMAT_MSGPACK:
+            self.content_type = 'application/msgpack'
+
         else:
             raise ValueError('Unknown serialization format for TelemetryTransportHTTP: {}'.format(format))
 
@@ -396,14 +931,31 @@ class TelemetryTransportHTTP:
         log.info('Sending HTTP request to %s', self.uri)
         log.info('HTTP payload: %s', dataframe.payload_out)
 
-        import urequests
-        response = urequests.post(self.uri, data=dataframe.payload_out.encode(), headers={'Content-Type': self.content_type})
+        if self.settings.get('keepalive', False):
+            response = self.post_keepalive(dataframe.payload_out)
+        else:
+            import urequests
+            payload = dataframe.payload_out
+            if isinstance(payload, str):
+                payload = payload.encode()
+            response = urequests.post(self.uri, data=payload, headers={'Content-Type': self.content_type})
         if response.status_code in [200, 201]:
             return True
         else:
             message = 'HTTP request failed: {} {}\n{}'.format(response.status_code, response.reason, response.content)
             raise TelemetryTransportError(message)
 
+    def post_keepalive(self, payload):
+        """
+        Submit payload through a pooled HTTP/1.1 connection, which
+        is kept open across measurement cycles.
+
+        :param payload: Request body as ``str`` or ``bytes``.
+        """
+        from terkin.network.http import HttpConnection
+        connection, path = HttpConnection.get(self.uri, timeout=self.settings.get('timeout', 10.0))
+        return connection.request('POST', path, body=payload, headers={'Content-Type': self.content_type})
+
 
 class TelemetryTransportHTTPOverGPRS(TelemetryTransportHTTP):
 
@@ -554,13 +1106,14 @@ class TelemetryTransportMQTT:
 
     connections = {}
 
-    def __init__(self, uri, format):
+    def __init__(self, uri, format, settings=None):
 
         log.info('Telemetry transport: MQTT over TCP')
 
         # Addressing.
         self.uri = uri
         self.format = format
+        self.settings = settings or {}
 
         # v1
         #self.scheme, self.netloc, self.path, self.query, self.fragment = urlsplit(self.uri)
@@ -585,16 +1138,18 @@ class TelemetryTransportMQTT:
         # Create one MQTTAdapter instance per target host:port.
         if self.target.netloc not in self.connections:
             # TODO: Add more parameters to MQTTAdapter here.
-            log.info('Connecting to MQTT broker at {} with username {}. '
-                     'client_id={}'.format(self.target.hostname, self.target.username, self.client_id))
+            log.info('Connecting to MQTT broker at %s with username %s. '
+                     'client_id=%s', self.target.hostname, self.target.username, self.client_id)
             try:
                 self.connections[self.target.netloc] = MQTTAdapter(self.client_id,
                                                                    self.target.hostname,
+                                                                   port=self.target.port or 0,
                                                                    username=self.target.username,
-                                                                   password=self.target.password)
+                                                                   password=self.target.password,
+                                                                   settings=self.settings)
             except Exception:
-                log.warning('Connecting to MQTT broker at {} '
-                            'with username {} failed'.format(self.target.hostname, self.target.username))
+                log.warning('Connecting to MQTT broker at %s '
+                            'with username %s failed', self.target.hostname, self.target.username)
                 # Todo: Re-enable defunctness
                 #self.defunct = True
 
@@ -604,6 +1159,26 @@ class TelemetryTransportMQTT:
         """ """
         return self.ensure_connection()
 
+    @classmethod
+    def poll_all(cls):
+        """
+        Process acknowledgements and keep all MQTT connections alive.
+        """
+        for connection in cls.connections.values():
+            connection.poll()
+
+    @classmethod
+    def drain_all(cls, timeout=None):
+        """
+        Wait for all messages in flight to be acknowledged, e.g.
+        before going to deep sleep, and disconnect.
+
+        :param timeout: How long to wait per connection, in seconds.
+        """
+        for connection in cls.connections.values():
+            connection.drain(timeout=timeout)
+            connection.disconnect()
+
     def send(self, dataframe: DataFrame):
         """
         :param dataframe: defined in terkin/model.py
@@ -652,6 +1227,11 @@ class MQTTAdapter:
     MQTT adapter wrapping the lowlevel MQTT driver.
     Handles a single connection to an MQTT broker.
 
+    Messages are published through a ``MQTTSession``, which does not
+    wait for acknowledgements of each QoS 1 message but keeps up to
+    ``window`` messages in flight. After connection failures,
+    reconnecting will be attempted with exponential backoff.
+
     TODO: Try to make this module reasonably compatible again
           by becoming an adapter for different implementations.
           E.g., what about Paho?
@@ -659,15 +1239,21 @@ class MQTTAdapter:
 
     """
 
-    def __init__(self, client_id, server, port=0, username=None, password=None):
+    def __init__(self, client_id, server, port=0, username=None, password=None, settings=None):
 
-        # TODO: Add more parameters: keepalive=0, ssl=False, ssl_params={}
+        # TODO: Add more parameters: ssl=False, ssl_params={}
         self.client_id = client_id
         self.server = server
         self.port = port
         self.username = username
         self.password = password
 
+        settings = settings or {}
+        self.qos = settings.get('qos', 1)
+        self.keepalive = settings.get('keepalive', 60)
+        self.backoff_min = settings.get('backoff_min', 2)
+        self.backoff_max = settings.get('backoff_max', 300)
+
         # Transport driver.
         self.driver_class = None
         self.load_driver()
@@ -675,9 +1261,20 @@ class MQTTAdapter:
         # Connection instance.
         self.connection = None
 
+        # Session state, surviving reconnects.
+        from terkin.telemetry.mqtt import MQTTSession
+        self.session = MQTTSession(
+            clean_session=settings.get('clean_session', False),
+            window=settings.get('window', 8),
+            timeout=settings.get('timeout', 5.0))
+
         # Status flags.
         self.connected = False
 
+        # Reconnect backoff.
+        self.backoff = 0
+        self.reconnect_at = 0
+
     def load_driver(self):
         """Load MQTT driver module"""
 
@@ -697,30 +1294,49 @@ class MQTTAdapter:
 
     def connect(self):
         """Connect to MQTT broker"""
+
+        # Don't hammer the broker while it is unavailable.
+        remaining = self.reconnect_at - time.time()
+        if remaining > 0:
+            message = 'Reconnecting to MQTT broker at {} deferred for {} seconds'.format(self.server, int(remaining))
+            raise TelemetryAdapterError(message)
+
         try:
-            log.info('Connecting to MQTT broker at {} with username {}'.format(self.server, self.username))
-            self.connection = self.driver_class(self.client_id, self.server, port=self.port, user=self.username, password=self.password)
+            log.info('Connecting to MQTT broker at %s with username %s', self.server, self.username)
+            self.connection = self.driver_class(self.client_id, self.server, port=self.port,
+                                                user=self.username, password=self.password,
+                                                keepalive=self.keepalive)
             self.connection.DEBUG = True
-            self.connection.connect()
+            session_present = self.session.start(self.connection)
             self.connected = True
-            log.info('Connecting to MQTT broker at %s succeeded', self.connection.addr)
+            self.backoff = 0
+            log.info('Connecting to MQTT broker at %s succeeded, session present: %s',
+                     self.connection.addr, session_present)
 
         except Exception as ex:
             # FIXME: Evaluate exception. "MQTTException: 5" means "Authentication/Authorization failed".
-            self.connected = False
+            self.disconnect()
+            self.backoff = min(max(self.backoff * 2, self.backoff_min), self.backoff_max)
+            self.reconnect_at = time.time() + self.backoff
             message = 'Connecting to MQTT broker at {} failed: {}'.format(self.server, format_exception(ex))
             log.exc(ex, message)
             raise TelemetryAdapterError(message)
 
         return self.connected
 
-    def publish(self, topic, payload, retain=False, qos=1):
+    def disconnect(self):
+        """Close connection to MQTT broker, keeping the session state"""
+        self.session.stop()
+        self.connection = None
+        self.connected = False
+
+    def publish(self, topic, payload, retain=False, qos=None):
         """
 
         :param topic:
         :param payload:
         :param retain:  (Default value = False)
-        :param qos:  (Default value = 1)
+        :param qos:  (Default value = ``qos`` setting of telemetry target)
 
         """
 
@@ -732,28 +1348,50 @@ class MQTTAdapter:
             log.warning(message)
             raise TelemetryAdapterError(message)
 
+        if qos is None:
+            qos = self.qos
+
         try:
-            # TODO: Make qos level configurable.
-            self.connection.publish(topic, payload, retain=retain, qos=qos)
+            self.session.publish(topic, payload, retain=retain, qos=qos)
 
         except OSError as ex:
 
+            # Signal connection error in order to reconnect on next submission attempt.
+            self.disconnect()
+
             message = 'MQTT publishing failed'
             log.exc(ex, message)
 
-            # Signal connection error in order to reconnect on next submission attempt.
-            # [Errno 104] ECONNRESET
-            # [Errno 113] ECONNABORTED
-            try:
-                if ex.errno in [104, 113]:
-                    self.connected = False
-            except AttributeError:
-                print('Exception has no "errno" attribute', dir(ex))
-                self.connected = False
-
             message = '{}: {}'.format(message, ex)
             raise TelemetryAdapterError(message)
 
+    def poll(self):
+        """Process acknowledgements and send keepalive pings"""
+        if not self.connected:
+            return
+        try:
+            self.session.poll()
+        except OSError as ex:
+            log.warning('MQTT connection to %s lost: %s', self.server, format_exception(ex))
+            self.disconnect()
+
+    def drain(self, timeout=None):
+        """
+        Wait until all messages in flight have been acknowledged.
+
+        :param timeout: How long to wait, in seconds.
+        """
+        if not self.connected or not self.session.inflight:
+            return True
+        try:
+            if self.session.drain(timeout=timeout):
+                return True
+        except OSError as ex:
+            log.warning('MQTT connection to %s lost: %s', self.server, format_exception(ex))
+            self.disconnect()
+        log.warning('%s MQTT messages to %s have not been acknowledged', len(self.session.inflight), self.server)
+        return False
+
 
 class TelemetryTopology:
     """Define **how** to communicate using Telemetry."""
@@ -882,6 +1520,9 @@ class MqttKitTopology(IdentityTopology):
 
     """
     uri_template = u'{base_uri}/{realm}/{network}/{gateway}/{node}'
+
+    # The MQTT topic reflects the serialization format, like ``data.json``,
+    # ``data.cbor`` or ``data.msgpack``. Over HTTP, the content type does.
     uri_suffixes = {
         TelemetryClient.TRANSPORT_HTTP: '/data',
         TelemetryClient.TRANSPORT_MQTT: '/data.{format}',
@@ -106,7 +106,7 @@ def to_cayenne_lpp_hiveeyes(dataframe: DataFrame):
 
         else:
             # TODO: raise Exception here?
-            log.info('[CayenneLPP] Sensor type "{}" not found in CayenneLPP'.format(name))
+            log.info('[CayenneLPP] Sensor type "%s" not found in CayenneLPP', name)
 
     return frame.bytes()
 
@@ -179,3 +179,353 @@ def to_csv(dataframe: DataFrame):
         buff.write(NEWLINE)
         buff.write(DELIM.join([dt] + [str(value) for value in dataframe.data_out.values()]))
         return buff.getvalue()
+
+
+def format_isotime(timestamp):
+    """Format epoch seconds as ISO 8601 local time."""
+    import time
+    return "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}".format(*time.localtime(int(timestamp))[:6])
+
+
+def to_csv_rows(rows):
+    """
+    Return a multi-row CSV string with headers.
+
+    :param rows: List of ``(timestamp, data)`` tuples.
+    """
+    DELIM = ","
+    NEWLINE = "\n"
+
+    # Collect columns of all rows, in order of appearance.
+    keys = []
+    seen = set()
+    for timestamp, data in rows:
+        for key in data:
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+
+    from uio import StringIO
+    with StringIO() as buff:
+        buff.write(DELIM.join(["datetime.ISO8601"] + [str(key) for key in keys]))
+        for timestamp, data in rows:
+            buff.write(NEWLINE)
+            buff.write(DELIM.join([format_isotime(timestamp)] + [str(data.get(key, '')) for key in keys]))
+        return buff.getvalue()
+
+
+def escape_lineprotocol(value, characters):
+    for character in characters:
+        value = value.replace(character, '\\' + character)
+    return value
+
+
+def to_lineprotocol(rows, measurement='terkin'):
+    """
+    Return InfluxDB line protocol, one line per row.
+    Timestamps are given in nanoseconds.
+
+    :param rows: List of ``(timestamp, data)`` tuples. The timestamp may be ``None``.
+    :param measurement: Name of the measurement.
+    """
+    measurement = escape_lineprotocol(measurement, '\\, ')
+    lines = []
+    for timestamp, data in rows:
+        fields = []
+        for key, value in data.items():
+            if value is None:
+                continue
+            key = escape_lineprotocol(str(key), '\\,= ')
+            if value is True or value is False:
+                value = 'true' if value else 'false'
+            elif isinstance(value, int):
+                value = '{}i'.format(value)
+            elif isinstance(value, float):
+                value = repr(value)
+            else:
+                value = '"{}"'.format(escape_lineprotocol(str(value), '\\"'))
+            fields.append('{}={}'.format(key, value))
+        if not fields:
+            continue
+        line = '{} {}'.format(measurement, ','.join(fields))
+        if timestamp is not None:
+            line += ' {}'.format(int(timestamp) * 1000000000)
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+INFINITY = float('inf')
+
+
+class CompiledJSONEncoder:
+    """
+    Serialize flat dictionaries to JSON, producing the same
+    output as ``json.dumps``.
+
+    The key fragments are escaped once per set of keys and
+    kept within a template, so each invocation only has to
+    format the values. The template is rebuilt when the keys
+    change. Dictionaries with non-string keys will be passed
+    to ``json.dumps``.
+    """
+
+    def __init__(self):
+        self.keys = None
+
+        # Alternating key fragments and values, joined on each invocation.
+        self.parts = None
+
+    def compile(self, keys):
+        import json
+        self.keys = keys
+        self.parts = None
+        for key in keys:
+            if not isinstance(key, str):
+                return
+        if not keys:
+            self.parts = ['{}']
+            return
+        parts = []
+        separator = '{'
+        for key in keys:
+            parts.append(separator + json.dumps(key) + ': ')
+            parts.append(None)
+            separator = ', '
+        parts.append('}')
+        self.parts = parts
+
+    def encode(self, data):
+        """
+        Serialize dictionary to JSON.
+
+        :param data: Dictionary of readings.
+        """
+        keys = tuple(data)
+        if keys != self.keys:
+            self.compile(keys)
+
+        parts = self.parts
+        if parts is None:
+            import json
+            return json.dumps(data)
+
+        index = 1
+        for value in data.values():
+            parts[index] = self.format_value(value)
+            index += 2
+        return ''.join(parts)
+
+    def format_value(self, value):
+        # Exact type checks, ``bool`` is a subclass of ``int``.
+        kind = type(value)
+        if kind is float:
+            if value == value and value != INFINITY and value != -INFINITY:
+                return repr(value)
+        elif kind is int:
+            return str(value)
+        elif kind is bool:
+            return 'true' if value else 'false'
+        elif value is None:
+            return 'null'
+        import json
+        return json.dumps(value)
+
+
+def pack_float(value, float32):
+    """
+    Return the single precision representation of the float, if it
+    is lossless or requested, otherwise ``None``. Values exceeding the
+    single precision range always yield ``None``.
+    """
+    import struct
+    try:
+        packed = struct.pack('>f', value)
+    except OverflowError:
+        return None
+    single = struct.unpack('>f', packed)[0]
+    if single == value:
+        return packed
+
+    # MicroPython doesn't raise ``OverflowError`` but yields infinity.
+    if float32 and single != float('inf') and single != float('-inf'):
+        return packed
+    return None
+
+
+def to_cbor(value, float32=False):
+    """
+    Serialize to CBOR, see RFC 8949.
+
+    :param value: Dictionary of readings, or any other value made of
+                  dictionaries, lists, strings, bytes, numbers, booleans and ``None``.
+    :param float32: Whether to encode all floats with single precision.
+                    By default, this is only done when it is lossless.
+    """
+    buffer = bytearray()
+    encode_cbor(buffer, value, float32)
+    return bytes(buffer)
+
+
+def encode_cbor_head(buffer, major, length):
+    import struct
+    major <<= 5
+    if length < 24:
+        buffer.append(major | length)
+    elif length < 0x100:
+        buffer.append(major | 24)
+        buffer.append(length)
+    elif length < 0x10000:
+        buffer.append(major | 25)
+        buffer.extend(struct.pack('>H', length))
+    elif length < 0x100000000:
+        buffer.append(major | 26)
+        buffer.extend(struct.pack('>I', length))
+    elif length < 0x10000000000000000:
+        buffer.append(major | 27)
+        buffer.extend(struct.pack('>Q', length))
+    else:
+        raise ValueError('Integer out of range for CBOR: {}'.format(length))
+
+
+def encode_cbor(buffer, value, float32=False):
+    import struct
+    kind = type(value)
+    if value is None:
+        buffer.append(0xf6)
+    elif kind is bool:
+        buffer.append(0xf5 if value else 0xf4)
+    elif kind is int:
+        if value >= 0:
+            encode_cbor_head(buffer, 0, value)
+        else:
+            encode_cbor_head(buffer, 1, -1 - value)
+    elif kind is float:
+        packed = pack_float(value, float32)
+        if packed is not None:
+            buffer.append(0xfa)
+            buffer.extend(packed)
+        else:
+            buffer.append(0xfb)
+            buffer.extend(struct.pack('>d', value))
+    elif kind is str:
+        data = value.encode()
+        encode_cbor_head(buffer, 3, len(data))
+        buffer.extend(data)
+    elif kind in (bytes, bytearray):
+        encode_cbor_head(buffer, 2, len(value))
+        buffer.extend(value)
+    elif kind in (list, tuple):
+        encode_cbor_head(buffer, 4, len(value))
+        for item in value:
+            encode_cbor(buffer, item, float32)
+    elif kind is dict:
+        encode_cbor_head(buffer, 5, len(value))
+        for key, item in value.items():
+            encode_cbor(buffer, key, float32)
+            encode_cbor(buffer, item, float32)
+    else:
+        raise TypeError('Type {} not serializable to CBOR'.format(kind))
+
+
+def to_msgpack(value, float32=False):
+    """
+    Serialize to MessagePack, see https://github.com/msgpack/msgpack/blob/master/spec.md.
+
+    :param value: Dictionary of readings, or any other value made of
+                  dictionaries, lists, strings, bytes, numbers, booleans and ``None``.
+    :param float32: Whether to encode all floats with single precision.
+                    By default, this is only done when it is lossless.
+    """
+    buffer = bytearray()
+    encode_msgpack(buffer, value, float32)
+    return bytes(buffer)
+
+
+def encode_msgpack_head(buffer, length, fixed, fixed_limit, codes):
+    """
+    Encode type and length of strings, binary data, arrays and maps.
+
+    :param fixed: Type byte of the fixed length variant, or ``None``.
+    :param fixed_limit: Maximum length of the fixed length variant.
+    :param codes: Type bytes of the variants with 8, 16 and 32 bit lengths.
+    """
+    import struct
+    if fixed is not None and length <= fixed_limit:
+        buffer.append(fixed | length)
+    elif codes[0] is not None and length < 0x100:
+        buffer.append(codes[0])
+        buffer.append(length)
+    elif length < 0x10000:
+        buffer.append(codes[1])
+        buffer.extend(struct.pack('>H', length))
+    elif length < 0x100000000:
+        buffer.append(codes[2])
+        buffer.extend(struct.pack('>I', length))
+    else:
+        raise ValueError('Length out of range for MessagePack: {}'.format(length))
+
+
+def encode_msgpack(buffer, value, float32=False):
+    import struct
+    kind = type(value)
+    if value is None:
+        buffer.append(0xc0)
+    elif kind is bool:
+        buffer.append(0xc3 if value else 0xc2)
+    elif kind is int:
+        if 0 <= value < 0x80:
+            buffer.append(value)
+        elif -32 <= value < 0:
+            buffer.append(value & 0xff)
+        elif 0 <= value < 0x100:
+            buffer.append(0xcc)
+            buffer.append(value)
+        elif 0 <= value < 0x10000:
+            buffer.append(0xcd)
+            buffer.extend(struct.pack('>H', value))
+        elif 0 <= value < 0x100000000:
+            buffer.append(0xce)
+            buffer.extend(struct.pack('>I', value))
+        elif 0 <= value < 0x10000000000000000:
+            buffer.append(0xcf)
+            buffer.extend(struct.pack('>Q', value))
+        elif -0x80 <= value < 0:
+            buffer.append(0xd0)
+            buffer.extend(struct.pack('>b', value))
+        elif -0x8000 <= value < 0:
+            buffer.append(0xd1)
+            buffer.extend(struct.pack('>h', value))
+        elif -0x80000000 <= value < 0:
+            buffer.append(0xd2)
+            buffer.extend(struct.pack('>i', value))
+        elif -0x8000000000000000 <= value < 0:
+            buffer.append(0xd3)
+            buffer.extend(struct.pack('>q', value))
+        else:
+            raise ValueError('Integer out of range for MessagePack: {}'.format(value))
+    elif kind is float:
+        packed = pack_float(value, float32)
+        if packed is not None:
+            buffer.append(0xca)
+            buffer.extend(packed)
+        else:
+            buffer.append(0xcb)
+            buffer.extend(struct.pack('>d', value))
+    elif kind is str:
+        data = value.encode()
+        encode_msgpack_head(buffer, len(data), 0xa0, 31, (0xd9, 0xda, 0xdb))
+        buffer.extend(data)
+    elif kind in (bytes, bytearray):
+        encode_msgpack_head(buffer, len(value), None, 0, (0xc4, 0xc5, 0xc6))
+        buffer.extend(value)
+    elif kind in (list, tuple):
+        encode_msgpack_head(buffer, len(value), 0x90, 15, (None, 0xdc, 0xdd))
+        for item in value:
+            encode_msgpack(buffer, item, float32)
+    elif kind is dict:
+        encode_msgpack_head(buffer, len(value), 0x80, 15, (None, 0xde, 0xdf))
+        for key, item in value.items():
+            encode_msgpack(buffer, key, float32)
+            encode_msgpack(buffer, item, float32)
+    else:
+        raise TypeError('Type {} not serializable to MessagePack'.format(kind))
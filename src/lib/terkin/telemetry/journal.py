@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import os
+import json
+import time
+import struct
+import binascii
+
+from terkin import logging
+from terkin.util import ensure_directory, format_exception
+
+log = logging.getLogger(__name__)
+
+
+class TelemetryJournal:
+    """
+    Append-only journal on flash, keeping readings which could not be
+    transmitted, in order to forward them when the telemetry target is
+    reachable again.
+
+    Records are appended to segment files ``segment-<number>.bin``. When a
+    segment exceeds ``segment_size``, writing continues with a new one.
+    Segments already transmitted completely will be removed. When there
+    are more than ``retention`` segments, the oldest one will be dropped,
+    even if it has not been transmitted yet.
+
+    Each record carries a sequence number, the time of the reading and a
+    CRC32 checksum. The sequence number of the last record transmitted
+    successfully is kept within the ``cursor`` file.
+
+    Segment layout, all numbers little-endian::
+
+        header:  b'TJNL', version (B), sequence number of first record (I)
+        record:  sequence number (I), timestamp (I), CRC32 (I), length (H), JSON payload
+    """
+
+    MAGIC = b'TJNL'
+    VERSION = 1
+
+    HEADER = '<4sBI'
+    HEADER_SIZE = 9
+
+    RECORD = '<IIIH'
+    RECORD_SIZE = 14
+
+    def __init__(self, path, segment_size=8192, retention=8):
+        """
+        :param path: Directory for segment files.
+        :param segment_size: Maximum size of a segment in bytes.
+        :param retention: Maximum number of segments.
+        """
+        self.path = path
+        self.segment_size = segment_size
+        self.retention = retention
+
+        # Numbers of segments, oldest first, and sequence numbers of their first records.
+        self.segments = []
+        self.first = {}
+
+        # Size of the current segment.
+        self.size = 0
+
+        # Sequence numbers of the last record written and of the last record transmitted.
+        self.sequence = 0
+        self.cursor = 0
+
+        self.open()
+
+    @classmethod
+    def from_settings(cls, settings, path):
+        """
+        Create journal from ``telemetry.journal`` settings.
+
+        :param settings: Journal settings.
+        :param path: Directory for segment files.
+        """
+        return cls(
+            path=path,
+            segment_size=settings.get('segment_size', 8192),
+            retention=settings.get('retention', 8))
+
+    @property
+    def pending(self):
+        """Number of records not transmitted yet."""
+        return self.sequence - self.cursor
+
+    def segment_filename(self, number):
+        return '{}/segment-{}.bin'.format(self.path, number)
+
+    def open(self):
+        """
+        Read segment headers and the cursor, then find the last valid record.
+        """
+        ensure_directory(self.path)
+
+        numbers = []
+        for name in os.listdir(self.path):
+            if name.startswith('segment-') and name.endswith('.bin'):
+                numbers.append(int(name[8:-4]))
+        numbers.sort()
+
+        for number in numbers:
+            first = self.read_header(number)
+            if first is None:
+                log.warning('Removing invalid journal segment %s', self.segment_filename(number))
+                self.remove_segment(number)
+                continue
+            self.segments.append(number)
+            self.first[number] = first
+
+        try:
+            with open(self.path + '/cursor', 'rb') as f:
+                self.cursor = struct.unpack('<I', f.read(4))[0]
+        except Exception:
+            self.cursor = 0
+
+        if not self.segments:
+            self.sequence = self.cursor
+            return
+
+        # Find last record, starting a new segment when the current one has a broken tail.
+        current = self.segments[-1]
+        self.sequence = self.first[current] - 1
+        size = self.HEADER_SIZE
+        for sequence, timestamp, payload, end in self.scan(current):
+            self.sequence = sequence
+            size = end
+        self.size = size
+        if size != os.stat(self.segment_filename(current))[6]:
+            log.warning('Journal segment %s has a broken tail', self.segment_filename(current))
+            self.size = self.segment_size
+
+        if self.cursor > self.sequence:
+            self.cursor = self.sequence
+
+    def read_header(self, number):
+        try:
+            with open(self.segment_filename(number), 'rb') as f:
+                data = f.read(self.HEADER_SIZE)
+            magic, version, first = struct.unpack(self.HEADER, data)
+            if magic == self.MAGIC and version == self.VERSION:
+                return first
+        except Exception:
+            pass
+        return None
+
+    def scan(self, number):
+        """
+        Read valid records of a segment, stopping at the first broken one.
+
+        :return: Iterator of tuples ``(sequence, timestamp, payload, end offset)``.
+        """
+        with open(self.segment_filename(number), 'rb') as f:
+            f.read(self.HEADER_SIZE)
+            offset = self.HEADER_SIZE
+            while True:
+                header = f.read(self.RECORD_SIZE)
+                if len(header) < self.RECORD_SIZE:
+                    return
+                sequence, timestamp, checksum, length = struct.unpack(self.RECORD, header)
+                payload = f.read(length)
+                if len(payload) < length or self.checksum(header[:8], payload) != checksum:
+                    return
+                offset += self.RECORD_SIZE + length
+                yield sequence, timestamp, payload, offset
+
+    @staticmethod
+    def checksum(header, payload):
+        return binascii.crc32(payload, binascii.crc32(header)) & 0xFFFFFFFF
+
+    def append(self, data, timestamp=None):
+        """
+        Append a reading to the journal.
+
+        :param data: Dictionary of sensor values.
+        :param timestamp: Time of the reading. Default: Now.
+        """
+        self.append_many([(timestamp, data)])
+
+    def append_many(self, rows):
+        """
+        Append multiple readings to the journal, syncing the filesystem once.
+
+        :param rows: List of ``(timestamp, data)`` items. Timestamps may be ``None``.
+        """
+        for timestamp, data in rows:
+            payload = json.dumps(data).encode()
+            sequence = self.sequence + 1
+            if timestamp is None:
+                timestamp = time.time()
+            header = struct.pack('<II', sequence, int(timestamp))
+            record = struct.pack(self.RECORD, sequence, int(timestamp), self.checksum(header, payload), len(payload))
+
+            if not self.segments or self.size + len(record) + len(payload) > self.segment_size:
+                self.start_segment(sequence)
+
+            with open(self.segment_filename(self.segments[-1]), 'ab') as f:
+                f.write(record)
+                f.write(payload)
+
+            self.size += len(record) + len(payload)
+            self.sequence = sequence
+
+            self.prune()
+
+        self.sync()
+
+    def start_segment(self, first):
+        number = self.segments[-1] + 1 if self.segments else 1
+        with open(self.segment_filename(number), 'wb') as f:
+            f.write(struct.pack(self.HEADER, self.MAGIC, self.VERSION, first))
+        self.segments.append(number)
+        self.first[number] = first
+        self.size = self.HEADER_SIZE
+
+    def read(self, limit=10):
+        """
+        Read records not transmitted yet, oldest first.
+
+        :param limit: Maximum number of records.
+        :return: List of tuples ``(sequence, timestamp, data)``.
+        """
+        records = []
+        for index, number in enumerate(self.segments):
+
+            # Skip segments already transmitted completely.
+            if index + 1 < len(self.segments) and self.first[self.segments[index + 1]] <= self.cursor + 1:
+                continue
+
+            for sequence, timestamp, payload, end in self.scan(number):
+                if sequence <= self.cursor:
+                    continue
+                try:
+                    records.append((sequence, timestamp, json.loads(payload)))
+                except Exception as ex:
+                    log.warning('Decoding journal record %s failed: %s', sequence, format_exception(ex))
+                if len(records) >= limit:
+                    return records
+
+        return records
+
+    def commit(self, sequence):
+        """
+        Acknowledge records up to the designated sequence number as transmitted.
+
+        :param sequence: Sequence number of the last record transmitted.
+        """
+        self.cursor = sequence
+        self.write_cursor()
+        self.prune()
+        self.sync()
+
+    def write_cursor(self):
+        with open(self.path + '/cursor', 'wb') as f:
+            f.write(struct.pack('<I', self.cursor))
+
+    def prune(self):
+        """
+        Remove segments transmitted completely and enforce the retention limit.
+        """
+        while len(self.segments) > 1 and self.first[self.segments[1]] <= self.cursor + 1:
+            self.remove_segment(self.segments.pop(0))
+
+        while len(self.segments) > self.retention:
+            number = self.segments.pop(0)
+            dropped = self.first[self.segments[0]] - 1 - self.cursor
+            log.warning('Journal retention exceeded, dropping %s readings', dropped)
+            self.remove_segment(number)
+            if dropped > 0:
+                self.cursor = self.first[self.segments[0]] - 1
+                self.write_cursor()
+
+    def remove_segment(self, number):
+        self.first.pop(number, None)
+        try:
+            os.remove(self.segment_filename(number))
+        except OSError:
+            pass
+
+    def sync(self):
+        import uos
+        uos.sync()
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import time
+import struct
+
+from terkin import logging
+from terkin.util import allocate_lock
+
+log = logging.getLogger(__name__)
+
+
+# Error numbers signalling that no data is available yet.
+EAGAIN = 11
+ETIMEDOUT = 110
+
+
+class MQTTSession:
+    """
+    MQTT session on top of the ``umqtt`` driver.
+
+    QoS 1 messages are published without waiting for their
+    acknowledgements. Up to ``window`` messages may be in flight,
+    PUBACK packets are processed whenever publishing the next
+    message or when polling the session.
+
+    The session outlives the driver connection. When connecting
+    again, messages still in flight will be retransmitted. Unless
+    using ``clean_session=True``, the broker will resume the session
+    and discard duplicate messages.
+
+    The session may be used from telemetry worker threads and from
+    the event loop at the same time, so all operations on the
+    connection are serialized using a lock.
+    """
+
+    def __init__(self, clean_session=False, window=8, timeout=5.0):
+        """
+        :param clean_session: Whether to ask the broker for a new session on each connect.
+        :param window: Maximum number of unacknowledged QoS 1 messages.
+        :param timeout: How long to wait for the broker, in seconds.
+        """
+        self.clean_session = clean_session
+        self.window = window
+        self.timeout = timeout
+
+        self.client = None
+        self.keepalive = 0
+
+        # Unacknowledged messages, as list of ``(packet id, packet)`` items.
+        self.inflight = []
+        self.pid = 0
+
+        self.last_send = 0
+        self.last_receive = 0
+        self.ping_pending = False
+        self.ping_sent = 0
+
+        self.lock = allocate_lock()
+
+    def start(self, client):
+        """
+        Connect using the designated driver instance and retransmit
+        messages still in flight.
+
+        :param client: ``umqtt.MQTTClient`` instance, not connected yet.
+        :return: Whether the broker resumed a previous session.
+        """
+        with self.lock:
+            self.client = client
+            self.keepalive = client.keepalive
+            self.ping_pending = False
+
+            session_present = client.connect(clean_session=self.clean_session)
+            client.sock.settimeout(self.timeout)
+            self.last_send = self.last_receive = time.time()
+
+            if self.inflight:
+                log.info('Retransmitting %s MQTT messages in flight', len(self.inflight))
+                for pid, packet in self.inflight:
+                    # Set DUP flag.
+                    packet[0] |= 0x08
+                    self.write(packet)
+
+            return bool(session_present)
+
+    def stop(self):
+        """
+        Close the connection, keeping messages in flight for the next one.
+        """
+        with self.lock:
+            if self.client is not None and self.client.sock is not None:
+                try:
+                    self.client.sock.close()
+                except Exception:
+                    pass
+            self.client = None
+
+    def publish(self, topic, payload, retain=False, qos=1):
+        """
+        Publish message without waiting for its acknowledgement.
+
+        :param topic: MQTT topic.
+        :param payload: Message payload as ``str`` or ``bytes``.
+        :param retain: Whether the broker should retain the message.
+        :param qos: Quality of service level, either 0 or 1.
+        """
+
+        if qos not in (0, 1):
+            raise ValueError('MQTT QoS level {} not supported'.format(qos))
+
+        with self.lock:
+            self.ensure_client()
+
+            # Process acknowledgements. Publishing keeps the connection
+            # alive on its own, so there is no need to ping here.
+            self.process(ping=False)
+
+            # Wait for acknowledgements when the window is full.
+            while len(self.inflight) >= self.window:
+                if not self.receive(self.timeout):
+                    raise OSError('Timed out waiting for MQTT acknowledgement')
+
+            pid = 0
+            if qos:
+                self.pid = self.pid % 65535 + 1
+                pid = self.pid
+
+            packet = self.build_publish(topic, payload, retain, qos, pid)
+            self.write(packet)
+            if qos:
+                self.inflight.append((pid, packet))
+
+    def build_publish(self, topic, payload, retain, qos, pid):
+        """
+        Serialize PUBLISH packet.
+        """
+        if isinstance(topic, str):
+            topic = topic.encode()
+        if isinstance(payload, str):
+            payload = payload.encode()
+
+        size = 2 + len(topic) + len(payload)
+        if qos:
+            size += 2
+
+        packet = bytearray(b'\x30')
+        packet[0] |= qos << 1 | retain
+        while size > 0x7f:
+            packet.append((size & 0x7f) | 0x80)
+            size >>= 7
+        packet.append(size)
+
+        packet += struct.pack('!H', len(topic))
+        packet += topic
+        if qos:
+            packet += struct.pack('!H', pid)
+        packet += payload
+        return packet
+
+    def poll(self, ping=True):
+        """
+        Process pending packets without blocking and send
+        a PINGREQ when the connection has been idle.
+
+        :param ping: Whether to send a PINGREQ when due.
+        """
+        with self.lock:
+            if self.client is not None:
+                self.process(ping=ping)
+
+    def process(self, ping=True):
+        """
+        Like ``poll()``, but without acquiring the lock.
+        """
+        while self.receive():
+            pass
+
+        if self.keepalive:
+            now = time.time()
+            if self.ping_pending and now - self.ping_sent > self.timeout:
+                raise OSError('MQTT broker did not answer PINGREQ')
+            if ping and not self.ping_pending and now - self.last_send >= self.keepalive / 2:
+                self.write(b'\xc0\x00')
+                self.ping_pending = True
+                self.ping_sent = now
+
+    def drain(self, timeout=None):
+        """
+        Wait until all messages in flight have been acknowledged.
+
+        :param timeout: How long to wait, in seconds.
+        :return: Whether all messages have been acknowledged.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        deadline = time.time() + timeout
+        with self.lock:
+            while self.inflight:
+                self.ensure_client()
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self.receive(remaining)
+            return True
+
+    def ensure_client(self):
+        if self.client is None:
+            raise OSError('Not connected to MQTT broker')
+
+    def write(self, packet):
+        self.client.stream.write(packet)
+        self.last_send = time.time()
+
+    def receive(self, timeout=0):
+        """
+        Read and process a single packet from the broker.
+
+        :param timeout: How long to wait for a packet, in seconds. Default: Don't wait.
+        :return: Whether a packet has been processed.
+        """
+        client = self.client
+        if timeout:
+            client.sock.settimeout(timeout)
+        else:
+            client.sock.setblocking(False)
+        try:
+            data = client.stream.read(1)
+        except OSError as ex:
+            if is_timeout(ex):
+                return False
+            raise
+        finally:
+            client.sock.settimeout(self.timeout)
+
+        if data is None:
+            return False
+        if data == b'':
+            raise OSError('Connection closed by MQTT broker')
+
+        op = data[0] & 0xf0
+        size = client._recv_len()
+        body = self.read(size)
+        self.last_receive = time.time()
+
+        # PUBACK
+        if op == 0x40:
+            pid = body[0] << 8 | body[1]
+            for index, item in enumerate(self.inflight):
+                if item[0] == pid:
+                    del self.inflight[index]
+                    break
+
+        # PINGRESP
+        elif op == 0xd0:
+            self.ping_pending = False
+
+        else:
+            log.warning('Ignoring unexpected MQTT packet type 0x%x', op)
+
+        return True
+
+    def read(self, size):
+        """
+        Read exactly ``size`` bytes, as socket streams on CPython may return less.
+        """
+        data = b''
+        while len(data) < size:
+            chunk = self.client.stream.read(size - len(data))
+            if not chunk:
+                raise OSError('Connection closed by MQTT broker')
+            data += chunk
+        return data
+
+
+def is_timeout(ex):
+    """
+    Whether the exception signals a timeout on both MicroPython and CPython.
+    """
+    return (ex.args and ex.args[0] in (EAGAIN, ETIMEDOUT)) or str(ex) == 'timed out'
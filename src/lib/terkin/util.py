@@ -93,6 +93,13 @@ def urlparse(url, scheme='', allow_fragments=True):
         setattr(uri, 'username', username)
         setattr(uri, 'password', password)
 
+    # Manually parse port from hostname.
+    setattr(uri, 'port', None)
+    if ':' in uri.hostname:
+        hostname, port = uri.hostname.split(':')
+        setattr(uri, 'hostname', hostname)
+        setattr(uri, 'port', int(port))
+
     #print('URI-2:', uri)
 
     return uri
@@ -238,6 +245,37 @@ class gc_disabled:
             raise exc_details[1]
 
 
+class NullLock:
+    """Lock doing nothing, for platforms without threading support."""
+
+    def acquire(self, *args):
+        return True
+
+    def release(self):
+        pass
+
+    def locked(self):
+        return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_details):
+        pass
+
+
+def allocate_lock():
+    """Allocate a lock for guarding state shared between threads.
+
+    Falls back to a ``NullLock`` when ``_thread`` is not available.
+    """
+    try:
+        import _thread
+        return _thread.allocate_lock()
+    except ImportError:
+        return NullLock()
+
+
 def file_remove(fn: str) -> None:
     """Try to remove a file if it exists.
     
@@ -296,10 +334,14 @@ def random_from_crypto():
         # https://github.com/micropython/micropython-lib/blob/master/random/random.py
         import crypto
         r = crypto.getrandbits(32)
+        return ((r[0] << 24) + (r[1] << 16) + (r[2] << 8) + r[3]) / 4294967295.0
     else:
-        import urandom
-        r = urandom.getrandbits(32)
-    return ((r[0] << 24) + (r[1] << 16) + (r[2] << 8) + r[3]) / 4294967295.0
+        # Vanilla MicroPython and CPython return an integer.
+        try:
+            import urandom as random
+        except ImportError:
+            import random
+        return random.getrandbits(32) / 4294967295.0
 
 
 def randint(a, b):
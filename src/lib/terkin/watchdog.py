@@ -35,7 +35,7 @@ class Watchdog:
             return
 
         watchdog_timeout = self.timeout
-        log.info('Starting the watchdog timer (WDT) with timeout {}ms'.format(watchdog_timeout))
+        log.info('Starting the watchdog timer (WDT) with timeout %sms', watchdog_timeout)
 
         from machine import WDT
         self.wdt = WDT(timeout=watchdog_timeout)
@@ -91,7 +91,7 @@ class Watchdog:
         if not self.enabled:
             return
         if timeout >= self.timeout:
-            log.info('Reconfiguring watchdog timeout to {} milliseconds'.format(timeout))
+            log.info('Reconfiguring watchdog timeout to %s milliseconds', timeout)
             self.wdt.init(timeout)
 
     def adjust_for_interval(self, interval):
@@ -104,6 +104,6 @@ class Watchdog:
             watchdog_timeout = self.timeout / 1000.0
             if watchdog_timeout - 2 < interval:
                 watchdog_timeout_effective = int((interval + 20) * 1000)
-                log.warning('Reconfiguring original watchdog timeout {} as it is '
-                            'smaller or near the configured sleep time {}'.format(watchdog_timeout, interval))
+                log.warning('Reconfiguring original watchdog timeout %s as it is '
+                            'smaller or near the configured sleep time %s', watchdog_timeout, interval)
                 self.reconfigure_minimum_timeout(watchdog_timeout_effective)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+"""
+Decode the persistent log written by ``terkin.flashlog.FlashLogHandler``.
+
+Synopsis::
+
+    # Fetch log segments from the device.
+    rshell cp -r /flash/log ./log
+
+    # Decode them.
+    terkin-flashlog ./log
+    terkin-flashlog --level=warning ./log
+    terkin-flashlog --format=json ./log
+"""
+import json
+import click
+
+
+@click.command()
+@click.option("--level", default="debug", help="Minimum log level.")
+@click.option("--format", "output_format", type=click.Choice(['text', 'json']), default='text', help="Output format.")
+@click.argument("path", type=click.Path(exists=True, file_okay=False))
+def cli(level, output_format, path):
+    from terkin.flashlog import FlashLogReader, LEVELS
+
+    threshold = dict((name, number) for number, name in LEVELS.items()).get(level.upper(), 0)
+
+    reader = FlashLogReader(path)
+    for entry in reader.read():
+        if entry['type'] == 'record' and entry['level'] < threshold:
+            continue
+        if output_format == 'json':
+            click.echo(json.dumps(entry))
+        else:
+            click.echo(reader.format_entry(entry))
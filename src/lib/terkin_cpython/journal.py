@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+"""
+Telemetry journal based on SQLite, for buffering large amounts of
+readings on single board computers. It offers the same interface as
+``terkin.telemetry.journal.TelemetryJournal``, select it using::
+
+    telemetry = {
+        'journal': {
+            'enabled': True,
+            'backend': 'sqlite',
+
+            # Keep transmitted readings for one day, pending ones for 60 days.
+            'keep_acknowledged': 86400,
+            'max_age': 5184000,
+        },
+    }
+
+All telemetry targets share a single database in WAL mode, the
+readings are indexed by target, transmission state and time. Disk
+space of deleted readings is reclaimed using incremental vacuuming,
+which doesn't rewrite the whole database file.
+"""
+import json
+import time
+import sqlite3
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS readings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    target TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    acknowledged INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS readings_pending ON readings (target, acknowledged, id);
+CREATE INDEX IF NOT EXISTS readings_time ON readings (target, timestamp);
+"""
+
+
+class SQLiteTelemetryJournal:
+    """
+    Store-and-forward journal for a single telemetry target, based on SQLite.
+    """
+
+    # Connections per database file, shared by all targets.
+    connections = {}
+    lock = threading.Lock()
+
+    def __init__(self, filename, target, keep_acknowledged=86400, max_age=5184000, vacuum_interval=3600):
+        """
+        :param filename: Path to database file.
+        :param target: Name of the telemetry target.
+        :param keep_acknowledged: How long to keep transmitted readings, in seconds.
+        :param max_age: How long to keep pending readings, in seconds.
+        :param vacuum_interval: How often to enforce the retention policy, in seconds.
+        """
+        self.filename = filename
+        self.target = target
+        self.keep_acknowledged = keep_acknowledged
+        self.max_age = max_age
+        self.vacuum_interval = vacuum_interval
+        self.last_vacuum = 0
+
+        self.connection = self.connect(filename)
+
+    @classmethod
+    def from_settings(cls, settings, filename, target):
+        """
+        Create journal from ``telemetry.journal`` settings.
+
+        :param settings: Journal settings.
+        :param filename: Path to database file.
+        :param target: Name of the telemetry target.
+        """
+        return cls(
+            filename=filename,
+            target=target,
+            keep_acknowledged=settings.get('keep_acknowledged', 86400),
+            max_age=settings.get('max_age', 5184000),
+            vacuum_interval=settings.get('vacuum_interval', 3600))
+
+    @classmethod
+    def connect(cls, filename):
+        with cls.lock:
+            connection = cls.connections.get(filename)
+            if connection is None:
+                log.info('Opening telemetry journal database %s', filename)
+                connection = sqlite3.connect(filename, check_same_thread=False, isolation_level=None)
+
+                # Needs to be set before creating the first table. Databases
+                # created without it will be converted once, using a full vacuum.
+                connection.execute('PRAGMA auto_vacuum=INCREMENTAL')
+                if connection.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+                    log.info('Enabling incremental vacuum for %s', filename)
+                    connection.execute('VACUUM')
+
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute('PRAGMA synchronous=NORMAL')
+                connection.executescript(SCHEMA)
+                cls.connections[filename] = connection
+            return connection
+
+    def execute(self, sql, parameters=()):
+        with self.lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    @property
+    def pending(self):
+        """Number of readings not transmitted yet."""
+        return self.execute(
+            'SELECT COUNT(*) FROM readings WHERE target = ? AND acknowledged = 0', (self.target,))[0][0]
+
+    def append(self, data, timestamp=None):
+        """
+        Append a reading to the journal.
+
+        :param data: Dictionary of sensor values.
+        :param timestamp: Time of the reading. Default: Now.
+        """
+        self.append_many([(timestamp, data)])
+
+    def append_many(self, rows):
+        """
+        Append multiple readings within a single transaction.
+
+        :param rows: List of ``(timestamp, data)`` items. Timestamps may be ``None``.
+        """
+        now = int(time.time())
+        records = [
+            (self.target, int(timestamp) if timestamp is not None else now, json.dumps(data))
+            for timestamp, data in rows]
+        with self.lock:
+            with self.transaction():
+                self.connection.executemany(
+                    'INSERT INTO readings (target, timestamp, payload) VALUES (?, ?, ?)', records)
+
+    def read(self, limit=10):
+        """
+        Read readings not transmitted yet, oldest first.
+
+        :param limit: Maximum number of readings.
+        :return: List of tuples ``(sequence, timestamp, data)``.
+        """
+        rows = self.execute(
+            'SELECT id, timestamp, payload FROM readings WHERE target = ? AND acknowledged = 0 '
+            'ORDER BY id LIMIT ?', (self.target, limit))
+        return [(sequence, timestamp, json.loads(payload)) for sequence, timestamp, payload in rows]
+
+    def read_range(self, start=None, end=None, limit=None):
+        """
+        Read readings of this target by time, regardless of their transmission state.
+
+        :param start: Start time in epoch seconds, inclusive.
+        :param end: End time in epoch seconds, exclusive.
+        :param limit: Maximum number of readings.
+        :return: List of tuples ``(sequence, timestamp, data)``.
+        """
+        sql = 'SELECT id, timestamp, payload FROM readings WHERE target = ?'
+        parameters = [self.target]
+        if start is not None:
+            sql += ' AND timestamp >= ?'
+            parameters.append(int(start))
+        if end is not None:
+            sql += ' AND timestamp < ?'
+            parameters.append(int(end))
+        sql += ' ORDER BY timestamp, id'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            parameters.append(limit)
+        rows = self.execute(sql, parameters)
+        return [(sequence, timestamp, json.loads(payload)) for sequence, timestamp, payload in rows]
+
+    def commit(self, sequence):
+        """
+        Acknowledge all readings up to the designated sequence number as transmitted.
+
+        :param sequence: Sequence number of the last reading transmitted.
+        """
+        self.execute(
+            'UPDATE readings SET acknowledged = 1 WHERE target = ? AND acknowledged = 0 AND id <= ?',
+            (self.target, sequence))
+        if time.time() - self.last_vacuum >= self.vacuum_interval:
+            self.vacuum()
+
+    def vacuum(self):
+        """
+        Enforce the retention policy and reclaim disk space.
+        """
+        now = int(time.time())
+        with self.lock:
+            with self.transaction():
+                acknowledged = self.connection.execute(
+                    'DELETE FROM readings WHERE target = ? AND acknowledged = 1 AND timestamp < ?',
+                    (self.target, now - self.keep_acknowledged)).rowcount
+                expired = self.connection.execute(
+                    'DELETE FROM readings WHERE target = ? AND acknowledged = 0 AND timestamp < ?',
+                    (self.target, now - self.max_age)).rowcount
+            if acknowledged or expired:
+                # Each step frees a single page, and ``execute`` only
+                # runs the first one, while ``executescript`` runs all.
+                self.connection.executescript('PRAGMA incremental_vacuum;')
+        if expired:
+            log.warning('Telemetry journal retention exceeded, dropped %s pending readings', expired)
+        self.last_vacuum = now
+        return acknowledged + expired
+
+    def transaction(self):
+        return Transaction(self.connection)
+
+
+class Transaction:
+    """
+    Run statements within an immediate transaction.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute('BEGIN IMMEDIATE')
+        return self.connection
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.connection.execute('COMMIT')
+        else:
+            self.connection.execute('ROLLBACK')
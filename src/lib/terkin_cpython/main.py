@@ -79,6 +79,7 @@ class TerkinApplication:
                 self.datalogger.start()
             else:
                 self.datalogger.duty_cycle()
+                self.flush_telemetry()
 
         except KeyboardInterrupt:
             self.shutdown()
@@ -87,9 +88,16 @@ class TerkinApplication:
 
         log.info('Shutting down Terkin')
 
+        self.flush_telemetry()
+
         if self.datalogger.device.status.networking:
             self.datalogger.device.networking.stop()
 
+    def flush_telemetry(self):
+        """Transmit readings queued for batch transmission."""
+        if self.datalogger.device.telemetry is not None:
+            self.datalogger.device.telemetry.flush()
+
     def start_ui(self):
 
         # Make environment compatible with CPython.
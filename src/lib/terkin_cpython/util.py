@@ -51,7 +51,7 @@ def start_bootloader():
 
 def load_settings(settings_file):
 
-    log.info('Loading settings from "{}"'.format(settings_file))
+    log.info('Loading settings from "%s"', settings_file)
 
     # Sanity checks.
     if not os.path.exists(settings_file):
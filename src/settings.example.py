@@ -32,6 +32,46 @@ main = {
     # Whether to use ight sleep between measurement cycles.
     'lightsleep': False,
 
+    # Which runtime to use for the main loop.
+    # - "mainloop": Run duty cycles one after another, blocking through reading, transmitting and sleeping.
+    # - "eventloop": Run sensor readings, telemetry, the WiFi connection monitor and the mode server
+    #   as cooperative tasks on uasyncio/asyncio. Not available with shutoff, deep sleep or light sleep.
+    'runtime': 'mainloop',
+
+    # Configure the event loop runtime.
+    'eventloop': {
+
+        # How many readings to keep around while telemetry is lagging behind.
+        'queue_size': 10,
+
+        # How often to process MQTT acknowledgements and send keepalive pings, in seconds.
+        'mqtt_poll_interval': 10,
+    },
+
+    # Record durations of the phases from boot to the first transmission.
+    'timeline': {
+
+        # How many timelines of previous boots to keep around.
+        'history': 3,
+    },
+
+    # Runtime state surviving deep sleep cycles. Without RTC memory, like on Pycom
+    # devices, it is stored within a file. Changes of metrics will only be written
+    # to it each "file_interval" seconds, in order to reduce wear of the flash
+    # memory. Cycles in between will not be accounted for when using deep sleep.
+    'state': {
+        'file_interval': 600,
+    },
+
+    # Warn when the duty cycle phases allocate more heap memory than
+    # expected, in bytes. Measured using ``gc.mem_free()`` on MicroPython.
+    #'memory': {
+    #    'budgets': {
+    #        'read_sensors': 8192,
+    #        'transmit_readings': 16384,
+    #    },
+    #},
+
     # Configure logging.
     'logging': {
 
@@ -40,6 +80,23 @@ main = {
 
         # Log configuration settings at system startup.
         'configuration': False,
+
+        # Keep log records within a ring of segment files on flash.
+        # Decode them using "terkin-flashlog /path/to/log".
+        'flash': {
+            'enabled': False,
+            'level': 'info',
+            'segments': 4,
+            'segment_size': 16384,
+            'buffer_size': 1024,
+        },
+
+        # Keep recent log records in memory, see "/api/v1/log".
+        'buffer': {
+            'enabled': False,
+            'level': 'info',
+            'size': 4096,
+        },
     },
 
     # Configure Watchdog.
@@ -196,6 +253,50 @@ networking = {
 
 # Telemetry configuration.
 telemetry = {
+
+    # Transmit to all telemetry targets concurrently, so a slow target
+    # does not delay the others. Use the per-target setting ``timeout``
+    # to override the deadline in seconds.
+    'concurrent': {
+        'enabled': False,
+        'timeout': 15.0,
+        'workers': 4,
+    },
+
+    # Keep readings on flash while telemetry targets are unreachable,
+    # and forward them in batches when they are reachable again.
+    # Use ``'journal': False`` to disable the journal for a target.
+    'journal': {
+        'enabled': False,
+
+        # Where to keep the readings.
+        # - "flash": Segment files, see ``terkin.telemetry.journal``.
+        # - "sqlite": SQLite database on single board computers, see ``terkin_cpython.journal``.
+        'backend': 'flash',
+
+        # Maximum size and number of segment files per target.
+        'segment_size': 8192,
+        'retention': 8,
+
+        # How many pending readings to forward per duty cycle.
+        'batch_size': 10,
+
+        # Add time of the reading to forwarded readings using this field name.
+        # Use ``None`` to forward readings without their time.
+        'timestamp_field': 'time',
+    },
+
+    # Skip telemetry targets after consecutive failures, retrying them with
+    # exponential backoff. Readings go to the journal in the meanwhile.
+    # Disabled by default. When enabled, use ``'breaker': False`` to disable
+    # the circuit breaker for a single target.
+    'breaker': {
+        'enabled': True,
+        'failures': 3,
+        'backoff_min': 30,
+        'backoff_max': 3600,
+    },
+
     'targets': [
 
         # JSON over MQTT: Kotori/MQTTKit
@@ -213,6 +314,25 @@ telemetry = {
                 "gateway": "area-42",
                 "node": "node-01-mqtt-json",
             },
+
+            # Serialization format. Use the compact binary formats "cbor" or "msgpack"
+            # when paying per byte. Their floats are encoded with single precision
+            # when lossless. Use the target setting "float32" to enforce it. Use the
+            # target setting "field_ids" to send the small integer IDs of the fields
+            # instead of their names, the mapping is served through "/api/v1/fields"
+            # and kept within "terkin-fields.json" across restarts.
+            #'format': 'json',
+
+            # MQTT session settings. Connections to the same broker share the
+            # settings of the first target. Unless enabling "clean_session", the
+            # broker keeps the session across reconnects. Up to "window" QoS 1
+            # messages are published without waiting for their acknowledgements.
+            #'settings': {
+            #    'qos': 1,
+            #    'clean_session': False,
+            #    'keepalive': 60,
+            #    'window': 8,
+            #},
         },
 
         # JSON over HTTP: Kotori/MQTTKit
@@ -233,6 +353,20 @@ telemetry = {
             # Use alternative, non-HTTPS endpoint.
             # 'endpoint': 'http://daq.example.org/api-notls',
 
+            # Transmit readings in batches, when having queued "size" readings or when
+            # the oldest one is older than "age" seconds. Available for the formats
+            # "json", "csv" and "lineprotocol".
+            #'batch': {
+            #    'size': 10,
+            #    'age': 3600,
+            #},
+
+            # Keep the HTTP connection open across measurement cycles when
+            # not using deep sleep, saving the TCP and TLS handshakes.
+            #'settings': {
+            #    'keepalive': True,
+            #},
+
         },
 
         # JSON over HTTP over GPRS: Kotori/MQTTKit
@@ -314,6 +448,16 @@ sensors = {
     # Whether to power toggle the 1-Wire, I2C or SPI buses.
     'power_toggle_buses': True,
 
+    # Read sensors on independent buses concurrently.
+    # Sensors attached to the same bus will be read one after another.
+    # Use the per-sensor settings ``group`` to override the grouping
+    # and ``timeout`` to override the default timeout in seconds.
+    'concurrent': {
+        'enabled': False,
+        'timeout': 10.0,
+        'workers': 4,
+    },
+
     'system': [
 
         {
@@ -435,6 +579,9 @@ sensors = {
             'offsetB': 11642,   # channel B            
             'scaleB': 10767,    # channel B
             'decimals': 3,
+            # Read this sensor at an individual interval in seconds, carrying
+            # its last reading forward in between. Default: Each duty cycle.
+            #'interval': 900,
         },
         {
             'id': 'ds18b20-1',
@@ -477,6 +624,12 @@ sensors = {
             'enabled': True,
             'bus': 'i2c:0',
             'address': 0x76,
+            # Calibrate values using polynomial coefficients in ascending order,
+            # keyed by quantity or by full field name.
+            #'calibration': {'temperature': [-0.5, 1.0]},
+            # Convert values to other units, e.g. fahrenheit, kelvin or pascal.
+            #'units': {'temperature': 'fahrenheit'},
+            #'decimals': 2,
         },
         {
             'id': 'bmp280-1',
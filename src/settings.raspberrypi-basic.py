@@ -160,6 +160,21 @@ networking = {
 
 # Telemetry configuration.
 telemetry = {
+
+    # Keep readings within a SQLite database while telemetry targets
+    # are unreachable, and forward them when they are reachable again.
+    'journal': {
+        'enabled': False,
+        'backend': 'sqlite',
+
+        # Keep transmitted readings for one day, pending ones for 60 days.
+        'keep_acknowledged': 86400,
+        'max_age': 5184000,
+
+        # How many pending readings to forward per duty cycle.
+        'batch_size': 100,
+    },
+
     'targets': [
 
         # JSON over MQTT: Kotori/MQTTKit
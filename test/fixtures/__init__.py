@@ -18,3 +18,9 @@ from .lora import network_lora
 
 # Fixture to emulate a Linux serial port.
 from .dummyserial import fake_serial
+
+# Fixture to measure and compare the runtime of code blocks.
+from .benchmark import benchmark, pytest_terminal_summary
+
+# Fixture to check memory allocations against budgets.
+from .memory import memory_monitor
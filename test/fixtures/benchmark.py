@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import gc
+import os
+import json
+import time
+
+import pytest
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'benchmark-baseline.json')
+
+
+class BenchmarkRecorder:
+    """
+    Measure the runtime of code blocks and compare it against a baseline.
+
+    - Set ``TERKIN_BENCHMARK_SAVE=1`` to write the results as new baseline.
+    - Set ``TERKIN_BENCHMARK_TOLERANCE=1.5`` to fail benchmarks which
+      are slower than 1.5 times their baseline.
+    """
+
+    def __init__(self, baseline_file=BASELINE_FILE):
+        self.baseline_file = baseline_file
+        self.results = {}
+        self.baseline = {}
+        if os.path.exists(self.baseline_file):
+            with open(self.baseline_file, 'r') as f:
+                self.baseline = json.load(f)
+
+        self.save_baseline = os.environ.get('TERKIN_BENCHMARK_SAVE') == '1'
+        tolerance = os.environ.get('TERKIN_BENCHMARK_TOLERANCE')
+        self.tolerance = float(tolerance) if tolerance else None
+
+    def measure(self, name, func, rounds=100, warmup=5):
+        """
+        Invoke ``func`` repeatedly and record the median runtime in microseconds.
+        """
+        for _ in range(warmup):
+            func()
+
+        timings = []
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(rounds):
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+        timings.sort()
+        result = {
+            'median': round(timings[len(timings) // 2] * 1e6, 1),
+            'min': round(timings[0] * 1e6, 1),
+            'rounds': rounds,
+        }
+        self.results[name] = result
+
+        if self.tolerance is not None:
+            ratio = self.ratio(name)
+            assert ratio is None or ratio <= self.tolerance, \
+                'Benchmark "{}" regressed: {}'.format(name, self.format_line(name))
+
+        return result
+
+    def ratio(self, name):
+        """
+        Compute ratio of median runtime compared to the baseline.
+        """
+        baseline = self.baseline.get(name)
+        if not baseline:
+            return None
+        return self.results[name]['median'] / baseline['median']
+
+    def format_line(self, name):
+        result = self.results[name]
+        baseline = self.baseline.get(name, {}).get('median')
+        ratio = self.ratio(name)
+        return '{:<40} {:>15} {:>15} {:>8}'.format(
+            name, '{:.1f} us'.format(result['median']),
+            '{:.1f} us'.format(baseline) if baseline else '-',
+            '{:.2f}x'.format(ratio) if ratio else '-')
+
+    def report(self):
+        lines = ['{:<40} {:>15} {:>15} {:>8}'.format('benchmark', 'median', 'baseline', 'ratio')]
+        for name in sorted(self.results):
+            lines.append(self.format_line(name))
+        return '\n'.join(lines)
+
+    def save(self):
+        baseline = dict(self.baseline)
+        baseline.update(self.results)
+        with open(self.baseline_file, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+_recorder = None
+
+
+@pytest.fixture(scope='session')
+def benchmark():
+    global _recorder
+    _recorder = BenchmarkRecorder()
+    yield _recorder
+    if _recorder.save_baseline:
+        _recorder.save()
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _recorder is not None and _recorder.results:
+        terminalreporter.section('benchmark')
+        terminalreporter.write_line(_recorder.report())
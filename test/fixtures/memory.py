@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import os
+import inspect
+import tracemalloc
+
+import pytest
+
+
+def module_location(module):
+    """
+    Resolve module or package to a filename prefix.
+    """
+    filename = module.__file__
+    if os.path.basename(filename) == '__init__.py':
+        return os.path.dirname(filename) + os.sep, None
+    return filename, None
+
+
+def function_location(function):
+    """
+    Resolve function to its filename and range of line numbers.
+    """
+    lines, first = inspect.getsourcelines(function)
+    return function.__code__.co_filename, (first, first + len(lines) - 1)
+
+
+def get_subsystems():
+    """
+    Map subsystems to code locations, in order of precedence.
+    """
+    import json
+    import logging
+    import terkin.logging
+    import terkin.model
+    import terkin.sensor
+    import terkin.driver
+    import terkin.telemetry.formatter
+    from terkin.datalogger import TerkinDatalogger
+    from terkin.telemetry.core import TelemetryClient
+
+    return [
+        ('logging', [module_location(logging), module_location(terkin.logging)]),
+        ('serialization', [
+            module_location(json), module_location(terkin.telemetry.formatter),
+            function_location(TelemetryClient.serialize)]),
+        ('richdata', [
+            function_location(TerkinDatalogger.get_richdata), function_location(TerkinDatalogger.record_reading)]),
+        ('dataframe', [module_location(terkin.model)]),
+        ('sensors', [
+            module_location(terkin.sensor), module_location(terkin.driver),
+            function_location(TerkinDatalogger.read_sensor)]),
+    ]
+
+
+class TracemallocMonitor:
+    """
+    Variant of ``terkin.instrumentation.MemoryMonitor`` based on
+    ``tracemalloc``, in order to run memory budget checks on CPython.
+
+    For each phase, it records the peak of traced memory in bytes and
+    attributes the memory still allocated at the end of the phase to
+    the innermost subsystem found within the traceback of each allocation.
+    """
+
+    def __init__(self, budgets=None):
+        from terkin.instrumentation import MemoryMonitor
+        self.monitor = MemoryMonitor(budgets=budgets)
+        self.subsystems = get_subsystems()
+        self.allocations = {}
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(25)
+
+    def __getattr__(self, name):
+        return getattr(self.monitor, name)
+
+    def phase(self, name):
+        from terkin.instrumentation import MemoryPhase
+        return MemoryPhase(self, name)
+
+    def begin(self):
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0], snapshot
+
+    def end(self, name, token):
+        peak = tracemalloc.get_traced_memory()[1]
+        baseline, before = token
+        after = tracemalloc.take_snapshot()
+
+        allocations = {}
+        for stat in after.compare_to(before, 'traceback'):
+            if stat.size_diff <= 0:
+                continue
+            subsystem = self.classify(stat.traceback)
+            allocations[subsystem] = allocations.get(subsystem, 0) + stat.size_diff
+        self.allocations[name] = allocations
+
+        self.monitor.record(name, peak - baseline)
+
+    def classify(self, traceback):
+        """
+        Attribute an allocation to a subsystem by its innermost matching frame.
+        """
+        for frame in reversed(traceback):
+            for subsystem, locations in self.subsystems:
+                for filename, lines in locations:
+                    if lines is None:
+                        if frame.filename.startswith(filename):
+                            return subsystem
+                    elif frame.filename == filename and lines[0] <= frame.lineno <= lines[1]:
+                        return subsystem
+        return 'other'
+
+    def report(self):
+        lines = ['{:<20} {:>10} {:>10}  {}'.format('phase', 'peak', 'budget', 'retained by subsystem')]
+        for name in sorted(self.deltas):
+            budget = self.budgets.get(name)
+            allocations = ', '.join(
+                '{}={}'.format(subsystem, size) for subsystem, size in sorted(self.allocations.get(name, {}).items()))
+            lines.append('{:<20} {:>10} {:>10}  {}'.format(
+                name, self.deltas[name], budget if budget is not None else '-', allocations))
+        return '\n'.join(lines)
+
+
+@pytest.fixture(scope='function')
+def memory_monitor():
+    """
+    Provide a factory for ``TracemallocMonitor`` instances.
+    Tracing memory allocations starts when creating the first one.
+    """
+    try:
+        yield TracemallocMonitor
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,60 @@
+"""Datalogger configuration"""
+
+# General settings.
+main = {
+
+    # Measurement intervals in seconds.
+    'interval': {
+
+        # Apply this interval if device is in field mode.
+        'field': 0.0,
+
+    },
+
+    # Run sensor readings and telemetry as cooperative tasks.
+    'runtime': 'eventloop',
+
+    # Configure logging.
+    'logging': {
+
+        # Enable or disable logging completely.
+        'enabled': True,
+
+        # Log configuration settings at system startup.
+        'configuration': False,
+
+    },
+
+}
+
+# Networking configuration.
+networking = {
+    'wifi': {
+        # Enable/disable WiFi completely.
+        'enabled': False,
+    },
+}
+
+# Sensor configuration.
+sensors = {
+
+    'system': [
+
+        {
+            # Sensor which reports free system memory.
+            'type': 'system.memfree',
+            'enabled': True,
+        },
+        {
+            # Sensor which reports system temperature.
+            'type': 'system.temperature',
+            'enabled': True,
+        },
+        {
+            # Sensor which reports system uptime metrics.
+            'type': 'system.uptime',
+            'enabled': True,
+        },
+
+    ],
+}
@@ -0,0 +1,67 @@
+"""Datalogger configuration"""
+
+# General settings.
+main = {
+
+    # Measurement intervals in seconds.
+    'interval': {
+
+        # Apply this interval if device is in field mode.
+        'field': 0.0,
+
+    },
+
+    # Memory budgets for the duty cycle phases in bytes.
+    # These are calibrated for CPython, measured through ``tracemalloc``.
+    'memory': {
+        'budgets': {
+            'read_sensors': 32768,
+            'transmit_readings': 16384,
+            'serialize': 32768,
+        },
+    },
+
+    # Configure logging.
+    'logging': {
+
+        # Enable or disable logging completely.
+        'enabled': True,
+
+        # Log configuration settings at system startup.
+        'configuration': False,
+
+    },
+
+}
+
+# Networking configuration.
+networking = {
+    'wifi': {
+        # Enable/disable WiFi completely.
+        'enabled': False,
+    },
+}
+
+# Sensor configuration.
+sensors = {
+
+    'system': [
+
+        {
+            # Sensor which reports free system memory.
+            'type': 'system.memfree',
+            'enabled': True,
+        },
+        {
+            # Sensor which reports system temperature.
+            'type': 'system.temperature',
+            'enabled': True,
+        },
+        {
+            # Sensor which reports system uptime metrics.
+            'type': 'system.uptime',
+            'enabled': True,
+        },
+
+    ],
+}
@@ -0,0 +1,63 @@
+"""Datalogger configuration"""
+
+# General settings.
+main = {
+
+    # Measurement intervals in seconds.
+    'interval': {
+
+        # Apply this interval if device is in field mode.
+        'field': 0.0,
+
+    },
+
+    # Configure logging.
+    'logging': {
+
+        # Enable or disable logging completely.
+        'enabled': True,
+
+        # Log configuration settings at system startup.
+        'configuration': False,
+
+    },
+
+}
+
+# Networking configuration.
+networking = {
+    'wifi': {
+        # Enable/disable WiFi completely.
+        'enabled': False,
+    },
+}
+
+# Sensor configuration.
+sensors = {
+
+    # Read sensors on independent buses concurrently.
+    'concurrent': {
+        'enabled': True,
+        'timeout': 5.0,
+    },
+
+    'system': [
+
+        {
+            # Sensor which reports free system memory.
+            'type': 'system.memfree',
+            'enabled': True,
+        },
+        {
+            # Sensor which reports system temperature.
+            'type': 'system.temperature',
+            'enabled': True,
+        },
+        {
+            # Sensor which reports system uptime metrics.
+            'type': 'system.uptime',
+            'enabled': True,
+        },
+
+    ],
+}
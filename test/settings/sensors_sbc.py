@@ -37,6 +37,7 @@ sensors = {
         {
             'id': 'ds18b20-1',
             'name': 'temperature',
+            'description': 'Wabengasse',
             'type': 'DS18B20',
             'enabled': True,
             'bus': 'onewire:0',
@@ -45,6 +46,7 @@ sensors = {
                     'enabled': True,
                     'id': 'ds18b20-w1r1',
                     'address': '28FF641D8FDF18C1',
+                    'description': 'Brutraum',
                     'telemetry_name': 'inside.temperature.brood_1',
                     'realm': 'inside',
                     'type': 'temperature',
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+"""
+Benchmarks for the hot path of the duty cycle on mocked hardware.
+
+Run them using ``make benchmark`` and update the baseline
+using ``make benchmark-baseline``.
+"""
+import pytest
+from test.util.terkin import invoke_datalogger
+
+
+def make_dataframe():
+    from terkin.model import DataFrame
+    dataframe = DataFrame()
+    dataframe.data_in = {
+        'system.voltage.battery': 4.12,
+        'system.temperature': 44.71,
+        'system.memfree': 102400,
+        'temperature.28ff641d8fdf18c1.onewire:0': 22.56,
+        'temperature.28ff641d8fc3944f.onewire:0': 23.13,
+        'temperature.0x77.i2c:0': 15.1,
+        'humidity.0x77.i2c:0': 74.75,
+        'pressure.0x77.i2c:0': 1005.21,
+        'weight.0': 42.381,
+    }
+    dataframe.data_out = dict(dataframe.data_in)
+    return dataframe
+
+
+@pytest.mark.benchmark
+@pytest.mark.esp32
+def test_benchmark_duty_cycle(mocker, caplog, benchmark):
+
+    # Define platform.
+    mocker.patch("sys.platform", "esp32")
+
+    from test.settings import benchmark as benchmark_settings
+    datalogger = invoke_datalogger(caplog, settings=benchmark_settings)
+
+    benchmark.measure('duty_cycle', datalogger.duty_cycle)
+    benchmark.measure('read_sensors', datalogger.read_sensors)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('format', ['urlencoded', 'json', 'csv', 'lpp-hiveeyes'])
+def test_benchmark_serialize(format, benchmark):
+    from terkin.telemetry.core import TelemetryClient
+    client = TelemetryClient(interface=None, uri='http://localhost/api', format=format)
+    dataframe = make_dataframe()
+
+    benchmark.measure('serialize.{}'.format(format), lambda: client.serialize(dataframe))
+
+
+@pytest.mark.benchmark
+def test_benchmark_formatter(benchmark):
+    from terkin.telemetry.formatter import to_cayenne_lpp_hiveeyes, to_csv
+    dataframe = make_dataframe()
+
+    benchmark.measure('to_cayenne_lpp_hiveeyes', lambda: to_cayenne_lpp_hiveeyes(dataframe))
+    benchmark.measure('to_csv', lambda: to_csv(dataframe))
+
+
+@pytest.mark.benchmark
+def test_benchmark_configuration(fs, benchmark):
+    from terkin.configuration import TerkinConfiguration
+    import test.settings.basic as settings
+
+    configuration = TerkinConfiguration()
+    configuration.add(settings)
+
+    benchmark.measure('configuration.get', lambda: configuration.get('main.logging.enabled'))
+    benchmark.measure('configuration.get.missing', lambda: configuration.get('sensors.concurrent.enabled', False))
+
+    # Measure the in-memory path, without persisting the user settings file.
+    configuration.record = False
+    benchmark.measure('configuration.set', lambda: configuration.set('main.interval.field', 15.0))
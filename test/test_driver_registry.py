@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import os
+
+import terkin.driver
+from terkin.driver import DRIVERS, resolve_driver
+
+
+def test_driver_registry_complete():
+    """
+    Check that all driver modules are registered and vice versa.
+    """
+    driver_path = os.path.dirname(terkin.driver.__file__)
+    modules = sorted([
+        filename[:-3] for filename in os.listdir(driver_path)
+        if filename.endswith('_sensor.py')
+    ])
+    assert sorted(DRIVERS.values()) == modules
+
+
+def test_driver_registry_resolve():
+    """
+    Check resolving sensor types to driver modules.
+    """
+    assert resolve_driver('bme280') == 'terkin.driver.bme280_sensor'
+    assert resolve_driver('ds18b20') == 'terkin.driver.ds18x20_sensor'
+    assert resolve_driver('system.memfree') is None
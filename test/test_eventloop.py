@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import pytest
+from test.util.terkin import invoke_datalogger
+
+
+def run_eventloop_once(datalogger):
+    """
+    Run the event loop until the first readings have been transmitted.
+    """
+    from terkin.eventloop import TerkinEventLoop
+    eventloop = TerkinEventLoop(datalogger)
+
+    transmit_readings = eventloop.transmit_readings
+
+    async def transmit_readings_and_stop(dataframe):
+        try:
+            return await transmit_readings(dataframe)
+        finally:
+            eventloop.stop()
+
+    eventloop.transmit_readings = transmit_readings_and_stop
+    eventloop.run()
+
+
+@pytest.mark.esp32
+def test_eventloop(mocker, caplog):
+    """
+    Check running the datalogger on the event loop.
+    """
+
+    # Define platform.
+    mocker.patch("sys.platform", "esp32")
+
+    # Acquire settings for the event loop runtime.
+    from test.settings import eventloop as eventloop_settings
+
+    # Invoke datalogger and run the event loop for a single measurement cycle.
+    datalogger = invoke_datalogger(caplog, settings=eventloop_settings, after_setup=run_eventloop_once)
+
+    # Capture log output.
+    captured = caplog.text
+
+    # Proof it works by verifying log output.
+    assert datalogger.runtime == 'eventloop'
+    assert "Starting event loop" in captured, captured
+    assert "--- cycle ---" in captured, captured
+    assert "Reading 3 sensor ports" in captured, captured
+    assert "Stopping event loop" in captured, captured
+
+    # Proof it works by verifying last sensor readings.
+    last_reading = datalogger.storage.last_reading
+    assert last_reading['system.memfree'] == 1000000
+    assert 'system.uptime' in last_reading
+
+
+def test_eventloop_transmit_readings(mocker):
+    """
+    Check transmitting readings one adapter after another on worker
+    threads, while the event loop keeps running other tasks.
+    """
+    import asyncio
+    import threading
+    import time
+
+    from terkin.eventloop import TerkinEventLoop
+    from terkin.model import DataFrame
+    from terkin.telemetry.core import TelemetryManager
+
+    calls = []
+
+    class SlowAdapter:
+
+        def __init__(self, channel_uri):
+            self.channel_uri = channel_uri
+
+        def transmit(self, dataframe):
+            calls.append((self.channel_uri, threading.current_thread() is threading.main_thread()))
+            time.sleep(0.1)
+            return True
+
+    telemetry = TelemetryManager()
+    telemetry.add_adapter(SlowAdapter('http://a'))
+    telemetry.add_adapter(SlowAdapter('http://b'))
+
+    datalogger = mocker.MagicMock()
+    datalogger.device.telemetry = telemetry
+    datalogger.evaluate_telemetry_status.side_effect = lambda status: status
+    eventloop = TerkinEventLoop(datalogger)
+
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(True)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        outcomes = await eventloop.transmit_readings(DataFrame())
+        task.cancel()
+        return outcomes
+
+    try:
+        outcomes = asyncio.run(main())
+    finally:
+        telemetry.get_executor().shutdown()
+
+    assert outcomes == {'http://a': True, 'http://b': True}
+    assert calls == [('http://a', False), ('http://b', False)]
+
+    # The event loop has not been blocked while transmitting.
+    assert len(ticks) > 5
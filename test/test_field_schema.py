@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+
+
+def test_field_schema():
+    """
+    Check computing field names once and assigning stable IDs.
+    """
+    from terkin.sensor.schema import FieldSchema
+    schema = FieldSchema()
+
+    fieldname = schema.get_fieldname(('temperature', None, '0x77', 'i2c:0'))
+    assert fieldname == 'temperature.0x77.i2c:0'
+
+    # Subsequent lookups return the very same string.
+    assert schema.get_fieldname(('temperature', None, '0x77', 'i2c:0')) is fieldname
+
+    # Non-string parts are converted.
+    assert schema.get_fieldname(('scale', 0, 'raw')) == 'scale.0.raw'
+
+    # IDs are assigned in order of registration.
+    assert schema.get_id('temperature.0x77.i2c:0') == 0
+    assert schema.get_id('scale.0.raw') == 1
+    assert schema.add('system.temperature') == 2
+    assert schema.add('temperature.0x77.i2c:0') == 0
+    assert schema.get_name(2) == 'system.temperature'
+
+    # Unknown fields.
+    assert schema.get_id('foo') is None
+    assert schema.get_name(42) is None
+
+    assert schema.to_dict() == {'temperature.0x77.i2c:0': 0, 'scale.0.raw': 1, 'system.temperature': 2}
+
+    # Key readings by field IDs, registering unknown fields on demand.
+    assert schema.to_ids({'system.temperature': 42.5, 'scale.0.raw': 1234, 'time': 1551478192}) == {
+        2: 42.5, 1: 1234, 3: 1551478192}
+    assert schema.get_name(3) == 'time'
+
+
+def test_field_schema_persistence(tmp_path):
+    """
+    Check field IDs are kept across restarts.
+    """
+    from terkin.sensor.schema import FieldSchema
+    filepath = str(tmp_path / FieldSchema.FILENAME)
+
+    schema = FieldSchema()
+    schema.load(filepath)
+    schema.add('temperature.0x77.i2c:0')
+    assert schema.to_ids({'system.memfree': 1000, 'time': 1551478192}) == {1: 1000, 2: 1551478192}
+    assert schema.dirty is False
+
+    # After restarting, fields showing up in a different order keep their IDs.
+    schema = FieldSchema()
+    schema.load(filepath)
+    assert schema.add('time') == 2
+    assert schema.add('weight.0') == 3
+    assert schema.to_ids({'system.memfree': 1000, 'weight.0': 42}) == {1: 1000, 3: 42}
+
+    schema = FieldSchema()
+    schema.load(filepath)
+    assert schema.to_dict() == {'temperature.0x77.i2c:0': 0, 'system.memfree': 1, 'time': 2, 'weight.0': 3}
+
+
+def test_field_schema_threads():
+    """
+    Check fields registered concurrently get distinct IDs.
+    """
+    import threading
+    from terkin.sensor.schema import FieldSchema
+    schema = FieldSchema()
+
+    def register(worker):
+        for index in range(200):
+            schema.add('field.{}'.format(index))
+
+    threads = [threading.Thread(target=register, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(schema.names) == 200
+    assert sorted(schema.ids.values()) == list(range(200))
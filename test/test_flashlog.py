@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import logging
+
+from click.testing import CliRunner
+
+from terkin.flashlog import FlashLogHandler, FlashLogReader, segment_filename
+
+
+def make_logger(handler, name='terkin.test'):
+    logger = logging.Logger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+def get_records(path):
+    return [entry for entry in FlashLogReader(path).read() if entry['type'] == 'record']
+
+
+def test_flashlog_roundtrip(tmp_path):
+
+    handler = FlashLogHandler(str(tmp_path), buffer_size=4096)
+    logger = make_logger(handler)
+
+    logger.debug('Not recorded')
+    logger.info('Reading sensor "%s" on bus %s', 'ds18x20', 0)
+    logger.warning('Value %s out of range, enabled=%s, fallback=%s', 42.5, True, None)
+
+    # Records stay buffered until flushing.
+    assert get_records(str(tmp_path)) == []
+    handler.flush()
+
+    records = get_records(str(tmp_path))
+    assert [record['message'] for record in records] == [
+        'Reading sensor "ds18x20" on bus 0',
+        'Value 42.5 out of range, enabled=True, fallback=None',
+    ]
+    assert records[0]['name'] == 'terkin.test'
+    assert records[0]['levelname'] == 'INFO'
+    assert records[0]['template'] == 'Reading sensor "%s" on bus %s'
+    assert records[1]['args'] == [42.5, True, None]
+
+    # Strings are only defined once per segment.
+    logger.info('Reading sensor "%s" on bus %s', 'bme280', 1)
+    size = len(handler.buffer)
+    logger.info('Reading sensor "%s" on bus %s', 'bme280', 1)
+    assert len(handler.buffer) - size < 30
+
+    # Errors are written immediately.
+    logger.error('Sensor failed')
+    assert handler.buffer == bytearray()
+    assert get_records(str(tmp_path))[-1]['message'] == 'Sensor failed'
+
+
+def test_flashlog_write_failure(tmp_path, mocker):
+
+    handler = FlashLogHandler(str(tmp_path), buffer_size=4096)
+    logger = make_logger(handler)
+
+    # Strings defined within records which could not be written will be defined again.
+    logger.info('Reading sensor "%s"', 'ds18x20')
+    mocker.patch('builtins.open', side_effect=OSError('No space left on device'))
+    handler.flush()
+    mocker.stopall()
+    assert handler.errors == 1
+
+    logger.info('Reading sensor "%s"', 'bme280')
+
+    # Closing also works on CPython without ``uos``.
+    mocker.patch.dict('sys.modules', {'uos': None})
+    handler.close()
+    records = get_records(str(tmp_path))
+    assert [record['message'] for record in records] == ['Reading sensor "bme280"']
+    assert records[0]['name'] == 'terkin.test'
+
+
+def test_flashlog_rotation(tmp_path):
+
+    handler = FlashLogHandler(str(tmp_path), segments=3, segment_size=256, buffer_size=64)
+    logger = make_logger(handler)
+
+    for index in range(50):
+        logger.info('Message number %s', index)
+    handler.flush()
+
+    # Segments are bounded and the oldest records got overwritten.
+    for index in range(3):
+        assert (tmp_path / 'log-{}.bin'.format(index)).stat().st_size <= 256
+    messages = [record['message'] for record in get_records(str(tmp_path))]
+    assert messages[-1] == 'Message number 49'
+    assert 'Message number 0' not in messages
+    assert messages == ['Message number {}'.format(index) for index in range(50 - len(messages), 50)]
+
+    # Resume writing after reboot.
+    handler = FlashLogHandler(str(tmp_path), segments=3, segment_size=256, buffer_size=64)
+    make_logger(handler).info('Rebooted')
+    handler.flush()
+    entries = list(FlashLogReader(str(tmp_path)).read())
+    assert entries[-2]['type'] == 'boot'
+    assert entries[-1]['message'] == 'Rebooted'
+
+
+def test_flashlog_truncated(tmp_path):
+
+    handler = FlashLogHandler(str(tmp_path))
+    logger = make_logger(handler)
+    logger.info('First')
+    logger.info('Second %s', 'message')
+    handler.flush()
+
+    # Simulate power loss while writing.
+    filename = segment_filename(str(tmp_path), 0)
+    with open(filename, 'rb') as f:
+        data = f.read()
+    with open(filename, 'wb') as f:
+        f.write(data[:-3])
+
+    assert [record['message'] for record in get_records(str(tmp_path))] == ['First']
+
+
+def test_flashlog_cli(tmp_path):
+    from terkin_cpython.flashlog import cli
+
+    handler = FlashLogHandler(str(tmp_path))
+    logger = make_logger(handler)
+    logger.info('Starting %s', 'datalogger')
+    logger.warning('Battery low: %s V', 3.25)
+    handler.flush()
+
+    result = CliRunner().invoke(cli, ['--level=warning', str(tmp_path)])
+    assert result.exit_code == 0
+    assert 'Starting datalogger' not in result.output
+    assert '[terkin.test                 ] WARNING: Battery low: 3.25 V' in result.output
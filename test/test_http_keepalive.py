@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import json
+import shutil
+import ssl
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from terkin.model import DataFrame
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests.append((self.path, self.headers['Content-Type'], body))
+
+        # Emulate servers failing after processing the request.
+        if self.server.drop_response:
+            self.close_connection = True
+            return
+
+        # Emulate servers sending malformed responses.
+        if self.server.malformed_response:
+            self.wfile.write(b'HTTP/1.1 OK\r\n\r\n')
+            return
+
+        response = json.dumps({'status': 'ok'}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+        # Emulate servers closing idle connections silently.
+        if self.server.close_after and len(self.server.requests) % self.server.close_after == 0:
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.requests = []
+    server.close_after = None
+    server.drop_response = False
+    server.malformed_response = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def tls_server(server, tmp_path):
+    if shutil.which('openssl') is None:
+        pytest.skip('openssl not available')
+    certfile = str(tmp_path / 'cert.pem')
+    keyfile = str(tmp_path / 'key.pem')
+    subprocess.check_call([
+        'openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+        '-subj', '/CN=127.0.0.1', '-keyout', keyfile, '-out', certfile],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.minimum_version = ssl.TLSVersion.TLSv1_3
+    context.load_cert_chain(certfile, keyfile)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    return server
+
+
+@pytest.fixture(autouse=True)
+def pool():
+    from terkin.network.http import HttpConnection
+    yield HttpConnection.pool
+    HttpConnection.close_all()
+    HttpConnection.pool.clear()
+
+
+def test_http_keepalive(server):
+    from terkin.network.http import HttpConnection
+
+    url = 'http://127.0.0.1:{}/api/data'.format(server.server_port)
+    connection, path = HttpConnection.get(url)
+    assert path == '/api/data'
+
+    for index in range(3):
+        response = connection.request('POST', path, body='{"index": %s}' % index, headers={'Content-Type': 'application/json'})
+        assert response.status_code == 200
+        assert json.loads(response.content) == {'status': 'ok'}
+
+    # All requests have been sent through a single connection.
+    assert server.connections == 1
+    assert [body for path, content_type, body in server.requests] == [b'{"index": 0}', b'{"index": 1}', b'{"index": 2}']
+    assert HttpConnection.get(url)[0] is connection
+
+
+def test_http_keepalive_reconnect(server):
+    from terkin.network.http import HttpConnection
+
+    server.close_after = 1
+    connection, path = HttpConnection.get('http://127.0.0.1:{}/api/data'.format(server.server_port))
+
+    # A new connection is used when the server closed the previous one.
+    for index in range(3):
+        assert connection.request('POST', path, body=b'{}').status_code == 200
+        time.sleep(0.1)
+    assert len(server.requests) == 3
+    assert server.connections == 3
+
+
+def test_http_keepalive_no_retry_after_write(server):
+    from terkin.network.http import HttpConnection
+
+    connection, path = HttpConnection.get('http://127.0.0.1:{}/api/data'.format(server.server_port))
+    assert connection.request('POST', path, body=b'{"index": 0}').status_code == 200
+
+    # Requests which have been written completely will not be retried,
+    # because the server might have processed them already.
+    server.drop_response = True
+    with pytest.raises(OSError):
+        connection.request('POST', path, body=b'{"index": 1}')
+    assert len(server.requests) == 2
+    assert connection.connected is False
+
+
+def test_http_keepalive_malformed_response(server):
+    from terkin.network.http import HttpConnection
+
+    connection, path = HttpConnection.get('http://127.0.0.1:{}/api/data'.format(server.server_port))
+    assert connection.request('POST', path, body=b'{}').status_code == 200
+
+    # The connection is closed when reading the response fails.
+    server.malformed_response = True
+    with pytest.raises(ValueError):
+        connection.request('POST', path, body=b'{}')
+    assert connection.connected is False
+
+
+def test_http_keepalive_tls_session_tickets(tls_server, mocker):
+    from terkin.network.http import HttpConnection
+
+    def wrap_tls(sock, host):
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context.wrap_socket(sock, server_hostname=host)
+
+    mocker.patch('terkin.network.http.wrap_tls', wrap_tls)
+    connection, path = HttpConnection.get('https://127.0.0.1:{}/api/data'.format(tls_server.server_port))
+
+    # Session tickets making the idle connection readable do not count as closed.
+    connection.connect()
+    time.sleep(0.1)
+    assert connection.dropped() is False
+    for index in range(2):
+        assert connection.request('POST', path, body=b'{}').status_code == 200
+    assert len(tls_server.requests) == 2
+    assert tls_server.connections == 1
+
+    # A connection closed by the server does.
+    tls_server.close_after = 3
+    connection.request('POST', path, body=b'{}')
+    time.sleep(0.1)
+    assert connection.dropped() is True
+
+
+def test_telemetry_http_keepalive(server):
+    from terkin.telemetry.core import TelemetryClient
+
+    client = TelemetryClient(
+        interface=None, uri='http://127.0.0.1:{}/api'.format(server.server_port),
+        format='json', settings={'keepalive': True})
+
+    for value in [21.5, 21.7]:
+        dataframe = DataFrame()
+        dataframe.data_out = {'temperature': value}
+        assert client.transmit(dataframe) is True
+
+    assert server.connections == 1
+    assert [(path, content_type) for path, content_type, body in server.requests] == [
+        ('/api', 'application/json'), ('/api', 'application/json')]
+    assert json.loads(server.requests[1][2]) == {'temperature': 21.7}
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import pytest
+from test.util.terkin import invoke_datalogger
+
+
+@pytest.mark.esp32
+def test_boot_timeline(mocker, caplog):
+    """
+    Check recording the durations of the boot phases.
+    """
+
+    # Define platform.
+    mocker.patch("sys.platform", "esp32")
+
+    # Use very basic settings without networking.
+    import test.settings.basic as settings
+
+    # Invoke datalogger for a single duty cycle.
+    datalogger = invoke_datalogger(caplog, settings=settings)
+
+    # Capture log output.
+    captured = caplog.text
+
+    # Proof it works by verifying log output.
+    assert "Boot timeline:" in captured, captured
+
+    # Verify the timeline has been recorded.
+    timeline = datalogger.timeline
+    assert timeline.finished is True
+    names = [span[0] for span in timeline.spans]
+    assert names == [
+        'resume', 'load_state', 'watchdog',
+        'start_networking', 'start_networking.services', 'start_telemetry',
+        'setup_sensors', 'setup_sensors.setup_buses', 'setup_sensors.register_sensors',
+        'setup_sensors.start_sensors', 'read_sensors', 'transmit_readings',
+    ]
+    for name, start, duration in timeline.spans:
+        assert start <= timeline.total
+        assert duration >= 0
+
+    # Verify the timeline has been added to the history.
+    history = datalogger.device.state.scope('timeline')['boots']
+    assert history[-1] == timeline.to_dict()
+
+
+@pytest.mark.esp32
+def test_sensor_metrics(mocker, caplog):
+    """
+    Check recording latencies and outcomes of sensor readings.
+    """
+
+    # Define platform.
+    mocker.patch("sys.platform", "esp32")
+
+    # Acquire settings with system sensors.
+    from test.settings import sensors_scheduler as sensor_settings
+
+    # Invoke datalogger for a single duty cycle.
+    datalogger = invoke_datalogger(caplog, settings=sensor_settings)
+
+    # Verify the report.
+    report = datalogger.device.metrics.report()
+    assert sorted(report['sensor'].keys()) == ['system.memfree', 'system.temperature', 'system.uptime']
+    entry = report['sensor']['system.memfree']
+    assert entry['count'] == 1
+    assert entry['failures'] == 0
+    assert sum(entry['histogram'].values()) == 1
+    assert report['telemetry'] == {}
+
+
+def test_metrics_histogram():
+    """
+    Check bucketing of latencies and accounting of failures and payload sizes.
+    """
+    from terkin.instrumentation import Metrics
+    from terkin.persistence import PersistentState
+
+    metrics = Metrics(PersistentState('/tmp'))
+    metrics.record('telemetry', 'mqtt://localhost/data', 5, size=100)
+    metrics.record('telemetry', 'mqtt://localhost/data', 700, size=120)
+    metrics.record('telemetry', 'mqtt://localhost/data', 20000, success=False)
+
+    entry = metrics.report()['telemetry']['mqtt://localhost/data']
+    assert entry['count'] == 3
+    assert entry['failures'] == 1
+    assert entry['latency_max'] == 20000
+    assert entry['bytes_total'] == 220
+    assert entry['histogram']['<=10ms'] == 1
+    assert entry['histogram']['<=1000ms'] == 1
+    assert entry['histogram']['>10000ms'] == 1
+
+
+def test_metrics_threads():
+    """
+    Check operations recorded concurrently are all accounted for.
+    """
+    import threading
+    from terkin.instrumentation import Metrics
+    from terkin.persistence import PersistentState
+
+    metrics = Metrics(PersistentState('/tmp'))
+
+    def record(worker):
+        for index in range(1000):
+            metrics.record('telemetry', 'mqtt://localhost/data', index % 100, size=1)
+
+    threads = [threading.Thread(target=record, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    entry = metrics.report()['telemetry']['mqtt://localhost/data']
+    assert entry['count'] == 4000
+    assert entry['bytes_total'] == 4000
+    assert sum(entry['histogram'].values()) == 4000
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import logging
+import threading
+
+from terkin.logging import RingBufferHandler
+
+
+def make_logger(handler):
+    logger = logging.Logger('terkin.test')
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+def test_logbuffer_records():
+
+    handler = RingBufferHandler(size=1024)
+    logger = make_logger(handler)
+
+    logger.debug('Not recorded')
+    logger.info('Reading sensor "%s"', 'ds18x20')
+    logger.warning('Battery low: %s V', 3.25)
+
+    records = handler.records()
+    assert [record['seq'] for record in records] == [1, 2]
+    assert [record['message'] for record in records] == ['Reading sensor "ds18x20"', 'Battery low: 3.25 V']
+    assert records[1]['level'] == logging.WARNING
+
+    # Fetch new records only.
+    logger.info('Third')
+    assert [record['message'] for record in handler.records(since=2)] == ['Third']
+    assert [record['seq'] for record in handler.records(limit=2)] == [1, 2]
+    assert handler.records(since=3) == []
+
+
+def test_logbuffer_bounded():
+
+    handler = RingBufferHandler(size=256, max_length=40)
+    logger = make_logger(handler)
+    storage = handler.buffer
+
+    for index in range(100):
+        logger.info('Message number %s', index)
+    logger.info('x' * 100)
+
+    # The storage is preallocated and never grows.
+    assert handler.buffer is storage
+    assert len(handler.buffer) == 256
+    assert handler.used <= 256
+
+    # The oldest records got dropped, the newest ones survived the wrap-around.
+    records = handler.records()
+    assert records[-1]['message'] == 'x' * 40
+    assert records[-2]['message'] == 'Message number 99'
+    assert handler.first_sequence == records[0]['seq'] > 1
+    assert [record['seq'] for record in records] == list(range(handler.first_sequence, 102))
+    assert [record['message'] for record in records[:-1]] == [
+        'Message number {}'.format(seq - 1) for seq in range(handler.first_sequence, 101)]
+
+
+def test_logbuffer_threads():
+
+    handler = RingBufferHandler(size=512)
+    logger = make_logger(handler)
+
+    def emit(worker):
+        for index in range(200):
+            logger.info('Worker %s message %s', worker, index)
+
+    threads = [threading.Thread(target=emit, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+
+    # Reading concurrently always yields consistent records.
+    while any(thread.is_alive() for thread in threads):
+        records = handler.records()
+        for previous, record in zip(records, records[1:]):
+            assert record['seq'] == previous['seq'] + 1
+        assert all(record['message'].startswith('Worker ') for record in records)
+
+    for thread in threads:
+        thread.join()
+    assert handler.sequence == 801
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+"""
+Memory budget checks for the duty cycle on mocked hardware.
+
+Run them using ``make test-memory``.
+"""
+import pytest
+from test.util.terkin import invoke_datalogger
+
+
+@pytest.mark.memory
+@pytest.mark.esp32
+def test_memory_duty_cycle(mocker, caplog, memory_monitor):
+    """
+    Check allocations of the duty cycle phases against their budgets.
+    """
+
+    # Define platform.
+    mocker.patch("sys.platform", "esp32")
+
+    from test.settings import memory as memory_settings
+    datalogger = invoke_datalogger(caplog, settings=memory_settings)
+
+    # Run another duty cycle, tracing memory allocations.
+    monitor = memory_monitor(budgets=datalogger.settings.get('main.memory.budgets'))
+    datalogger.memory = monitor
+    datalogger.duty_cycle()
+
+    # Serialize the last reading to all telemetry formats.
+    from terkin.model import DataFrame
+    from terkin.telemetry.core import TelemetryClient
+    dataframe = DataFrame()
+    dataframe.data_in = datalogger.storage.last_reading
+    dataframe.data_out = dict(dataframe.data_in)
+    clients = [
+        TelemetryClient(interface=None, uri='http://localhost/api', format=format)
+        for format in ['urlencoded', 'json', 'csv', 'lpp-hiveeyes']
+    ]
+
+    # Warm up, in order to not account for importing modules.
+    for client in clients:
+        client.serialize(dataframe)
+
+    with monitor.phase('serialize'):
+        for client in clients:
+            client.serialize(dataframe)
+
+    assert sorted(monitor.deltas.keys()) == ['read_sensors', 'serialize', 'transmit_readings'], monitor.report()
+    assert 'sensors' in monitor.allocations['read_sensors'], monitor.report()
+    assert not monitor.exceeded, monitor.report()
+
+
+def test_memory_monitor_budget(caplog):
+    """
+    Check the memory monitor warns when exceeding a budget.
+    """
+
+    from terkin.instrumentation import MemoryMonitor
+    monitor = MemoryMonitor(budgets={'read_sensors': 1000})
+
+    monitor.record('read_sensors', 500)
+    assert monitor.exceeded == {}
+
+    monitor.record('read_sensors', 1500)
+    assert monitor.exceeded == {'read_sensors': 1500}
+    assert 'Memory budget exceeded in phase "read_sensors"' in caplog.text
+
+    # Phases without budget are recorded only.
+    monitor.record('transmit_readings', 1500)
+    assert monitor.deltas == {'read_sensors': 1500, 'transmit_readings': 1500}
+    assert list(monitor.exceeded.keys()) == ['read_sensors']
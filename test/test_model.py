@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import pytest
+
+
+def make_reading(data):
+    from terkin.model import SensorReading
+    reading = SensorReading()
+    reading.data = data
+    return reading
+
+
+def test_dataframe_reuse():
+    """
+    Check reusing a data frame across duty cycles.
+    """
+    from terkin.model import DataFrame
+    dataframe = DataFrame()
+    readings = dataframe.readings
+    data_in = dataframe.data_in
+
+    dataframe.add(make_reading({'temperature.0x77.i2c:0': 15.1, 'humidity.0x77.i2c:0': 74.75}))
+    dataframe.add(make_reading({'weight.0': 42.381}))
+    dataframe.data_out = dataframe.data_in
+    dataframe.payload_out = 'weight.0=42.381'
+
+    assert len(dataframe.readings) == 2
+    assert dataframe.data_in == {'temperature.0x77.i2c:0': 15.1, 'humidity.0x77.i2c:0': 74.75, 'weight.0': 42.381}
+
+    dataframe.reset()
+    assert dataframe.readings == []
+    assert dataframe.data_in == {}
+    assert dataframe.payload_out is None
+
+    # The containers are reused.
+    assert dataframe.readings is readings
+    assert dataframe.data_in is data_in
+
+    # No per-instance dictionaries.
+    with pytest.raises(AttributeError):
+        dataframe.foo = 'bar'
+
+
+def test_dataframe_intern_fields():
+    """
+    Check field names are interned when adding readings.
+    """
+    from terkin.model import DataFrame, intern_field
+    name = intern_field('temperature.{}.onewire:0'.format('28ff641d8fdf18c1'))
+
+    dataframe = DataFrame()
+    dataframe.add(make_reading({'temperature.{}.onewire:0'.format('28ff641d8fdf18c1'): 22.56}))
+
+    assert list(dataframe.data_in.keys())[0] is name
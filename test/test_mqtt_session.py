@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+
+class FakeBroker:
+    """
+    Minimal MQTT 3.1.1 broker, acknowledging QoS 1 messages after a delay.
+    """
+
+    def __init__(self, ack_delay=0.0):
+        self.ack_delay = ack_delay
+        self.connections = 0
+        self.messages = []
+        self.sessions = set()
+        self.pings = 0
+
+        # Close the connection after receiving this many messages, without acknowledging the last one.
+        self.drop_after = None
+
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(5)
+        self.port = self.server.getsockname()[1]
+        self.running = True
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def stop(self):
+        self.running = False
+        self.server.close()
+
+    def serve(self):
+        while self.running:
+            try:
+                sock, address = self.server.accept()
+            except OSError:
+                break
+            self.connections += 1
+            threading.Thread(target=self.handle, args=(sock,), daemon=True).start()
+
+    def read(self, stream, size):
+        data = b''
+        while len(data) < size:
+            chunk = stream.read(size - len(data))
+            if not chunk:
+                raise EOFError()
+            data += chunk
+        return data
+
+    def read_packet(self, stream):
+        try:
+            header = self.read(stream, 1)
+            size = 0
+            shift = 0
+            while True:
+                byte = self.read(stream, 1)[0]
+                size |= (byte & 0x7f) << shift
+                if not byte & 0x80:
+                    break
+                shift += 7
+            return header[0], self.read(stream, size)
+        except (EOFError, OSError):
+            return None, None
+
+    def handle(self, sock):
+        stream = sock.makefile('rwb', 0)
+        lock = threading.Lock()
+
+        def send(data):
+            with lock:
+                try:
+                    stream.write(data)
+                except OSError:
+                    pass
+
+        while True:
+            op, body = self.read_packet(stream)
+            if op is None:
+                break
+
+            # CONNECT
+            if op == 0x10:
+                clean_session = body[7] & 0x02
+                length = struct.unpack('!H', body[10:12])[0]
+                client_id = body[12:12 + length]
+                present = not clean_session and client_id in self.sessions
+                if clean_session:
+                    self.sessions.discard(client_id)
+                else:
+                    self.sessions.add(client_id)
+                send(bytes([0x20, 0x02, int(present), 0x00]))
+
+            # PUBLISH
+            elif op & 0xf0 == 0x30:
+                length = struct.unpack('!H', body[:2])[0]
+                topic = body[2:2 + length]
+                pid = struct.unpack('!H', body[2 + length:4 + length])[0]
+                payload = body[4 + length:]
+                self.messages.append((topic, payload, bool(op & 0x08)))
+                if self.drop_after is not None and len(self.messages) >= self.drop_after:
+                    self.drop_after = None
+                    sock.shutdown(socket.SHUT_RDWR)
+                    sock.close()
+                    break
+                puback = bytes([0x40, 0x02]) + struct.pack('!H', pid)
+                threading.Timer(self.ack_delay, send, args=(puback,)).start()
+
+            # PINGREQ
+            elif op == 0xc0:
+                self.pings += 1
+                send(b'\xd0\x00')
+
+
+@pytest.fixture
+def broker():
+    broker = FakeBroker(ack_delay=0.3)
+    yield broker
+    broker.stop()
+
+
+def make_adapter(broker, **settings):
+    from terkin.telemetry.core import MQTTAdapter
+    return MQTTAdapter('terkin.test', '127.0.0.1', port=broker.port, settings=settings)
+
+
+def test_mqtt_inflight_window(broker):
+    adapter = make_adapter(broker, window=4)
+
+    # Publishing does not wait for acknowledgements.
+    start = time.time()
+    for index in range(3):
+        adapter.publish('testdrive/data.json', '{"index": %s}' % index)
+    assert time.time() - start < 0.25
+    assert len(adapter.session.inflight) == 3
+
+    # Publishing blocks when the window is full.
+    adapter.publish('testdrive/data.json', '{"index": 3}')
+    adapter.publish('testdrive/data.json', '{"index": 4}')
+    assert time.time() - start >= 0.25
+    assert len(adapter.session.inflight) <= 4
+
+    assert adapter.drain(timeout=2.0) is True
+    assert adapter.session.inflight == []
+    assert [payload for topic, payload, dup in broker.messages] == [
+        b'{"index": 0}', b'{"index": 1}', b'{"index": 2}', b'{"index": 3}', b'{"index": 4}']
+    assert broker.connections == 1
+
+
+def test_mqtt_keepalive_ping(broker):
+    adapter = make_adapter(broker, keepalive=1)
+    adapter.publish('testdrive/data.json', '{}')
+    time.sleep(0.6)
+    adapter.poll()
+    time.sleep(0.1)
+    adapter.poll()
+    assert broker.pings == 1
+    assert adapter.session.ping_pending is False
+    assert adapter.connected is True
+
+
+def test_mqtt_session_resumption(broker):
+    from terkin.telemetry.core import TelemetryAdapterError
+
+    broker.drop_after = 2
+
+    # Sessions are persistent by default.
+    adapter = make_adapter(broker)
+    assert adapter.session.clean_session is False
+
+    adapter.publish('testdrive/data.json', '{"index": 1}')
+    adapter.publish('testdrive/data.json', '{"index": 2}')
+    time.sleep(0.1)
+
+    # The broken connection is detected when publishing the next message.
+    # Within the testsuite, ``log.exc`` re-raises the original exception.
+    with pytest.raises((TelemetryAdapterError, OSError)):
+        adapter.publish('testdrive/data.json', '{"index": 3}')
+    assert adapter.connected is False
+
+    # Reconnecting resumes the session and retransmits unacknowledged messages.
+    adapter.publish('testdrive/data.json', '{"index": 3}')
+    assert adapter.drain(timeout=2.0) is True
+    assert broker.connections == 2
+    assert broker.messages[2:] == [
+        (b'testdrive/data.json', b'{"index": 1}', True),
+        (b'testdrive/data.json', b'{"index": 2}', True),
+        (b'testdrive/data.json', b'{"index": 3}', False),
+    ]
+
+
+def test_mqtt_reconnect_backoff():
+    from terkin.telemetry.core import MQTTAdapter, TelemetryAdapterError
+
+    # Nothing listens on this port.
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+
+    adapter = MQTTAdapter('terkin.test', '127.0.0.1', port=port, settings={'backoff_min': 2})
+    with pytest.raises((TelemetryAdapterError, OSError)):
+        adapter.connect()
+    assert adapter.backoff == 2
+
+    # Reconnecting is deferred until the backoff time elapsed.
+    with pytest.raises(TelemetryAdapterError) as ex:
+        adapter.connect()
+    assert 'deferred' in str(ex.value)
+    assert adapter.backoff == 2
+
+
+def test_mqtt_concurrent_publish(broker):
+    broker.ack_delay = 0.0
+    adapter = make_adapter(broker, window=4)
+    adapter.connect()
+
+    def publish(worker):
+        for index in range(10):
+            adapter.publish('testdrive/data.json', '{"worker": %s, "index": %s}' % (worker, index))
+
+    # Publish from multiple threads while the event loop polls the session.
+    threads = [threading.Thread(target=publish, args=(worker,)) for worker in range(3)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        adapter.poll()
+    for thread in threads:
+        thread.join()
+
+    assert adapter.drain(timeout=2.0) is True
+    assert adapter.connected is True
+    assert len(broker.messages) == 30
+    assert len(set(payload for topic, payload, dup in broker.messages)) == 30
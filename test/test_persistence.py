@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import json
+
+import pytest
+
+from test.util.terkin import invoke_umal
+
+
+class FakeRTC:
+
+    def __init__(self, capacity=2048):
+        self.capacity = capacity
+        self.data = b''
+
+    def memory(self, data=None):
+        if data is None:
+            return self.data
+        if len(data) > self.capacity:
+            raise ValueError('buffer too long')
+        self.data = data
+
+
+@pytest.fixture(autouse=True)
+def bootloader():
+    # ``PersistentState`` needs the platform information.
+    return invoke_umal()
+
+
+def make_state(mocker, path, rtc=None, file_interval=600):
+    from terkin.persistence import PersistentState
+    state = PersistentState(str(path), file_interval=file_interval)
+    mocker.patch.object(state, 'get_rtc', return_value=rtc)
+    return state
+
+
+def test_state_rtc_fallback(mocker, tmp_path):
+    """
+    Check falling back to the filesystem when exceeding the RTC memory.
+    """
+    rtc = FakeRTC(capacity=64)
+
+    state = make_state(mocker, tmp_path, rtc)
+    state.scope('sensors')['a'] = 1
+    assert state.save() is True
+    assert json.loads(rtc.data) == {'sensors': {'a': 1}}
+    assert not state.file_exists()
+
+    # An outdated state must not remain within RTC memory.
+    state.scope('sensors')['b'] = 'x' * 100
+    assert state.save() is True
+    assert rtc.data == b''
+    assert state.file_exists()
+
+    state = make_state(mocker, tmp_path, rtc)
+    assert state.load() == {'sensors': {'a': 1, 'b': 'x' * 100}}
+
+    # When the state fits into RTC memory again, the file is removed.
+    del state.scope('sensors')['b']
+    assert state.save() is True
+    assert json.loads(rtc.data) == {'sensors': {'a': 1}}
+    assert not state.file_exists()
+
+
+def test_state_deferred(mocker, tmp_path):
+    """
+    Check changes of metrics and scheduling state are written to the
+    filesystem at most each ``file_interval`` seconds.
+    """
+    clock = mocker.patch('terkin.persistence.time.time', return_value=1000)
+
+    state = make_state(mocker, tmp_path)
+    state.scope('telemetry_batch')['a'] = 1
+    state.scope('metrics')['sensor'] = {'system.memfree': {'n': 1}}
+    state.scope('timeline')['boots'] = [{'total': 1}]
+    assert state.save() is True
+    with open(state.filepath) as f:
+        assert json.load(f) == {'telemetry_batch': {'a': 1}, 'metrics': {'sensor': {'system.memfree': {'n': 1}}}, '_time': 1000}
+
+    # Changing metrics and scheduling state only will not rewrite the file within the interval.
+    state.scope('metrics')['sensor']['system.memfree']['n'] = 2
+    state.scope('sensors')['b'] = 1
+    clock.return_value = 1599
+    assert state.save() is True
+    state = make_state(mocker, tmp_path)
+    assert state.load()['metrics'] == {'sensor': {'system.memfree': {'n': 1}}}
+    assert 'sensors' not in state.data
+
+    # After the interval, it will.
+    state.scope('metrics')['sensor']['system.memfree']['n'] = 3
+    clock.return_value = 1600
+    assert state.save() is True
+    state = make_state(mocker, tmp_path)
+    assert state.load()['metrics'] == {'sensor': {'system.memfree': {'n': 3}}}
+    assert '_time' not in state.data
+
+    # Other changes are written right away, including the metrics.
+    state.scope('metrics')['sensor']['system.memfree']['n'] = 4
+    state.scope('telemetry_batch')['a'] = 2
+    clock.return_value = 1601
+    assert state.save() is True
+    state = make_state(mocker, tmp_path)
+    assert state.load() == {'telemetry_batch': {'a': 2}, 'metrics': {'sensor': {'system.memfree': {'n': 4}}}}
+
+    # The boot timeline is not written to the filesystem at all.
+    state.scope('timeline')['boots'] = [{'total': 2}]
+    clock.return_value = 2000
+    assert state.save() is True
+    state = make_state(mocker, tmp_path)
+    assert 'timeline' not in state.load()
+    mocker.stopall()
+
+    # Within RTC memory, everything is kept.
+    rtc = FakeRTC()
+    state = make_state(mocker, tmp_path, rtc)
+    state.scope('metrics')['sensor'] = {'system.memfree': {'n': 1}}
+    state.scope('timeline')['boots'] = [{'total': 1}]
+    assert state.save() is True
+    assert json.loads(rtc.data) == {'metrics': {'sensor': {'system.memfree': {'n': 1}}}, 'timeline': {'boots': [{'total': 1}]}}
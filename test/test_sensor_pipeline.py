@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import pytest
+
+
+def test_pipeline_nothing_to_do():
+    """
+    Check sensors without post-processing settings do not get a pipeline.
+    """
+    from terkin.sensor.pipeline import SensorPipeline
+    assert SensorPipeline.from_settings({'type': 'BME280'}) is None
+
+
+def test_pipeline_decimals():
+    """
+    Check rounding all values.
+    """
+    from terkin.sensor.pipeline import SensorPipeline
+    pipeline = SensorPipeline.from_settings({'decimals': 3})
+    data = pipeline.apply({'weight.0': 42.38149, 'scale.0.raw': 87448})
+    assert data == {'weight.0': 42.381, 'scale.0.raw': 87448}
+
+
+def test_pipeline_calibration_and_units():
+    """
+    Check calibration and unit conversion, keyed by quantity or by field name.
+    """
+    from terkin.sensor.pipeline import SensorPipeline
+    pipeline = SensorPipeline.from_settings({
+        'calibration': {
+            'temperature': [-0.5, 1.0],
+            'humidity.0x77.i2c:0': [1.0, 0.5, 0.01],
+        },
+        'units': {
+            'temperature': 'fahrenheit',
+        },
+        'decimals': 2,
+    })
+
+    data = pipeline.apply({
+        'temperature.0x77.i2c:0': 20.5,
+        'humidity.0x77.i2c:0': 10.0,
+        'pressure.0x77.i2c:0': 1005.214,
+    })
+
+    # (20.5 - 0.5) * 1.8 + 32
+    assert data['temperature.0x77.i2c:0'] == 68.0
+
+    # 1.0 + 0.5 * 10 + 0.01 * 10 ** 2
+    assert data['humidity.0x77.i2c:0'] == 7.0
+
+    # Rounding only.
+    assert data['pressure.0x77.i2c:0'] == 1005.21
+
+    # Steps have been compiled per field.
+    assert sorted(pipeline.steps.keys()) == [
+        'humidity.0x77.i2c:0', 'pressure.0x77.i2c:0', 'temperature.0x77.i2c:0']
+
+
+def test_pipeline_unknown_unit():
+    from terkin.sensor.pipeline import SensorPipeline
+    with pytest.raises(ValueError) as ex:
+        SensorPipeline.from_settings({'units': {'temperature': 'rankine'}})
+    assert 'Unknown unit "rankine"' in str(ex.value)
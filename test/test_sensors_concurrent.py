@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import time
+
+import pytest
+from test.util.terkin import invoke_datalogger
+
+
+@pytest.mark.sensors
+@pytest.mark.esp32
+def test_sensors_concurrent(mocker, caplog):
+    """
+    Check reading sensors concurrently.
+    """
+
+    # Define platform.
+    mocker.patch("sys.platform", "esp32")
+
+    # Acquire settings with concurrent sensor acquisition.
+    from test.settings import sensors_concurrent as sensor_settings
+
+    # Invoke datalogger for a single duty cycle.
+    datalogger = invoke_datalogger(caplog, settings=sensor_settings)
+
+    # Capture log output.
+    captured = caplog.text
+
+    # Proof it works by verifying log output.
+    assert "Reading 3 sensor ports concurrently" in captured, captured
+
+    # Proof it works by verifying last sensor readings.
+    last_reading = datalogger.storage.last_reading
+    assert last_reading['system.memfree'] == 1000000
+    assert last_reading['system.temperature'] == 44.7053182608696
+    assert 'system.uptime' in last_reading
+
+    # Readings are merged in order of sensor registration.
+    assert list(last_reading.keys())[:2] == ['system.memfree', 'system.temperature']
+
+    # The garbage collector has been enabled again.
+    import gc
+    assert gc.isenabled()
+
+
+@pytest.mark.sensors
+def test_sensors_concurrent_timeout():
+    """
+    Check that jobs exceeding their deadline will be abandoned.
+    """
+
+    from terkin.concurrency import ConcurrentExecutor, ConcurrentJob
+
+    def fast(job):
+        return 42
+
+    def slow(job):
+        time.sleep(0.5)
+        return 43
+
+    executor = ConcurrentExecutor(max_workers=2)
+    jobs = [
+        ConcurrentJob('fast', fast, timeout=0.3),
+        ConcurrentJob('slow', slow, timeout=0.1),
+    ]
+    executor.run(jobs)
+    executor.shutdown()
+
+    assert jobs[0].done is True
+    assert jobs[0].result == 42
+    assert jobs[1].timed_out is True
+    assert jobs[1].result is None
@@ -31,6 +31,9 @@ def test_sensors_sbc(mocker, caplog):
     assert "Found 2 I2C devices: [118, 119]" in captured, captured
     assert "Found 2 1-Wire (DS18x20) devices: ['28ff641d8fdf18c1', '28ff641d8fc3944f']" in captured, captured
 
+    # Conversion on DS18x20 sensors has been started up front.
+    assert 'Started measurement on sensor "DS18x20Sensor", ready in 750 ms' in captured, captured
+
     # Get hold of the last reading.
     last_reading = datalogger.storage.last_reading
 
@@ -44,3 +47,19 @@ def test_sensors_sbc(mocker, caplog):
     # DS18B20
     assert last_reading['temperature.28ff641d8fdf18c1.onewire:0'] == 48.187
     assert last_reading['temperature.28ff641d8fc3944f.onewire:0'] == 48.187
+
+    # All fields have been registered with the field schema when starting the sensors.
+    schema = datalogger.sensor_manager.schema
+    for fieldname in [
+        'temperature.0x77.i2c:0', 'humidity.0x77.i2c:0', 'pressure.0x77.i2c:0',
+        'temperature.28ff641d8fdf18c1.onewire:0', 'temperature.28ff641d8fc3944f.onewire:0',
+    ]:
+        field_id = schema.get_id(fieldname)
+        assert field_id is not None, fieldname
+        assert schema.get_name(field_id) == fieldname
+
+    # Descriptions of sensors and devices are materialized on demand.
+    richdata = datalogger.get_richdata(datalogger.storage.last_dataframe)
+    assert richdata['temperature.0x77.i2c:0']['description'] == 'Temperatur und Feuchte'
+    assert richdata['temperature.28ff641d8fdf18c1.onewire:0']['description'] == 'Brutraum'
+    assert richdata['temperature.28ff641d8fc3944f.onewire:0']['description'] == 'Wabengasse'
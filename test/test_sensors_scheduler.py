@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import pytest
+from test.util.terkin import invoke_datalogger
+
+
+@pytest.mark.sensors
+@pytest.mark.esp32
+def test_sensors_scheduler(mocker, caplog):
+    """
+    Check reading sensors at individual intervals.
+    """
+
+    # Define platform.
+    mocker.patch("sys.platform", "esp32")
+
+    # Acquire settings with individual sensor intervals.
+    from test.settings import sensors_scheduler as sensor_settings
+
+    # Invoke datalogger for a single duty cycle.
+    datalogger = invoke_datalogger(caplog, settings=sensor_settings)
+
+    # All sensors are due on the first duty cycle.
+    assert "Reading 3 sensor ports" in caplog.text, caplog.text
+    uptime = datalogger.storage.last_reading['system.uptime']
+
+    # Run another duty cycle.
+    caplog.clear()
+    datalogger.duty_cycle()
+    captured = caplog.text
+
+    # The uptime sensor is not due yet, so its last reading is carried forward.
+    assert "Reading 2 sensor ports" in captured, captured
+    assert 'Carrying forward last reading of sensor "SystemUptime"' in captured, captured
+    assert datalogger.storage.last_reading['system.uptime'] == uptime
+    assert datalogger.storage.last_reading['system.memfree'] == 1000000
+
+    # The next wakeup is driven by the main interval.
+    assert 0 < datalogger.get_sleep_time() <= 60.0
+    assert datalogger.sensor_scheduler.get_time_until_due(datalogger.sensor_manager.sensors) > 3500
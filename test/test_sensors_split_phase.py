@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import time
+
+import pytest
+from test.util.terkin import invoke_datalogger
+
+
+def make_sensor(name, delay, events):
+    """
+    Create a sensor emulating a conversion time, recording the order of invocations.
+    """
+    from terkin.sensor import AbstractSensor
+
+    class SplitPhaseSensor(AbstractSensor):
+
+        def begin_measurement(self):
+            events.append(('begin', name))
+            return delay
+
+        def collect(self):
+            events.append(('collect', name))
+            return {name: delay}
+
+        def read(self):
+            events.append(('read', name))
+            return {name: delay}
+
+    return SplitPhaseSensor(settings={'id': name})
+
+
+@pytest.mark.sensors
+@pytest.mark.esp32
+def test_sensors_split_phase(mocker, caplog):
+    """
+    Check measurements of split-phase sensors are started up front,
+    so their conversion times overlap.
+    """
+
+    # Define platform.
+    mocker.patch("sys.platform", "esp32")
+
+    # Acquire minimal settings.
+    from test.settings import basic as settings
+
+    events = []
+
+    def register_sensors(datalogger):
+        for name, delay in [('split.a', 300), ('split.b', 200), ('split.c', 100)]:
+            datalogger.sensor_manager.register_sensor(make_sensor(name, delay, events))
+
+    # Invoke datalogger for a single duty cycle.
+    datalogger = invoke_datalogger(caplog, settings=settings, after_setup=register_sensors)
+
+    # Measurements have been started on all split-phase sensors before collecting any result.
+    assert events == [
+        ('begin', 'split.a'), ('begin', 'split.b'), ('begin', 'split.c'),
+        ('collect', 'split.a'), ('collect', 'split.b'), ('collect', 'split.c'),
+    ]
+    assert datalogger.storage.last_reading['split.a'] == 300
+
+    # Reading all sensors takes about the longest conversion time, not the sum of all.
+    start = time.time()
+    datalogger.read_sensors()
+    duration = time.time() - start
+    assert 0.25 <= duration < 0.5, duration
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+from tools.strip_logging import strip_source
+
+
+SOURCE = '''
+def read(self):
+    log.info('Reading sensor "%s"', self.name)
+    if self.driver is None:
+        log.debug('Driver for sensor "%s" '
+                  'not initialized', self.name)
+    else:
+        value = self.driver.read(); log.info('Value: %s', value)
+    log.warning('Sensor "%s" is slow', self.name)
+    return value
+'''
+
+EXPECTED = '''
+def read(self):
+    pass
+    if self.driver is None:
+        pass
+
+    else:
+        value = self.driver.read(); log.info('Value: %s', value)
+    log.warning('Sensor "%s" is slow', self.name)
+    return value
+'''
+
+
+def test_strip_logging():
+    """
+    Check removing log calls of designated levels, keeping line numbers intact.
+    """
+    stripped, count = strip_source(SOURCE, ['debug', 'info'])
+    assert stripped == EXPECTED
+    assert count == 2
+
+
+def test_strip_logging_non_ascii():
+    """
+    Check column offsets are handled correctly for lines with non-ASCII characters.
+    """
+    source = (
+        'log.info("Température: %s", value)\n'
+        'log.info("Température élevée à");x()\n'
+        'log.info("Température")  # Kommentar\n'
+    )
+    stripped, count = strip_source(source, ['info'])
+    assert stripped == (
+        'pass\n'
+        'log.info("Température élevée à");x()\n'
+        'pass\n'
+    )
+    assert count == 2
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import json
+
+from terkin.model import DataFrame
+
+
+def test_serialize_batch_formats():
+    from terkin.telemetry.core import TelemetryClient
+
+    rows = [
+        (1551478192, {'temperature': 21.5, 'status': 'ok'}),
+        (1551478252, {'temperature': 21.75, 'weight': 42}),
+    ]
+
+    client = TelemetryClient(interface=None, uri='http://localhost/data', format='json')
+    assert json.loads(client.serialize_batch(rows)) == [
+        {'temperature': 21.5, 'status': 'ok', 'time': 1551478192},
+        {'temperature': 21.75, 'weight': 42, 'time': 1551478252},
+    ]
+
+    client = TelemetryClient(interface=None, uri='http://localhost/data', format='csv')
+    lines = client.serialize_batch(rows).split('\n')
+    assert lines[0] == 'datetime.ISO8601,temperature,status,weight'
+    assert len(lines) == 3
+    assert lines[1].endswith(',21.5,ok,')
+    assert lines[2].endswith(',21.75,,42')
+
+    client = TelemetryClient(
+        interface=None, uri='http://localhost/data', format='lineprotocol', settings={'measurement': 'hive 1'})
+    assert client.serialize_batch(rows).split('\n') == [
+        'hive\\ 1 temperature=21.5,status="ok" 1551478192000000000',
+        'hive\\ 1 temperature=21.75,weight=42i 1551478252000000000',
+    ]
+
+
+class FakeState:
+
+    def __init__(self):
+        self.data = {}
+
+    def scope(self, name):
+        return self.data.setdefault(name, {})
+
+
+class FakeDevice:
+
+    class watchdog:
+        @staticmethod
+        def feed():
+            pass
+
+    networking = None
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.state = FakeState()
+
+
+def make_dataframe(value):
+    dataframe = DataFrame()
+    dataframe.data_in['value'] = value
+    return dataframe
+
+
+def test_adapter_batch(mocker):
+    from terkin.telemetry.core import TelemetryAdapter, TelemetryManager
+
+    device = FakeDevice(settings={})
+    adapter = TelemetryAdapter(device=device, target={
+        'endpoint': 'http://localhost/data',
+        'data': {'key': 'secret'},
+        'batch': {'size': 3},
+    })
+    adapter.setup()
+    manager = TelemetryManager()
+    manager.add_adapter(adapter)
+
+    requests = []
+
+    def send(rows, timestamp_field='time'):
+        requests.append(rows)
+        return True
+
+    mocker.patch.object(adapter.client, 'transmit_batch', side_effect=send)
+
+    # Readings are queued within the persistent state until the batch is full.
+    assert adapter.transmit(make_dataframe(1)) is True
+    assert adapter.transmit(make_dataframe(2)) is True
+    assert requests == []
+    assert len(device.state.scope('telemetry_batch')[adapter.channel_uri]) == 2
+
+    assert adapter.transmit(make_dataframe(3)) is True
+    assert len(requests) == 1
+    assert [data for timestamp, data in requests[0]] == [
+        {'value': 1, 'key': 'secret'}, {'value': 2, 'key': 'secret'}, {'value': 3, 'key': 'secret'}]
+    assert adapter.batch == []
+
+    # Shutting down flushes incomplete batches.
+    adapter.transmit(make_dataframe(4))
+    assert manager.flush() == {adapter.channel_uri: True}
+    assert len(requests) == 2
+    assert manager.flush() == {}
+
+
+def test_adapter_batch_age_and_failure(mocker):
+    from terkin.telemetry.core import TelemetryAdapter
+
+    adapter = TelemetryAdapter(device=FakeDevice(settings={}), target={
+        'endpoint': 'http://localhost/data',
+        'batch': {'size': 10, 'age': 60, 'limit': 3},
+    })
+    adapter.setup()
+    transmit_batch = mocker.patch.object(adapter.client, 'transmit_batch', return_value=False)
+
+    # Batches are also due when their oldest reading is too old.
+    adapter.transmit(make_dataframe(1))
+    assert transmit_batch.call_count == 0
+    adapter.batch[0][0] -= 120
+    assert adapter.transmit(make_dataframe(2)) is False
+    assert transmit_batch.call_count == 1
+
+    # Failed batches stay queued, up to the limit.
+    adapter.transmit(make_dataframe(3))
+    adapter.transmit(make_dataframe(4))
+    assert [data['value'] for timestamp, data in adapter.batch] == [2, 3, 4]
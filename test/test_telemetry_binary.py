@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import json
+
+import pytest
+
+from terkin.model import DataFrame
+from terkin.telemetry.formatter import to_cbor, to_msgpack
+
+
+# Examples from RFC 8949, Appendix A.
+@pytest.mark.parametrize('value, expected', [
+    (0, '00'),
+    (23, '17'),
+    (24, '1818'),
+    (1000, '1903e8'),
+    (1000000, '1a000f4240'),
+    (1000000000000, '1b000000e8d4a51000'),
+    (-1, '20'),
+    (-1000, '3903e7'),
+    (100000.0, 'fa47c35000'),
+    (1.1, 'fb3ff199999999999a'),
+    (float('inf'), 'fa7f800000'),
+    (False, 'f4'),
+    (True, 'f5'),
+    (None, 'f6'),
+    (b'\x01\x02\x03\x04', '4401020304'),
+    ('IETF', '6449455446'),
+    ('ü', '62c3bc'),
+    ([1, [2, 3], [4, 5]], '8301820203820405'),
+    ({'a': 1, 'b': [2, 3]}, 'a26161016162820203'),
+    ({1: 2, 3: 4}, 'a201020304'),
+])
+def test_cbor(value, expected):
+    assert to_cbor(value).hex() == expected
+
+
+# Examples derived from the MessagePack specification.
+@pytest.mark.parametrize('value, expected', [
+    (0, '00'),
+    (127, '7f'),
+    (128, 'cc80'),
+    (65535, 'cdffff'),
+    (65536, 'ce00010000'),
+    (2 ** 32, 'cf0000000100000000'),
+    (-1, 'ff'),
+    (-32, 'e0'),
+    (-33, 'd0df'),
+    (-129, 'd1ff7f'),
+    (-2 ** 31, 'd280000000'),
+    (1.5, 'ca3fc00000'),
+    (1.1, 'cb3ff199999999999a'),
+    (False, 'c2'),
+    (True, 'c3'),
+    (None, 'c0'),
+    ('IETF', 'a449455446'),
+    ('a' * 32, 'd920' + '61' * 32),
+    (b'\x01\x02', 'c4020102'),
+    ([1, [2, 3]], '9201920203'),
+    ({'a': 1, 'b': [2, 3]}, '82a16101a162920203'),
+    ({1: 2, 3: 4}, '8201020304'),
+])
+def test_msgpack(value, expected):
+    assert to_msgpack(value).hex() == expected
+
+
+def test_float32():
+    assert to_cbor(22.56).hex() == 'fb40368f5c28f5c28f'
+    assert to_cbor(22.56, float32=True).hex() == 'fa41b47ae1'
+    assert to_msgpack(22.56, float32=True).hex() == 'ca41b47ae1'
+
+
+@pytest.mark.parametrize('float32', [False, True])
+def test_float32_overflow(float32):
+    # Values out of single precision range are encoded using double precision.
+    assert to_cbor({'a': 1e300}, float32=float32).hex() == 'a16161fb7e37e43c8800759c'
+    assert to_msgpack({'a': 1e300}, float32=float32).hex() == '81a161cb7e37e43c8800759c'
+
+
+@pytest.mark.parametrize('format, content_type', [
+    ('cbor', 'application/cbor'),
+    ('msgpack', 'application/msgpack'),
+])
+def test_telemetry_binary_formats(format, content_type):
+    from terkin.telemetry.core import TelemetryClient, TelemetryTransportHTTP
+
+    data = {
+        'temperature.0x77.i2c:0': 15.1,
+        'humidity.0x77.i2c:0': 74.75,
+        'weight.0': 42.381,
+        'system.memfree': 102400,
+    }
+
+    client = TelemetryClient(interface=None, uri='http://localhost/data', format=format)
+    dataframe = DataFrame()
+    dataframe.data_out = data
+    client.serialize(dataframe)
+    assert isinstance(dataframe.payload_out, bytes)
+    assert len(dataframe.payload_out) < len(json.dumps(data))
+
+    assert TelemetryTransportHTTP('http://localhost/data', format).content_type == content_type
+
+    payload = client.serialize_batch([(1551478192, {'weight': 42})])
+    assert payload == (to_cbor if format == 'cbor' else to_msgpack)([{'weight': 42, 'time': 1551478192}])
+
+
+def test_telemetry_mqttkit_binary_topic():
+    from terkin.telemetry.core import TelemetryClient, MqttKitTopology
+    client = TelemetryClient(
+        interface=None, uri='mqtt://localhost/workbench/testdrive/area-42/node-1',
+        format='msgpack', uri_suffixes=MqttKitTopology.uri_suffixes)
+    suffix = client.uri_suffixes[client.transport].format(**client.__dict__)
+    assert suffix == '/data.msgpack'
+
+
+@pytest.mark.parametrize('format, encoder', [
+    ('cbor', to_cbor),
+    ('msgpack', to_msgpack),
+])
+def test_telemetry_binary_field_ids(format, encoder):
+    from terkin.sensor.schema import FieldSchema
+    from terkin.telemetry.core import TelemetryClient
+
+    schema = FieldSchema()
+    schema.add('temperature.0x77.i2c:0')
+    schema.add('weight.0')
+
+    client = TelemetryClient(
+        interface=None, uri='http://localhost/data', format=format,
+        settings={'field_ids': True}, schema=schema)
+    dataframe = DataFrame()
+    dataframe.data_out = {'weight.0': 42.381, 'temperature.0x77.i2c:0': 15.1}
+    client.serialize(dataframe)
+    assert dataframe.payload_out == encoder({1: 42.381, 0: 15.1})
+
+    payload = client.serialize_batch([(1551478192, {'weight.0': 42})])
+    assert payload == encoder([{1: 42, 2: 1551478192}])
+    assert schema.get_name(2) == 'time'
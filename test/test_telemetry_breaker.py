@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import pytest
+
+from terkin.model import DataFrame
+from test.util.terkin import invoke_umal
+
+
+class FakeState:
+
+    def __init__(self):
+        self.data = {}
+
+    def scope(self, name):
+        return self.data.setdefault(name, {})
+
+
+class FakeDevice:
+
+    class watchdog:
+        @staticmethod
+        def feed():
+            pass
+
+    networking = None
+
+    def __init__(self, settings, state):
+        self.settings = settings
+        self.state = state
+
+
+@pytest.fixture(autouse=True)
+def bootloader():
+    # ``backoff_time`` needs the platform information.
+    return invoke_umal()
+
+
+def make_adapter(state, settings=None):
+    from terkin.telemetry.core import TelemetryAdapter
+    adapter = TelemetryAdapter(device=FakeDevice(settings or {}, state), target={'endpoint': 'http://localhost/data'})
+    adapter.setup()
+    return adapter
+
+
+def make_dataframe(value):
+    dataframe = DataFrame()
+    dataframe.data_in['value'] = value
+    return dataframe
+
+
+def test_telemetry_breaker(mocker):
+    from terkin.telemetry.breaker import CircuitBreaker
+
+    state = FakeState()
+    adapter = make_adapter(state, settings={'telemetry.breaker': {'enabled': True, 'failures': 2, 'backoff_min': 60}})
+    transmit = mocker.patch.object(adapter.client, 'transmit', side_effect=OSError('Connection refused'))
+
+    # The breaker opens after consecutive failures.
+    # Within the testsuite, ``log.exc`` re-raises the original exception.
+    with pytest.raises(OSError):
+        adapter.transmit(make_dataframe(1))
+    assert adapter.breaker.status == CircuitBreaker.CLOSED
+    assert adapter.transmit(make_dataframe(2)) is False
+    assert adapter.breaker.status == CircuitBreaker.OPEN
+    assert 59 <= adapter.breaker.remaining <= 61
+
+    # While open, the target will not be contacted.
+    assert adapter.transmit(make_dataframe(3)) is False
+    assert transmit.call_count == 2
+
+    # The state survives deep sleep.
+    adapter = make_adapter(state, settings={'telemetry.breaker': {'enabled': True, 'failures': 2, 'backoff_min': 60}})
+    assert adapter.breaker.status == CircuitBreaker.OPEN
+    assert adapter.is_online() is False
+
+    # After the backoff time, a single attempt is made. On failure, the breaker reopens.
+    transmit = mocker.patch.object(adapter.client, 'transmit', side_effect=OSError('Connection refused'))
+    adapter.breaker.state['u'] = 0
+    assert adapter.breaker.status == CircuitBreaker.HALF_OPEN
+    assert adapter.transmit(make_dataframe(4)) is False
+    assert transmit.call_count == 1
+    assert adapter.breaker.status == CircuitBreaker.OPEN
+    assert adapter.breaker.state['n'] == 2
+
+    # Outcomes other than success do not close the breaker.
+    transmit = mocker.patch.object(adapter.client, 'transmit', return_value=False)
+    adapter.breaker.state['u'] = 0
+    failures = adapter.failure_count
+    assert adapter.transmit(make_dataframe(5)) is False
+    assert adapter.failure_count == failures
+
+    # On success, the breaker closes.
+    transmit = mocker.patch.object(adapter.client, 'transmit', return_value=True)
+    adapter.breaker.state['u'] = 0
+    assert adapter.transmit(make_dataframe(6)) is True
+    assert adapter.breaker.status == CircuitBreaker.CLOSED
+    assert adapter.failure_count == 0
+    assert state.scope('telemetry_breaker')[adapter.channel_uri] == {'f': 0, 'n': 0, 'u': 0}
+
+
+def test_telemetry_breaker_journal(mocker, tmp_path):
+
+    class FakeSettings(dict):
+        CONFIG_PATH = str(tmp_path)
+
+    adapter = make_adapter(FakeState(), settings=FakeSettings({
+        'telemetry.journal': {'enabled': True},
+        'telemetry.breaker': {'enabled': True, 'failures': 1},
+    }))
+    transmit = mocker.patch.object(adapter.client, 'transmit', side_effect=OSError('Connection refused'))
+
+    # While the breaker is open, readings go to the journal.
+    for value in range(3):
+        assert adapter.transmit(make_dataframe(value)) is False
+    assert transmit.call_count == 1
+    assert adapter.journal.pending == 3
+
+
+@pytest.mark.parametrize('settings', [{}, {'telemetry.breaker': {'enabled': False}}])
+def test_telemetry_breaker_disabled(mocker, settings):
+    adapter = make_adapter(FakeState(), settings=settings)
+    transmit = mocker.patch.object(adapter.client, 'transmit', side_effect=OSError('Connection refused'))
+    for value in range(5):
+        with pytest.raises(OSError):
+            adapter.transmit(make_dataframe(value))
+    assert transmit.call_count == 5
+    assert adapter.breaker is None
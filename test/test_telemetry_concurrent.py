@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import time
+
+from terkin.model import DataFrame
+
+
+class FakeAdapter:
+
+    def __init__(self, channel_uri, delay=0.0, outcome=True, timeout=None):
+        self.channel_uri = channel_uri
+        self.delay = delay
+        self.outcome = outcome
+        self.target = {}
+        if timeout is not None:
+            self.target['timeout'] = timeout
+        self.received = None
+
+    def transmit(self, dataframe):
+        # Adapters amend the data frame, so each one needs its own copy.
+        dataframe.data_in['channel'] = self.channel_uri
+        self.received = dict(dataframe.data_in)
+        time.sleep(self.delay)
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+def test_telemetry_concurrent():
+    from terkin.telemetry.core import TelemetryManager
+
+    manager = TelemetryManager(concurrent={'enabled': True, 'timeout': 5.0})
+    adapters = [
+        FakeAdapter('mqtt://broker/topic', delay=0.3),
+        FakeAdapter('http://server/api', delay=0.3),
+        FakeAdapter('http://other/api', outcome=OSError('Connection refused')),
+    ]
+    for adapter in adapters:
+        manager.add_adapter(adapter)
+
+    dataframe = DataFrame()
+    dataframe.data_in['temperature'] = 21.5
+
+    start = time.time()
+    outcomes = manager.transmit(dataframe)
+    duration = time.time() - start
+
+    # Total time is the one of the slowest target.
+    assert duration < 0.55
+    assert outcomes == {
+        'mqtt://broker/topic': True,
+        'http://server/api': True,
+        'http://other/api': False,
+    }
+    assert adapters[0].received == {'temperature': 21.5, 'channel': 'mqtt://broker/topic'}
+    assert dataframe.data_in == {'temperature': 21.5}
+
+
+def test_telemetry_concurrent_deadline():
+    from terkin.telemetry.core import TelemetryManager
+
+    manager = TelemetryManager(concurrent={'enabled': True, 'timeout': 5.0})
+    manager.add_adapter(FakeAdapter('mqtt://broker/topic', delay=2.0, timeout=0.2))
+    manager.add_adapter(FakeAdapter('http://server/api'))
+
+    start = time.time()
+    outcomes = manager.transmit(DataFrame())
+    assert time.time() - start < 1.0
+    assert outcomes == {'mqtt://broker/topic': False, 'http://server/api': True}
+
+
+def test_telemetry_concurrent_inflight():
+    from terkin.telemetry.core import TelemetryManager
+
+    manager = TelemetryManager(concurrent={'enabled': True, 'timeout': 5.0})
+    slow = FakeAdapter('mqtt://broker/topic', delay=0.6, timeout=0.1)
+    manager.add_adapter(slow)
+    manager.add_adapter(FakeAdapter('http://server/api'))
+
+    dataframe = DataFrame()
+    dataframe.data_in['temperature'] = 21.5
+    assert manager.transmit(dataframe) == {'mqtt://broker/topic': False, 'http://server/api': True}
+
+    # Adapters still busy from the previous cycle will be skipped.
+    dataframe.data_in['temperature'] = 22.5
+    assert manager.transmit(dataframe) == {'mqtt://broker/topic': False, 'http://server/api': True}
+    assert slow.received['temperature'] == 21.5
+
+    # Wait for outstanding transmissions, e.g. before going to deep sleep.
+    assert manager.wait(timeout=2.0) is True
+    assert manager.inflight == []
+    assert manager.transmit(dataframe) == {'mqtt://broker/topic': False, 'http://server/api': True}
+    assert slow.received['temperature'] == 22.5
+    assert manager.wait(timeout=0.1) is False
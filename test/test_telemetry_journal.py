@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import os
+
+from terkin.model import DataFrame
+from terkin.telemetry.journal import TelemetryJournal
+
+
+def test_journal_append_read_commit(tmp_path):
+
+    journal = TelemetryJournal(str(tmp_path))
+    assert journal.read() == []
+
+    journal.append({'temperature': 21.5}, timestamp=1000)
+    journal.append({'temperature': 21.7}, timestamp=1060)
+    journal.append({'temperature': 21.9}, timestamp=1120)
+    assert journal.pending == 3
+
+    assert journal.read(limit=2) == [(1, 1000, {'temperature': 21.5}), (2, 1060, {'temperature': 21.7})]
+    journal.commit(2)
+    assert journal.read() == [(3, 1120, {'temperature': 21.9})]
+
+    # Sequence numbers and the cursor survive a reboot.
+    journal = TelemetryJournal(str(tmp_path))
+    assert journal.cursor == 2
+    assert journal.pending == 1
+    journal.append({'temperature': 22.1}, timestamp=1180)
+    assert [record[0] for record in journal.read()] == [3, 4]
+
+
+def test_journal_rotation_retention(tmp_path):
+
+    journal = TelemetryJournal(str(tmp_path), segment_size=128, retention=3)
+    for index in range(20):
+        journal.append({'index': index}, timestamp=index)
+
+    # Segments are bounded in size and number, the oldest readings got dropped.
+    segments = sorted(name for name in os.listdir(str(tmp_path)) if name.startswith('segment-'))
+    assert len(segments) == 3
+    for name in segments:
+        assert (tmp_path / name).stat().st_size <= 128
+    records = journal.read(limit=100)
+    assert records[-1][2] == {'index': 19}
+    assert records[0][0] == journal.cursor + 1 > 1
+    assert journal.pending == len(records)
+
+    # Segments transmitted completely will be removed.
+    journal.commit(records[-2][0])
+    segments = [name for name in os.listdir(str(tmp_path)) if name.startswith('segment-')]
+    assert len(segments) == 1
+    assert journal.read() == [records[-1]]
+
+
+def test_journal_broken_tail(tmp_path):
+
+    journal = TelemetryJournal(str(tmp_path))
+    journal.append({'temperature': 21.5}, timestamp=1000)
+    journal.append({'temperature': 21.7}, timestamp=1060)
+
+    # Simulate power loss while writing the second record.
+    filename = journal.segment_filename(journal.segments[-1])
+    with open(filename, 'rb') as f:
+        data = f.read()
+    with open(filename, 'wb') as f:
+        f.write(data[:-4])
+
+    journal = TelemetryJournal(str(tmp_path))
+    assert journal.read() == [(1, 1000, {'temperature': 21.5})]
+
+    # Writing continues within a new segment.
+    journal.append({'temperature': 21.9}, timestamp=1120)
+    assert len(journal.segments) == 2
+    assert journal.read() == [(1, 1000, {'temperature': 21.5}), (2, 1120, {'temperature': 21.9})]
+
+
+class FakeSettings(dict):
+    CONFIG_PATH = None
+
+
+class FakeDevice:
+
+    class watchdog:
+        @staticmethod
+        def feed():
+            pass
+
+    networking = None
+
+    def __init__(self, settings):
+        self.settings = settings
+
+
+def test_adapter_store_and_forward(tmp_path, mocker):
+    from terkin.telemetry.core import TelemetryAdapter
+
+    settings = FakeSettings({'telemetry.journal': {'enabled': True, 'batch_size': 2}})
+    settings.CONFIG_PATH = str(tmp_path)
+    adapter = TelemetryAdapter(device=FakeDevice(settings), target={'endpoint': 'http://localhost/data'})
+    adapter.setup()
+    assert adapter.journal is not None
+
+    sent = []
+
+    def send(dataframe):
+        if not online:
+            return False
+        sent.append(dict(dataframe.data_out))
+        return True
+
+    mocker.patch.object(adapter.client, 'transmit', side_effect=send)
+
+    # Readings are kept while the target is unreachable.
+    online = False
+    for value in [1, 2, 3]:
+        dataframe = DataFrame()
+        dataframe.data_in['value'] = value
+        assert adapter.transmit(dataframe) is False
+    assert adapter.journal.pending == 3
+
+    # Pending readings are forwarded in batches once it is reachable again.
+    online = True
+    dataframe = DataFrame()
+    dataframe.data_in['value'] = 4
+    assert adapter.transmit(dataframe) is True
+    assert [item['value'] for item in sent] == [4, 1, 2]
+    assert 'time' in sent[1]
+    assert adapter.journal.pending == 1
+
+    dataframe = DataFrame()
+    dataframe.data_in['value'] = 5
+    assert adapter.transmit(dataframe) is True
+    assert [item['value'] for item in sent] == [4, 1, 2, 5, 3]
+    assert adapter.journal.pending == 0
+
+    # Forward readings without their time.
+    adapter.journal_settings['timestamp_field'] = None
+    online = False
+    dataframe = DataFrame()
+    dataframe.data_in['value'] = 6
+    assert adapter.transmit(dataframe) is False
+    online = True
+    dataframe = DataFrame()
+    dataframe.data_in['value'] = 7
+    assert adapter.transmit(dataframe) is True
+    assert sent[-1] == {'value': 6}
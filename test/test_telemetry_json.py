@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import json
+
+import pytest
+
+from terkin.telemetry.formatter import CompiledJSONEncoder
+
+
+@pytest.mark.parametrize('data', [
+    {},
+    {'temperature.0x77.i2c:0': 15.1, 'system.memfree': 102400, 'weight.0': 42.381},
+    {'ok': True, 'failed': False, 'missing': None, 'negative': -3, 'large': 10 ** 20, 'tiny': 1e-07},
+    {'nan': float('nan'), 'inf': float('inf'), 'ninf': float('-inf')},
+    {'quote"key': 'value "quoted"', 'umlaut.ä': 'Grüße\n\t\\', 'control': '\x01'},
+    {'list': [1, 2.5, 'three'], 'nested': {'a': 1}},
+])
+def test_compiled_json_identical(data):
+    encoder = CompiledJSONEncoder()
+    assert encoder.encode(data) == json.dumps(data)
+
+    # Also when reusing the template.
+    assert encoder.encode(data) == json.dumps(data)
+
+
+def test_compiled_json_schema_change():
+    encoder = CompiledJSONEncoder()
+
+    assert encoder.encode({'a': 1, 'b': 2.5}) == '{"a": 1, "b": 2.5}'
+    parts = encoder.parts
+    assert encoder.encode({'a': 3, 'b': 4.5}) == '{"a": 3, "b": 4.5}'
+    assert encoder.parts is parts
+
+    # The template is rebuilt when the keys or their order change.
+    assert encoder.encode({'b': 2.5, 'a': 1}) == '{"b": 2.5, "a": 1}'
+    assert encoder.encode({'a': 1, 'b': 2, 'c': 3}) == '{"a": 1, "b": 2, "c": 3}'
+    assert encoder.parts is not parts
+
+    # Dictionaries with non-string keys are passed to ``json.dumps``.
+    assert encoder.encode({1: 'one', 'two': 2}) == json.dumps({1: 'one', 'two': 2})
+
+
+def test_serialize_batch_json():
+    from terkin.telemetry.core import TelemetryClient
+    client = TelemetryClient(interface=None, uri='http://localhost/data', format='json')
+    rows = [(1551478192, {'temperature': 21.5}), (1551478252, {'temperature': 21.75, 'weight': 42})]
+    assert client.serialize_batch(rows) == json.dumps([
+        {'temperature': 21.5, 'time': 1551478192},
+        {'temperature': 21.75, 'weight': 42, 'time': 1551478252},
+    ])
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+import sqlite3
+import time
+
+from terkin_cpython.journal import SQLiteTelemetryJournal
+
+
+def test_sqlite_journal(tmp_path):
+
+    filename = str(tmp_path / 'journal.sqlite')
+    journal = SQLiteTelemetryJournal(filename, target='mqtt')
+    other = SQLiteTelemetryJournal(filename, target='http')
+    now = int(time.time())
+
+    # Bulk insert.
+    journal.append_many([(now, {'temperature': 21.5}), (now + 60, {'temperature': 21.7}), (now + 120, {'temperature': 21.9})])
+    other.append({'weight': 42.0}, timestamp=now)
+    assert journal.pending == 3
+    assert other.pending == 1
+
+    mode = journal.connection.execute('PRAGMA journal_mode').fetchone()[0]
+    assert mode == 'wal'
+
+    # Replay and acknowledge in bulk.
+    records = journal.read(limit=2)
+    assert [(timestamp, data) for sequence, timestamp, data in records] == [
+        (now, {'temperature': 21.5}), (now + 60, {'temperature': 21.7})]
+    journal.commit(records[-1][0])
+    assert journal.pending == 1
+    assert [data for sequence, timestamp, data in journal.read()] == [{'temperature': 21.9}]
+    assert other.pending == 1
+
+    # Read by time range.
+    assert [timestamp for sequence, timestamp, data in journal.read_range(start=now + 60, end=now + 180)] == [now + 60, now + 120]
+
+    # State survives restarts.
+    SQLiteTelemetryJournal.connections.clear()
+    journal = SQLiteTelemetryJournal(filename, target='mqtt')
+    assert journal.pending == 1
+
+
+def test_sqlite_journal_retention(tmp_path):
+
+    journal = SQLiteTelemetryJournal(
+        str(tmp_path / 'journal.sqlite'), target='mqtt', keep_acknowledged=3600, max_age=86400)
+    journal.last_vacuum = time.time()
+    now = int(time.time())
+    journal.append_many([
+        (now - 100000, {'index': 1}),
+        (now - 7200, {'index': 2}),
+        (now - 7200, {'index': 3}),
+        (now, {'index': 4}),
+    ])
+    records = journal.read(limit=10)
+    journal.commit(records[1][0])
+
+    # Old transmitted readings and expired pending readings are removed.
+    assert journal.vacuum() == 2
+    assert [data['index'] for sequence, timestamp, data in journal.read_range()] == [3, 4]
+    assert journal.pending == 2
+
+
+def test_sqlite_journal_incremental_vacuum(tmp_path):
+
+    # Databases created without incremental vacuum are converted.
+    filename = str(tmp_path / 'journal.sqlite')
+    connection = sqlite3.connect(filename)
+    connection.execute('CREATE TABLE unrelated (id INTEGER)')
+    connection.close()
+
+    journal = SQLiteTelemetryJournal(filename, target='mqtt', keep_acknowledged=0)
+    assert journal.execute('PRAGMA auto_vacuum') == [(2,)]
+
+    # Disk space of deleted readings is reclaimed.
+    now = int(time.time())
+    journal.append_many([(now - 60, {'payload': 'x' * 1000}) for _ in range(100)])
+    journal.execute('UPDATE readings SET acknowledged = 1')
+    assert journal.vacuum() == 100
+    assert journal.execute('PRAGMA freelist_count') == [(0,)]
+
+
+def test_adapter_sqlite_backend(tmp_path):
+    from terkin.telemetry.core import TelemetryAdapter
+
+    class FakeSettings(dict):
+        CONFIG_PATH = str(tmp_path)
+
+    class FakeDevice:
+        settings = FakeSettings({'telemetry.journal': {'enabled': True, 'backend': 'sqlite'}})
+        networking = None
+
+    adapter = TelemetryAdapter(device=FakeDevice(), target={'endpoint': 'http://localhost/data', 'name': 'backend'})
+    adapter.setup()
+    assert isinstance(adapter.journal, SQLiteTelemetryJournal)
+    assert adapter.journal.target == 'backend'
+    assert (tmp_path / 'journal' / 'journal.sqlite').exists()
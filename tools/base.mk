@@ -123,6 +123,19 @@ test-verbose:
 	@export PYTEST_ADDOPTS=$(PYTEST_OPTIONS) && \
 	    $(pytest) --log-cli-level=DEBUG test -m "$(marker)"
 
+## Run benchmarks and compare them against the baseline
+benchmark:
+	$(pytest) test -m benchmark --no-cov
+
+## Run benchmarks and save results as new baseline
+benchmark-baseline:
+	@export TERKIN_BENCHMARK_SAVE=1 && \
+	    $(pytest) test -m benchmark --no-cov
+
+## Run memory budget checks
+test-memory:
+	$(pytest) test -m memory --no-cov
+
 ## Run testsuite, with coverage report
 test-coverage:
 	$(coverage) run -m pytest -vv
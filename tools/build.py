@@ -97,7 +97,7 @@ class MicroPythonBuilder:
                  vendor=None, label=None,
                  micropython_path=None, toolchain_path=None, espidf_path=None,
                  architecture=None, manifest=None, sources=None, main_files=None, pycom_variant=None,
-                 verbose=False):
+                 strip_logging=None, verbose=False):
         self.vendor = vendor
         self.label = label
         self.micropython_path = micropython_path
@@ -108,6 +108,7 @@ class MicroPythonBuilder:
         self.sources = sources
         self.main_files = main_files
         self.pycom_variant = pycom_variant
+        self.strip_logging = strip_logging
         self.verbose = verbose
 
         self.pycom_frozen_path = f'{self.micropython_path}/esp32/frozen/Custom'
@@ -195,6 +196,12 @@ class MicroPythonBuilder:
         # MicroWebSrv2 is too large to be frozen into the firmware, so remove it.
         shell(f'rm -r {frozen_path}/MicroWebSrv2', check=False, silent=True)
 
+        # Optionally remove log calls of designated levels.
+        if self.strip_logging:
+            from tools.strip_logging import strip_tree
+            count = strip_tree(frozen_path, frozen_path, self.strip_logging)
+            click.secho(f'Removed {count} log calls of levels {yellow(str(self.strip_logging))} from frozen modules.')
+
     def build(self, board):
 
         click.secho(f'Building firmware for board {yellow(board)}')
@@ -244,11 +251,12 @@ def read_list(argument):
 @click.option('--sources', help='Paths to copy into frozen folder, comma separated (pycom)')
 @click.option('--main-files', help='boot.py and main.py to copy into frozen folder, comma separated (pycom)')
 @click.option('--pycom-variant', help='Pycom VARIANT (BASE, PYBYTES)')
+@click.option('--strip-logging', help='Log levels to remove from frozen modules, comma separated, e.g. debug,info (pycom)')
 @click.option('--release-path', help='Where to store release artefacts')
 @click.option('--verbose', is_flag=True, help='Increase verbosity')
 @click.version_option(version=__VERSION__)
 @click.help_option()
-def main(vendor, label, micropython, toolchain, espidf, architecture, board, manifest, sources, main_files, pycom_variant, release_path, verbose):
+def main(vendor, label, micropython, toolchain, espidf, architecture, board, manifest, sources, main_files, pycom_variant, strip_logging, release_path, verbose):
 
     notify('Starting build process')
 
@@ -266,7 +274,7 @@ def main(vendor, label, micropython, toolchain, espidf, architecture, board, man
         micropython_path=micropython, toolchain_path=toolchain, espidf_path=espidf,
         architecture=architecture,
         manifest=manifest, sources=sources, main_files=main_files, pycom_variant=pycom_variant,
-        verbose=verbose)
+        strip_logging=read_list(strip_logging), verbose=verbose)
 
     for board in boards:
 
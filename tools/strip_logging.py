@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# (c) 2026 The Terkin Datalogger developers
+# License: GNU General Public License, Version 3
+"""
+Remove log calls of designated levels from Python modules, before
+compiling them to ``.mpy`` files or freezing them into the firmware.
+
+Only statements like ``log.info(...)`` spanning whole lines will be
+removed. They are replaced by ``pass`` statements and blank lines,
+so line numbers within tracebacks stay the same.
+
+Synopsis::
+
+    # Write stripped copy of "src/lib" to "build/lib-stripped".
+    python -m tools.strip_logging --levels=debug,info --out=build/lib-stripped src/lib
+
+    # Strip modules in place.
+    python -m tools.strip_logging --levels=debug,info build/frozen
+"""
+import os
+import ast
+import sys
+import shutil
+import argparse
+
+# Names of logger objects to consider.
+LOGGER_NAMES = ['log', 'logger']
+
+
+def find_log_calls(tree, levels):
+    """
+    Find log statements of the designated levels.
+
+    :return: List of ``ast.Expr`` nodes.
+    """
+    statements = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+            continue
+        func = node.value.func
+        if isinstance(func, ast.Attribute) and func.attr in levels \
+                and isinstance(func.value, ast.Name) and func.value.id in LOGGER_NAMES:
+            statements.append(node)
+    return statements
+
+
+def strip_source(source, levels):
+    """
+    Remove log statements of the designated levels from Python source code.
+
+    :param source: Python source code.
+    :param levels: List of log levels, e.g. ``['debug', 'info']``.
+    :return: Tuple of stripped source code and number of removed statements.
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(True)
+
+    count = 0
+    for node in find_log_calls(tree, levels):
+        first = lines[node.lineno - 1]
+        last = lines[node.end_lineno - 1]
+
+        # Skip statements sharing their lines with other code.
+        # Column offsets are counted in bytes of the UTF-8 encoded source.
+        indent = first[:len(first) - len(first.lstrip())]
+        if len(indent.encode('utf-8')) != node.col_offset:
+            continue
+        rest = last.encode('utf-8')[node.end_col_offset:].decode('utf-8').strip()
+        if rest not in ('', ';') and not rest.startswith('#'):
+            continue
+
+        newline = '\n' if first.endswith('\n') else ''
+        lines[node.lineno - 1] = indent + 'pass' + newline
+        for index in range(node.lineno, node.end_lineno):
+            lines[index] = '\n'
+        count += 1
+
+    stripped = ''.join(lines)
+
+    # Make sure the outcome is still valid.
+    ast.parse(stripped)
+
+    return stripped, count
+
+
+def strip_file(source_file, target_file, levels):
+    with open(source_file, 'r', encoding='utf-8') as f:
+        source = f.read()
+    stripped, count = strip_source(source, levels)
+    with open(target_file, 'w', encoding='utf-8') as f:
+        f.write(stripped)
+    return count
+
+
+def strip_tree(source_path, target_path, levels):
+    """
+    Strip all Python modules below ``source_path``, writing them to ``target_path``.
+    Other files will be copied verbatim.
+    """
+    total = 0
+    for dirpath, dirnames, filenames in os.walk(source_path):
+        dirnames[:] = [dirname for dirname in dirnames if dirname != '__pycache__']
+        target_dir = os.path.join(target_path, os.path.relpath(dirpath, source_path))
+        os.makedirs(target_dir, exist_ok=True)
+        for filename in filenames:
+            source_file = os.path.join(dirpath, filename)
+            target_file = os.path.join(target_dir, filename)
+            if filename.endswith('.py'):
+                total += strip_file(source_file, target_file, levels)
+            elif source_file != target_file:
+                shutil.copy2(source_file, target_file)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Remove log calls from Python modules')
+    parser.add_argument('--levels', default='debug,info', help='Log levels to remove, comma separated')
+    parser.add_argument('--out', help='Output directory. Default: Strip modules in place')
+    parser.add_argument('path', help='Directory with Python modules')
+    args = parser.parse_args(argv)
+
+    levels = [level.strip() for level in args.levels.split(',') if level.strip()]
+    target_path = args.out or args.path
+    total = strip_tree(args.path, target_path, levels)
+    print('Removed {} log calls of levels {} from {}'.format(total, levels, target_path))
+
+
+if __name__ == '__main__':
+    sys.exit(main())